@@ -0,0 +1 @@
+"""Micro-benchmarks for pynamodb_relations hot paths."""
@@ -0,0 +1,85 @@
+"""
+Memory benchmark of ForeignKeyAttribute values held by model instances.
+
+Compares slotted ForwardManyToOneDescriptor holding only raw key with previous
+implementation which kept instance __dict__ and per-descriptor bound get method.
+Also shows memory retained by resolved related models for every `related_reference`.
+
+Run: python -m benchmarks.descriptor_memory
+"""
+import gc
+import tracemalloc
+
+from pynamodb_relations import attributes
+from pynamodb_relations.forward_related import ForeignKeyAttribute, ForwardManyToOneDescriptor
+from pynamodb_relations.models import Model
+
+from benchmarks.serialization import BenchmarkDatabase
+
+INSTANCES = 100000
+
+
+class Author(Model):
+    class Meta:
+        name = "Author"
+        database = BenchmarkDatabase
+
+    uuid = attributes.UnicodeAttribute(hash_key=True)
+
+    @classmethod
+    def get_by_uuid(cls, uuid):
+        return cls(uuid)
+
+
+class LegacyForwardManyToOneDescriptor:
+    _resolved = False
+    _model = None
+
+    def __init__(self, method, value, attribute, model=None):
+        self.method = method
+        self.value = value
+        self._attribute = attribute
+        if model:
+            self._model = model
+            self._resolved = True
+
+
+def measure(factory):
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory(n) for n in range(INSTANCES)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main():
+    attribute = ForeignKeyAttribute(Author)
+    values = [f"author-{n}" for n in range(INSTANCES)]
+
+    legacy = measure(
+        lambda n: LegacyForwardManyToOneDescriptor(
+            getattr(Author, attribute.related_model_get_method), values[n], attribute
+        )
+    )
+    slotted = measure(lambda n: ForwardManyToOneDescriptor(None, values[n], attribute))
+    print(f"{INSTANCES} unresolved descriptors")
+    print(f"legacy:  {legacy / INSTANCES:.1f} B/descriptor")
+    print(f"slotted: {slotted / INSTANCES:.1f} B/descriptor ({legacy / slotted:.2f}x less)")
+
+    print(f"{INSTANCES} resolved descriptors")
+    for related_reference in ("strong", "weak", "none"):
+        attribute = ForeignKeyAttribute(Author, related_reference=related_reference)
+
+        def resolved(n):
+            descriptor = ForwardManyToOneDescriptor(None, values[n], attribute)
+            descriptor.get()
+            return descriptor
+
+        size = measure(resolved)
+        print(f"{related_reference + ':':7} {size / INSTANCES:.1f} B/descriptor")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark of hydrating raw DynamoDB items into model instances.
+
+Compares BaseDatabase.from_raw_many using deserialization plan compiled by
+MetaModel with the generic pynamodb from_raw_data used previously.
+
+Run: python -m benchmarks.deserialization
+"""
+import timeit
+
+from pynamodb.models import Model as PynamoModel
+
+from benchmarks.serialization import ATTRIBUTE_COUNT, BenchmarkDatabase, WideModel
+
+NUMBER = 10
+ITEMS = 10000
+
+
+def legacy_from_raw(item):
+    model = BenchmarkDatabase.ITEM_TYPE_MAPPING[item["type"]["S"]]
+    return PynamoModel.from_raw_data.__func__(model, item)
+
+
+def main():
+    items = [
+        WideModel(
+            f"hash-{n}",
+            **{f"attribute_{i}": (str(i) if i % 2 else i) for i in range(ATTRIBUTE_COUNT)},
+        )._serialize(attr_map=True)["attributes"]
+        for n in range(ITEMS)
+    ]
+    assert [i.attribute_values for i in map(legacy_from_raw, items[:10])] == [
+        i.attribute_values for i in BenchmarkDatabase.from_raw_many(items[:10])
+    ]
+
+    legacy = min(
+        timeit.repeat(lambda: [legacy_from_raw(item) for item in items], number=NUMBER, repeat=3)
+    )
+    compiled = min(
+        timeit.repeat(lambda: BenchmarkDatabase.from_raw_many(items), number=NUMBER, repeat=3)
+    )
+    print(f"{len(WideModel.get_attributes())} attributes, {ITEMS} items x {NUMBER}")
+    print(f"legacy:   {legacy * 1e6 / NUMBER / ITEMS:.2f} us/item")
+    print(f"compiled: {compiled * 1e6 / NUMBER / ITEMS:.2f} us/item ({legacy / compiled:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark of reverse relation access on many parent instances.
+
+Compares managers built from RelationPlan resolved when models are created with
+previous implementation which resolved index hash key on every access and guessed
+range key condition with isinstance checks on every query.
+
+Run: python -m benchmarks.relation_access
+"""
+import timeit
+
+from pynamodb.indexes import AllProjection, GlobalSecondaryIndex
+
+from pynamodb_relations import attributes
+from pynamodb_relations.models import Model
+from pynamodb_relations.reverse_related import (
+    ForeignKeyRelationManager,
+    PrimaryKeyReverseForeignKeyRelation,
+)
+from pynamodb_relations.utils import _range_key_attribute
+
+from benchmarks.serialization import BenchmarkDatabase
+
+INSTANCES = 10000
+
+
+class ByAuthorIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "by_author"
+        projection = AllProjection()
+        read_capacity_units = 1
+        write_capacity_units = 1
+
+    author = attributes.UnicodeAttribute(hash_key=True)
+    created = attributes.PrefixedUnicodeAttribute("CREATED#", range_key=True)
+
+
+class Author(Model):
+    class Meta:
+        name = "RelationAuthor"
+        database = BenchmarkDatabase
+
+    pk = attributes.UnicodeAttribute(hash_key=True)
+    sk = attributes.StaticUnicodeAttribute("AUTHOR", range_key=True)
+    author = attributes.UnicodeAttribute()
+    by_author = ByAuthorIndex()
+
+    posts = PrimaryKeyReverseForeignKeyRelation("RelationPost", index="by_author")
+
+
+class Post(Model):
+    class Meta:
+        name = "RelationPost"
+        database = BenchmarkDatabase
+
+    pk = attributes.UnicodeAttribute(hash_key=True)
+    sk = attributes.PrefixedUnicodeAttribute("POST#", range_key=True)
+    author = attributes.UnicodeAttribute()
+    created = attributes.PrefixedUnicodeAttribute("CREATED#")
+    by_author = ByAuthorIndex()
+
+
+def legacy_range_key_condition(instance):
+    """
+    Previous `__get__` followed by range key guessing of `query`.
+    """
+    relation = type(instance).posts
+    instance._get_indexes()
+    dynamo_attr_name = instance._index_classes[relation.index]._hash_key_attribute().attr_name
+    python_attr_name = instance._dynamo_to_python_attr(dynamo_attr_name)
+    related_model = relation.get_related_model()
+    related_model._get_indexes()
+    related = related_model._index_classes[relation.index]
+    getattr(instance, python_attr_name)
+
+    range_key_attribute = _range_key_attribute(related)
+    if isinstance(range_key_attribute, attributes.PrefixedUnicodeAttribute):
+        return range_key_attribute.startswith("")
+    if isinstance(range_key_attribute, attributes.StaticUnicodeAttribute):
+        return range_key_attribute == range_key_attribute.static_value
+    raise ValueError
+
+
+def planned_range_key_condition(instance):
+    return instance.posts._get_range_key_condition("query")
+
+
+def main():
+    parents = [Author(f"author-{n}", author=f"author-{n}") for n in range(INSTANCES)]
+    assert isinstance(parents[0].posts, ForeignKeyRelationManager)
+    assert str(legacy_range_key_condition(parents[0])) == str(planned_range_key_condition(parents[0]))
+
+    def run(function):
+        # Fresh instances so managers cached on instances are not reused.
+        for parent in parents:
+            parent._relation_managers = None
+        for parent in parents:
+            function(parent)
+
+    legacy = min(timeit.repeat(lambda: run(legacy_range_key_condition), number=1, repeat=5))
+    planned = min(timeit.repeat(lambda: run(planned_range_key_condition), number=1, repeat=5))
+    print(f"{INSTANCES} parents, relation through index")
+    print(f"legacy:  {legacy * 1e6 / INSTANCES:.2f} us/access")
+    print(f"planned: {planned * 1e6 / INSTANCES:.2f} us/access ({legacy / planned:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
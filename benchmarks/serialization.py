@@ -0,0 +1,90 @@
+"""
+Benchmark of Model._serialize on model with many attributes.
+
+Compares precompiled serialization plan with previous implementation which
+iterated get_attributes() and did isinstance checks for every attribute.
+
+Run: python -m benchmarks.serialization
+"""
+import timeit
+
+from pynamodb.attributes import MapAttribute
+from pynamodb.connection.util import pythonic
+from pynamodb.constants import ATTR_TYPE_MAP, ATTRIBUTES, NULL
+from pynamodb.types import HASH, RANGE
+
+from pynamodb_relations import attributes
+from pynamodb_relations.attributes import ProxiedAttributeMixin
+from pynamodb_relations.database import BaseDatabase
+from pynamodb_relations.models import Model
+
+ATTRIBUTE_COUNT = 32
+NUMBER = 20000
+
+
+class BenchmarkDatabase(BaseDatabase):
+    table_name = "Benchmark"
+
+
+WideModel = type(
+    "WideModel",
+    (Model,),
+    {
+        "Meta": type("Meta", (), {"name": "WideModel", "database": BenchmarkDatabase}),
+        "pk": attributes.UnicodeAttribute(hash_key=True),
+        "sk": attributes.ProxiedPrefixedUnicodeAttribute("SK#", range_key=True, proxied_value="pk"),
+        **{
+            f"attribute_{i}": (
+                attributes.UnicodeAttribute(null=True)
+                if i % 2
+                else attributes.NumberAttribute(null=True)
+            )
+            for i in range(ATTRIBUTE_COUNT)
+        },
+    },
+)
+
+
+def legacy_serialize(self, attr_map=False, null_check=True):
+    attributes_name = pythonic(ATTRIBUTES)
+    attrs = {attributes_name: {}}
+    for name, attr in self.get_attributes().items():
+        value = getattr(self, name)
+        if isinstance(attr, ProxiedAttributeMixin):
+            value = attr.get_proxy_value(self, value)
+        if isinstance(value, MapAttribute):
+            if not value.validate():
+                raise ValueError("Attribute '{}' is not correctly typed".format(attr.attr_name))
+
+        serialized = self._serialize_value(attr, value, null_check)
+        if NULL in serialized:
+            continue
+
+        if attr_map:
+            attrs[attributes_name][attr.attr_name] = serialized
+        else:
+            if attr.is_hash_key:
+                attrs[HASH] = serialized[ATTR_TYPE_MAP[attr.attr_type]]
+            elif attr.is_range_key:
+                attrs[RANGE] = serialized[ATTR_TYPE_MAP[attr.attr_type]]
+            else:
+                attrs[attributes_name][attr.attr_name] = serialized
+    return attrs
+
+
+def main():
+    instance = WideModel(
+        "hash",
+        **{f"attribute_{i}": (str(i) if i % 2 else i) for i in range(ATTRIBUTE_COUNT)},
+    )
+    assert legacy_serialize(instance) == instance._serialize()
+
+    legacy = min(timeit.repeat(lambda: legacy_serialize(instance), number=NUMBER, repeat=5))
+    planned = min(timeit.repeat(lambda: instance._serialize(), number=NUMBER, repeat=5))
+    print(f"{len(WideModel.get_attributes())} attributes, {NUMBER} serializations")
+    print(f"legacy:  {legacy * 1e6 / NUMBER:.2f} us/item")
+    print(f"planned: {planned * 1e6 / NUMBER:.2f} us/item ({legacy / planned:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark of PynamoModelSerializer instantiation.
+
+Compares building serializer fields by copying templates cached per serializer class with
+computing and instantiating them again for every instance as done previously.
+
+Run: python -m benchmarks.serializer_fields
+"""
+import copy
+import timeit
+from collections import OrderedDict
+
+import django
+from django.conf import settings
+
+settings.configure(SECRET_KEY="benchmark")
+django.setup()
+
+from pynamodb_relations.contrib.rest_framework import model_meta, serializers  # noqa: E402
+
+from benchmarks.serialization import WideModel  # noqa: E402
+
+NUMBER = 2000
+
+
+class WideModelSerializer(serializers.PynamoModelSerializer):
+    class Meta:
+        model = WideModel
+        fields = "__all__"
+
+
+class UncachedWideModelSerializer(WideModelSerializer):
+    def get_fields(self):
+        info = model_meta.get_field_info(WideModel)
+        return OrderedDict(
+            (field_name, field_class(**field_kwargs) if field_class is not None else copy.deepcopy(field_kwargs))
+            for field_name, field_class, field_kwargs in self.get_field_specs(info, WideModel, 0)
+        )
+
+
+def build_fields():
+    return WideModelSerializer().fields
+
+
+def build_fields_uncached():
+    return UncachedWideModelSerializer().fields
+
+
+def main():
+    assert list(build_fields()) == list(build_fields_uncached())
+
+    uncached = min(timeit.repeat(build_fields_uncached, number=NUMBER, repeat=3))
+    cached = min(timeit.repeat(build_fields, number=NUMBER, repeat=3))
+    print(f"{len(build_fields())} fields, {NUMBER} serializers")
+    print(f"uncached: {uncached * 1e6 / NUMBER:.1f} us/serializer")
+    print(f"cached:   {cached * 1e6 / NUMBER:.1f} us/serializer ({uncached / cached:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Fixtures shared by tests running against DynamoDB mocked by moto.
+"""
+import os
+
+import pytest
+
+
+def _skip_unless_compatible():
+    from pynamodb.connection import Connection
+
+    try:
+        Connection(region="us-east-1").list_tables()
+    except TypeError as e:
+        # pynamodb 4.3.2 calls private API of botocore which changed in botocore 1.28.
+        pytest.skip(f"Installed botocore is not compatible with pynamodb: {e}")
+
+
+@pytest.fixture
+def dynamodb():
+    """
+    Mocks DynamoDB for the test.
+
+    The test is skipped when moto is not installed or pynamodb can not talk to installed botocore.
+    """
+    moto = pytest.importorskip("moto")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    mock = getattr(moto, "mock_aws", None) or moto.mock_dynamodb
+
+    with mock():
+        _skip_unless_compatible()
+        yield
+
+
+@pytest.fixture
+def create_table(dynamodb):
+    """
+    Returns function creating table of given database in mocked DynamoDB.
+    """
+    databases = []
+
+    def create(database):
+        database._connection = None
+        databases.append(database)
+        database.create_table(wait=True)
+        return database
+
+    yield create
+
+    for database in databases:
+        database._connection = None
@@ -0,0 +1,68 @@
+"""
+Asyncio support for blocking DynamoDB calls.
+
+Calls are executed in the event loop's default executor so independent fetches
+can be awaited concurrently (e.g. with `asyncio.gather`). Context variables
+such as active `BaseDatabase.session()` are propagated to the executor.
+"""
+import asyncio
+import contextvars
+import functools
+from typing import Any, Callable, List, Optional
+
+from pynamodb.constants import ITEMS
+from pynamodb.pagination import PageIterator
+
+
+async def run_in_executor(func: Callable, *args, **kwargs) -> Any:
+    """
+    Runs blocking func in executor with copy of current context.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        None, functools.partial(context.run, func, *args, **kwargs)
+    )
+
+
+class AsyncPageIterator:
+    """
+    Async iterator over pages of Query or Scan results.
+
+    Each iteration issues at most one request to DynamoDB and returns list of
+    deserialized items of that page.
+    """
+
+    page_iter: PageIterator
+    map_fn: Optional[Callable]
+    limit: Optional[int]
+
+    def __init__(
+        self, page_iter: PageIterator, map_fn: Optional[Callable] = None, limit: Optional[int] = None
+    ):
+        self.page_iter = page_iter
+        self.map_fn = map_fn
+        self.limit = limit
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> List[Any]:
+        if self.limit == 0:
+            raise StopAsyncIteration
+
+        page = await run_in_executor(next, self.page_iter, None)
+        if page is None:
+            raise StopAsyncIteration
+
+        items = page.get(ITEMS, [])
+        if self.limit is not None:
+            items = items[:self.limit]
+            self.limit -= len(items)
+        if self.map_fn:
+            items = [self.map_fn(item) for item in items]
+        return items
+
+    @property
+    def last_evaluated_key(self):
+        return self.page_iter.last_evaluated_key
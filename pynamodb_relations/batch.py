@@ -0,0 +1,178 @@
+import logging
+import random
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Tuple, Type, TYPE_CHECKING
+
+from pynamodb.connection.util import pythonic
+from pynamodb.constants import (
+    ATTRIBUTES,
+    BATCH_WRITE_PAGE_LIMIT,
+    DELETE_REQUEST,
+    ITEM,
+    KEY,
+    PUT_REQUEST,
+    UNPROCESSED_ITEMS,
+)
+from pynamodb.exceptions import PutError
+
+if TYPE_CHECKING:
+    from pynamodb_relations.database import BaseDatabase
+    from pynamodb_relations.models import Model
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class BatchWrite:
+    """
+    Batch writer accepting instances of any model registered to the database.
+
+    Operations are buffered and sent as BatchWriteItem requests of 25 items (DynamoDB limit).
+    Unprocessed items are re-submitted with exponential backoff.
+    Relation counters (see `PrimaryKeyReverseForeignKeyRelation`) are not maintained by batch writes,
+    use `ForeignKeyRelationManager.reconcile_counter` afterwards. Memoized relations of written
+    models are invalidated like by `Model.save` and `Model.delete`.
+
+    Attributes:
+        database: Database all written models belong to.
+        auto_commit: If False ValueError is raised instead of sending full buffer.
+        workers: If set requests are sent from thread pool of this size.
+        failed_operations: Unprocessed items left after max_retry_attempts.
+    """
+
+    database: Type["BaseDatabase"]
+    auto_commit: bool
+    workers: Optional[int]
+    max_operations: int = BATCH_WRITE_PAGE_LIMIT
+    pending_operations: List[dict]
+    failed_operations: List[dict]
+    # Written instances of pending operations and whether they exist after the write.
+    pending_models: List[Tuple["Model", bool]]
+
+    def __init__(
+        self,
+        database: Type["BaseDatabase"],
+        auto_commit: bool = True,
+        workers: Optional[int] = None,
+    ):
+        self.database = database
+        self.auto_commit = auto_commit
+        self.workers = workers
+        self.pending_operations = []
+        self.failed_operations = []
+        self.pending_models = []
+        self._executor = ThreadPoolExecutor(workers) if workers else None
+        self._futures: List[Future] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Commits all pending operations and waits for requests sent from thread pool.
+        """
+        try:
+            self.commit()
+            self.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+
+    def save(self, put_item: "Model"):
+        """
+        Adds put of `put_item` to pending operations.
+
+        :param put_item: Instance of a `Model` registered to the database
+        :raises ValueError: if put_item was loaded with attributes_to_get
+        """
+        self._check_model(put_item)
+        put_item._check_complete()
+        self._add_operation(
+            {PUT_REQUEST: {ITEM: put_item._serialize(attr_map=True)[pythonic(ATTRIBUTES)]}}
+        )
+        self.pending_models.append((put_item, True))
+
+    def delete(self, del_item: "Model"):
+        """
+        Adds delete of `del_item` to pending operations.
+
+        :param del_item: Instance of a `Model` registered to the database
+        """
+        self._check_model(del_item)
+        self._add_operation({DELETE_REQUEST: {KEY: del_item._get_keys()}})
+        self.pending_models.append((del_item, False))
+
+    def commit(self):
+        """
+        Writes all of the changes that are pending
+        """
+        operations, self.pending_operations = self.pending_operations, []
+        models, self.pending_models = self.pending_models, []
+        if not operations:
+            return
+
+        log.debug("%s committing batch operation", self.database)
+        if self._executor is not None:
+            self._futures.append(self._executor.submit(self._write, operations, models))
+        else:
+            self._write(operations, models)
+
+    def wait(self):
+        """
+        Waits for all requests sent from thread pool and raises first error if any.
+        """
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def _check_model(self, item: "Model"):
+        if getattr(item, "_database", None) is not self.database:
+            raise ValueError(
+                f"{item.__class__.__name__} is not registered to {self.database.__name__}."
+            )
+
+    def _add_operation(self, operation: dict):
+        if len(self.pending_operations) == self.max_operations:
+            if not self.auto_commit:
+                raise ValueError("DynamoDB allows a maximum of 25 batch operations")
+            self.commit()
+        self.pending_operations.append(operation)
+
+    def _write(self, operations: List[dict], models: List[Tuple["Model", bool]]):
+        written = False
+        try:
+            self._write_operations(operations)
+            written = True
+        finally:
+            # Memoized relations are invalidated also when only some items were written.
+            for model, persisted in models:
+                model._written(persisted=persisted if written else None)
+
+    def _write_operations(self, operations: List[dict]):
+        retries = 0
+        while operations:
+            put_items = [op[PUT_REQUEST][ITEM] for op in operations if PUT_REQUEST in op]
+            delete_items = [op[DELETE_REQUEST][KEY] for op in operations if DELETE_REQUEST in op]
+            data = self.database._get_connection().batch_write_item(
+                put_items=put_items, delete_items=delete_items
+            )
+            if data is None:
+                return
+
+            operations = data.get(UNPROCESSED_ITEMS, {}).get(self.database.table_name)
+            if operations:
+                retries += 1
+                if retries >= self.database._get_option("max_retry_attempts"):
+                    self.failed_operations.extend(operations)
+                    raise PutError("Failed to batch write items: max_retry_attempts exceeded")
+                sleep_time = (
+                    random.randint(0, self.database._get_option("base_backoff_ms") * (2 ** retries))
+                    / 1000
+                )
+                log.info(
+                    "Resending %d unprocessed items for batch operation after %d seconds sleep",
+                    len(operations),
+                    sleep_time,
+                )
+                time.sleep(sleep_time)
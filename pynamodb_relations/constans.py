@@ -5,3 +5,15 @@ ENTITY_NAME = "name"
 
 DEFAULT_TYPE_ATTRIBUTE_NAME = "type"
 DEFAULT_TYPE_ATTRIBUTE_PYTHON_NAME = "_type"
+
+# Maximum number of items in one TransactWriteItems/TransactGetItems request.
+TRANSACT_ITEMS_LIMIT = 100
+# Cancellation reason of transaction operation which condition was not met.
+CONDITIONAL_CHECK_FAILED = "ConditionalCheckFailed"
+# Error code of TransactWriteItems cancelled because of any of its operations.
+TRANSACTION_CANCELED = "TransactionCanceledException"
+
+# How ForeignKeyAttribute keeps resolved related model.
+RELATED_REFERENCE_STRONG = "strong"
+RELATED_REFERENCE_WEAK = "weak"
+RELATED_REFERENCE_NONE = "none"
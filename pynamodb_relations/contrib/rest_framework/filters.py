@@ -0,0 +1,232 @@
+import json
+from typing import Dict, List, Optional, Tuple
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.dateparse import parse_datetime
+from pynamodb.attributes import Attribute
+from pynamodb.constants import BOOLEAN, NUMBER
+from pynamodb.indexes import Index
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from pynamodb_relations import attributes
+from pynamodb_relations.forward_related import ForeignKeyAttribute
+from pynamodb_relations.reverse_related import ForeignKeyRelationManager
+from pynamodb_relations.utils import _get_model_indexes, _range_key_attribute
+
+KEY_LOOKUPS = {'exact', 'lt', 'lte', 'gt', 'gte', 'startswith', 'range'}
+FILTER_LOOKUPS = KEY_LOOKUPS | {'ne', 'contains', 'in', 'isnull'}
+
+
+class KeyConditionFilterBackend(BaseFilterBackend):
+    """
+    Filter backend pushing query params down to DynamoDB.
+
+    Fields are declared on the view as `filter_fields` - list of attribute names
+    (only exact lookup) or dict of attribute name -> list of lookups. Query param
+    is `<attribute>` for exact lookup or `<attribute>__<lookup>`.
+
+    * Lookups on range key of the queried model or index become range key condition,
+      only key condition lookups are allowed on it and hash key can not be filtered at all.
+    * Lookups on range key of an index sharing hash key with the model select that index.
+    * Everything else becomes filter condition.
+
+    Values of `in` and `range` lookups are comma separated. Values of foreign keys are
+    values of the related attribute, e.g. `a1` for `AUTHOR#a1` stored by prefixed hash key.
+
+    Example:
+        class PostList(ListPynamoDBAPIView):
+            filter_fields = {"sk": ["startswith"], "author": ["exact", "in"]}
+
+        GET /posts/?sk__startswith=2020&author__in=a1,a2
+    """
+    lookup_separator = '__'
+
+    def get_filter_fields(self, view) -> Dict[str, List[str]]:
+        filter_fields = getattr(view, 'filter_fields', None) or {}
+        if not isinstance(filter_fields, dict):
+            filter_fields = {name: ['exact'] for name in filter_fields}
+
+        for name, lookups in filter_fields.items():
+            unknown = set(lookups) - FILTER_LOOKUPS
+            if unknown:
+                raise ImproperlyConfigured(
+                    f"Unknown lookups {sorted(unknown)} of filter field '{name}' "
+                    f"on {view.__class__.__name__}."
+                )
+        return filter_fields
+
+    def filter_queryset(self, request, queryset, view):
+        filter_fields = self.get_filter_fields(view)
+        if not filter_fields or not isinstance(queryset, ForeignKeyRelationManager):
+            return queryset
+
+        model = queryset._get_model()
+        model_attributes = model.get_attributes()
+        unknown = set(filter_fields) - set(model_attributes)
+        if unknown:
+            raise ImproperlyConfigured(
+                f"Filter fields {sorted(unknown)} on {view.__class__.__name__} "
+                f"are not attributes of {model.__name__}."
+            )
+
+        lookups = {}
+        for param, value in request.query_params.items():
+            name, _, lookup = param.partition(self.lookup_separator)
+            lookup = lookup or 'exact'
+            if lookup not in filter_fields.get(name, ()):
+                continue
+            lookups.setdefault(name, {})[lookup] = self.to_python(
+                param, model_attributes[name], lookup, value
+            )
+
+        if not lookups:
+            return queryset
+
+        range_key_name, index_name = self.get_range_key(queryset, lookups)
+        range_key_condition = None
+        if range_key_name is not None:
+            range_key_condition = self.build_range_key_condition(
+                model_attributes[range_key_name], lookups.pop(range_key_name)
+            )
+
+        filter_condition = None
+        for name, attribute_lookups in lookups.items():
+            for lookup, value in attribute_lookups.items():
+                condition = self.build_condition(model_attributes[name], lookup, value)
+                filter_condition = condition if filter_condition is None else filter_condition & condition
+
+        return queryset.filter(range_key_condition, filter_condition, index_name=index_name)
+
+    def get_range_key(
+        self, queryset: ForeignKeyRelationManager, lookups
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Returns python name of range key attribute used in key condition and index to query or None.
+
+        Raises:
+            ValidationError - When keys of the queried model or index would end up in filter condition,
+                which DynamoDB does not allow.
+        """
+        model = queryset._get_model()
+        if isinstance(queryset.related, Index):
+            hash_key = queryset.related._hash_key_attribute()
+            range_key = _range_key_attribute(queryset.related)
+        else:
+            hash_key = model._hash_key_attribute()
+            range_key = model._range_key_attribute()
+
+        name = model._dynamo_to_python_attr(hash_key.attr_name)
+        if name in lookups:
+            raise ValidationError({name: 'Hash key can not be filtered.'})
+
+        if range_key is not None:
+            name = model._dynamo_to_python_attr(range_key.attr_name)
+            if name in lookups:
+                if not set(lookups[name]) <= KEY_LOOKUPS:
+                    raise ValidationError({
+                        name: f'Only {", ".join(sorted(KEY_LOOKUPS))} lookups are allowed on range key.'
+                    })
+                return name, None
+
+        for index in _get_model_indexes(model):
+            index_hash_key = index._hash_key_attribute()
+            index_range_key = _range_key_attribute(index)
+            if index_range_key is None or index_hash_key.attr_name != hash_key.attr_name:
+                continue
+            name = model._dynamo_to_python_attr(index_range_key.attr_name)
+            if name in lookups and set(lookups[name]) <= KEY_LOOKUPS:
+                return name, index.Meta.index_name
+
+        return None, None
+
+    def build_range_key_condition(self, attribute: Attribute, lookups):
+        if set(lookups) == {'gte', 'lte'}:
+            return attribute.between(lookups['gte'], lookups['lte'])
+        if len(lookups) > 1:
+            raise ValidationError({
+                attribute.attr_name: 'Only one condition (or gte with lte) is allowed on range key.'
+            })
+        (lookup, value), = lookups.items()
+        return self.build_condition(attribute, lookup, value)
+
+    def build_condition(self, attribute: Attribute, lookup: str, value):
+        if lookup == 'exact':
+            return attribute == value
+        if lookup == 'ne':
+            return attribute != value
+        if lookup == 'lt':
+            return attribute < value
+        if lookup == 'lte':
+            return attribute <= value
+        if lookup == 'gt':
+            return attribute > value
+        if lookup == 'gte':
+            return attribute >= value
+        if lookup == 'startswith':
+            return attribute.startswith(value)
+        if lookup == 'contains':
+            return attribute.contains(value)
+        if lookup == 'range':
+            return attribute.between(*value)
+        if lookup == 'in':
+            return attribute.is_in(*value)
+        if lookup == 'isnull':
+            return attribute.does_not_exist() if value else attribute.exists()
+        raise ValueError(f"Unknown lookup '{lookup}'.")
+
+    def to_python(self, param: str, attribute: Attribute, lookup: str, value: str):
+        """
+        Converts query param value into python value of attribute.
+        """
+        if lookup == 'isnull':
+            return self.parse_boolean(param, value)
+        if lookup in ('in', 'range'):
+            values = [self.parse_value(param, attribute, item) for item in value.split(',')]
+            if lookup == 'range' and len(values) != 2:
+                raise ValidationError({param: 'Range requires exactly two comma separated values.'})
+            return values
+        return self.parse_value(param, attribute, value)
+
+    def parse_value(self, param: str, attribute: Attribute, value: str):
+        if isinstance(attribute, ForeignKeyAttribute):
+            # Foreign key stores serialized value of related attribute, it is compared as is.
+            related_attribute = attribute.get_related_attribute()
+            return related_attribute.serialize(self.parse_value(param, related_attribute, value))
+        if attribute.attr_type == NUMBER:
+            try:
+                number = json.loads(value)
+            except ValueError:
+                number = None
+            if not isinstance(number, (int, float)) or isinstance(number, bool):
+                raise ValidationError({param: 'A valid number is required.'})
+            return number
+        if attribute.attr_type == BOOLEAN:
+            return self.parse_boolean(param, value)
+        if isinstance(attribute, attributes.UTCDateTimeAttribute):
+            parsed = parse_datetime(value)
+            if parsed is None:
+                raise ValidationError({param: 'A valid datetime is required.'})
+            return parsed
+        return value
+
+    def parse_boolean(self, param: str, value: str) -> bool:
+        if value.lower() in ('true', '1'):
+            return True
+        if value.lower() in ('false', '0'):
+            return False
+        raise ValidationError({param: 'Must be a valid boolean.'})
+
+    def get_schema_operation_parameters(self, view):
+        parameters = []
+        for name, lookups in self.get_filter_fields(view).items():
+            for lookup in lookups:
+                parameters.append({
+                    'name': name if lookup == 'exact' else f'{name}{self.lookup_separator}{lookup}',
+                    'required': False,
+                    'in': 'query',
+                    'schema': {
+                        'type': 'string',
+                    },
+                })
+        return parameters
@@ -1,12 +1,184 @@
-from rest_framework import generics as original_generics, mixins
+import json
+
+from django.http import Http404
+from django.utils.http import parse_etags
+from pynamodb.constants import NUMBER
+from rest_framework import generics as original_generics, mixins, status
+from rest_framework.response import Response
+
+from pynamodb_relations.contrib.rest_framework.filters import KeyConditionFilterBackend
+from pynamodb_relations.contrib.rest_framework.mixins import StreamingListModelMixin
+from pynamodb_relations.contrib.rest_framework.pagination import LastEvaluatedKeyPagination
+from pynamodb_relations.contrib.rest_framework.utils import get_object_or_404
+from pynamodb_relations.reverse_related import ForeignKeyRelationManager
+
+
+class NotModified(Exception):
+    """
+    Raised by `get_object` when object matches request's If-None-Match.
+    """
+
+    def __init__(self, etag):
+        super().__init__(etag)
+        self.etag = etag
 
 
 class GenericPynamoDBAPIView(original_generics.GenericAPIView):
-    pagination_class = None
-    filter_backends = []
+    pagination_class = LastEvaluatedKeyPagination
+    filter_backends = [KeyConditionFilterBackend]
+
+    # Model of the object, defaults to serializer's Meta.model.
+    model = None
+    # URL keyword arguments holding hash key and range key of the object.
+    # Range key may be omitted in URL for models with static range key.
+    lookup_fields = ('hash_key', 'range_key')
+    # If True If-None-Match is first checked by reading only keys and version
+    # of the object, full object is read only when it was modified.
+    etag_check_projection = False
+
+    _etag = None
+
+    def get_model(self):
+        if self.model is not None:
+            return self.model
+        return self.get_serializer_class().Meta.model
+
+    def get_object_keys(self):
+        """
+        Returns hash key and range key (or None) of the object from URL keyword arguments
+        converted to python values of key attributes, see `to_key_value`.
+        """
+        hash_key_kwarg, range_key_kwarg = self.lookup_fields
+        assert hash_key_kwarg in self.kwargs, (
+            'Expected view %s to be called with a URL keyword argument '
+            'named "%s". Fix your URL conf, or set the `.lookup_fields` '
+            'attribute on the view correctly.' %
+            (self.__class__.__name__, hash_key_kwarg)
+        )
+        model = self.get_model()
+        hash_key = self.to_key_value(model._hash_key_attribute(), self.kwargs[hash_key_kwarg])
+        range_key = self.kwargs.get(range_key_kwarg)
+        if range_key is not None:
+            range_key = self.to_key_value(model._range_key_attribute(), range_key)
+        return hash_key, range_key
+
+    def to_key_value(self, attribute, value):
+        """
+        Converts URL keyword argument into python value of key attribute.
+
+        Raises Http404 when the value is not valid for the attribute, e.g. "abc" for NumberAttribute.
+        """
+        if attribute is None:
+            raise Http404('No %s matches the given query.' % self.get_model().__name__)
+        if attribute.attr_type != NUMBER or not isinstance(value, str):
+            return value
+        try:
+            number = json.loads(value)
+        except ValueError:
+            number = None
+        if not isinstance(number, (int, float)) or isinstance(number, bool):
+            raise Http404('No %s matches the given query.' % self.get_model().__name__)
+        return number
 
     def get_object(self):
-        raise NotImplementedError("Please implement this yourself.")
+        """
+        Returns the object the view is displaying.
+
+        For GET and HEAD requests with If-None-Match matching ETag of the object
+        (see `get_etag`) NotModified is raised and 304 response is returned.
+        Only attributes of requested sparse fieldset are read for GET and HEAD.
+        """
+        model = self.get_model()
+        hash_key, range_key = self.get_object_keys()
+        etags = self.get_if_none_match()
+
+        if etags and self.etag_check_projection and model._version_attribute_name:
+            current = get_object_or_404(
+                model.get, hash_key, range_key,
+                attributes_to_get=model._get_projection([model._version_attribute_name]),
+            )
+            self.check_object_permissions(self.request, current)
+            self.check_not_modified(current, etags)
+
+        sparse_attributes = self.get_sparse_attributes()
+        if sparse_attributes is None:
+            obj = get_object_or_404(model.get, hash_key, range_key)
+        else:
+            if model._version_attribute_name:
+                sparse_attributes.append(model._version_attribute_name)
+            obj = get_object_or_404(
+                model.get, hash_key, range_key,
+                attributes_to_get=model._get_projection(sparse_attributes),
+            )
+
+        # May raise a permission denied
+        self.check_object_permissions(self.request, obj)
+        self.check_not_modified(obj, etags)
+
+        return obj
+
+    def get_sparse_attributes(self):
+        """
+        Returns model attributes needed for requested sparse fieldset (`?fields=`) or None.
+
+        Sparse fieldsets are used only for GET and HEAD so partial instances are never saved.
+        """
+        if self.request.method not in ('GET', 'HEAD'):
+            return None
+        serializer = self.get_serializer()
+        if not hasattr(serializer, 'get_sparse_attributes'):
+            return None
+        return serializer.get_sparse_attributes()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if isinstance(queryset, ForeignKeyRelationManager):
+            sparse_attributes = self.get_sparse_attributes()
+            if sparse_attributes is not None:
+                queryset = queryset.only(*sparse_attributes)
+        return queryset
+
+    def get_etag(self, obj):
+        """
+        Returns weak ETag of object derived from its VersionAttribute or None.
+        """
+        if not obj._version_attribute_name:
+            return None
+        version = getattr(obj, obj._version_attribute_name)
+        if version is None:
+            return None
+        return 'W/"%s"' % version
+
+    def get_if_none_match(self):
+        if self.request.method not in ('GET', 'HEAD'):
+            return []
+        return parse_etags(self.request.META.get('HTTP_IF_NONE_MATCH', ''))
+
+    def check_not_modified(self, obj, etags):
+        self._etag = self.get_etag(obj)
+        if self._etag is None or not etags:
+            return
+        opaque_tag = self._etag[2:]
+        if '*' in etags or any(
+            (etag[2:] if etag.startswith('W/') else etag) == opaque_tag for etag in etags
+        ):
+            raise NotModified(self._etag)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': exc.etag})
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if (
+            self._etag is not None
+            and request.method in ('GET', 'HEAD')
+            and response.status_code == status.HTTP_200_OK
+            and not response.has_header('ETag')
+        ):
+            response['ETag'] = self._etag
+        return response
 
 
 # Concrete view classes that provide method handlers
@@ -32,6 +204,16 @@ class ListPynamoDBAPIView(mixins.ListModelMixin,
         return self.list(request, *args, **kwargs)
 
 
+class StreamingListPynamoDBAPIView(StreamingListModelMixin,
+                                   GenericPynamoDBAPIView):
+    """
+    Concrete view for streaming a queryset.
+    """
+
+    def get(self, request, *args, **kwargs):
+        return self.list(request, *args, **kwargs)
+
+
 class RetrievePynamoDBAPIView(mixins.RetrieveModelMixin,
                               GenericPynamoDBAPIView):
     """
@@ -0,0 +1,63 @@
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+from pynamodb_relations.contrib.rest_framework.serializers import prefetch_serializer_relations
+from pynamodb_relations.identity_map import identity_map
+from pynamodb_relations.reverse_related import ForeignKeyRelationManager
+
+
+class StreamingListModelMixin:
+    """
+    List a queryset as streamed JSON array or NDJSON.
+
+    Items are read lazily from the ResultIterator and rendered in chunks of
+    `stream_chunk_size` items, relations of every chunk are resolved at once
+    (see `prefetch_serializer_relations`). Memory is bounded by the chunk size
+    instead of the size of the result.
+
+    As the status code is sent with the first chunk, errors raised while
+    streaming can not be reported in the response.
+    """
+    stream_chunk_size = 100
+    # 'json' for JSON array, 'ndjson' for newline delimited JSON.
+    stream_format = 'json'
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        if isinstance(queryset, ForeignKeyRelationManager):
+            queryset = queryset.query()
+
+        stream_format = self.stream_format
+        content_type = 'application/x-ndjson' if stream_format == 'ndjson' else 'application/json'
+        return StreamingHttpResponse(
+            self.stream(self.get_serializer(), queryset, stream_format), content_type=content_type
+        )
+
+    def stream(self, serializer, items, stream_format):
+        encoder = JSONEncoder()
+        ndjson = stream_format == 'ndjson'
+        items = iter(items)
+        first = True
+
+        if not ndjson:
+            yield '['
+        while True:
+            chunk = list(islice(items, self.stream_chunk_size))
+            if not chunk:
+                break
+
+            # New identity map per chunk, so loaded items are not kept for the whole stream
+            # even when the view runs inside a session.
+            with identity_map(new=True):
+                prefetch_serializer_relations(serializer, chunk)
+                rendered = [encoder.encode(serializer.to_representation(item)) for item in chunk]
+
+            if ndjson:
+                yield '\n'.join(rendered) + '\n'
+            else:
+                yield ('' if first else ',') + ','.join(rendered)
+            first = False
+        if not ndjson:
+            yield ']'
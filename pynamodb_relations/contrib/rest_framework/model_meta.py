@@ -2,7 +2,7 @@
 This file maps closely api of rest_framework.utils.models_meta
 """
 from collections import namedtuple, OrderedDict
-from typing import NamedTuple, Type
+from typing import Dict, NamedTuple, Optional, Tuple, Type, Union
 
 from pynamodb_relations import models
 from pynamodb_relations.attributes import (Attribute, ProxiedUnicodeAttribute, StaticUnicodeAttribute)
@@ -34,7 +34,32 @@ class RelationInfo(NamedTuple):
     reverse: bool
 
 
-def get_field_info(model: Type[models.Model]):
+_field_info_cache: Dict[Type[models.Model], Tuple[Optional[int], FieldInfo]] = {}
+
+
+def get_field_info(model: Union[Type[models.Model], models.Model]) -> FieldInfo:
+    """
+    Returns (cached) FieldInfo of model.
+
+    Cache is invalidated whenever any model is registered to a database
+    because lazily referenced related models may have changed. Returned info is
+    shared, do not mutate it.
+    """
+    if not isinstance(model, type):
+        model = model.__class__
+
+    database = model._database
+    registry_version = database._registry_version if database is not None else None
+    cached = _field_info_cache.get(model)
+    if cached is not None and cached[0] == registry_version:
+        return cached[1]
+
+    info = _build_field_info(model)
+    _field_info_cache[model] = (registry_version, info)
+    return info
+
+
+def _build_field_info(model: Type[models.Model]) -> FieldInfo:
     hk = model._hash_key_attribute()
     hk_name = model._hash_keyname
     rk = model._range_key_attribute()
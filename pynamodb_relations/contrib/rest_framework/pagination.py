@@ -0,0 +1,137 @@
+from collections import OrderedDict
+
+from django.core import signing
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class LastEvaluatedKeyPagination(BasePagination):
+    """
+    Cursor pagination using DynamoDB's LastEvaluatedKey.
+
+    Paginated "queryset" must provide `page(limit, cursor)` such as
+    `ForeignKeyRelationManager` so every page is fetched by exactly one
+    bounded Query. Cursor is LastEvaluatedKey signed (not encrypted) with
+    Django's signing, so clients can not forge start keys. It is bound to the
+    query it was issued for (see `get_cursor_scope`), replaying it on other
+    partition or filters is rejected like a forged one.
+
+    There is no previous link or count as DynamoDB does not provide them cheaply.
+    """
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = None
+    max_page_size = None
+    cursor_query_param = 'cursor'
+    cursor_salt = 'pynamodb_relations.pagination'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size or not hasattr(queryset, 'page'):
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.cursor_scope = self.get_cursor_scope(request, queryset)
+        cursor = self.decode_cursor(request)
+        page = queryset.page(self.page_size, cursor)
+        self.next_cursor = page.last_evaluated_key
+        return page.items
+
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                return _positive_int(
+                    request.query_params[self.page_size_query_param],
+                    strict=True,
+                    cutoff=self.max_page_size
+                )
+            except (KeyError, ValueError):
+                pass
+
+        return self.page_size
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            payload = signing.loads(encoded, salt=self.cursor_salt)
+        except signing.BadSignature:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(payload, dict) or payload.get('scope') != self.cursor_scope:
+            raise NotFound(self.invalid_cursor_message)
+        return payload.get('key')
+
+    def encode_cursor(self, last_evaluated_key):
+        payload = {'key': last_evaluated_key, 'scope': self.cursor_scope}
+        return signing.dumps(payload, salt=self.cursor_salt, compress=True)
+
+    def get_cursor_scope(self, request, queryset):
+        """
+        Returns identity of the paginated query: path, query params except cursor
+        and page size, and hash key of the queryset. Must be JSON serializable.
+        """
+        params = sorted(
+            [key, value]
+            for key, values in request.query_params.lists()
+            for value in values
+            if key not in (self.cursor_query_param, self.page_size_query_param)
+        )
+        return [request.path, params, str(getattr(queryset, 'hash_key', ''))]
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, self.encode_cursor(self.next_cursor)
+        )
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                },
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        parameters = [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'The pagination cursor value.',
+                'schema': {
+                    'type': 'string',
+                },
+            }
+        ]
+        if self.page_size_query_param is not None:
+            parameters.append(
+                {
+                    'name': self.page_size_query_param,
+                    'required': False,
+                    'in': 'query',
+                    'description': 'Number of results to return per page.',
+                    'schema': {
+                        'type': 'integer',
+                    },
+                }
+            )
+        return parameters
@@ -36,6 +36,7 @@ class UnicodeRelatedField(RelatedField):
         if self.disable_related_object_resolve:
             attribute_instance: Model = get_attribute(instance, self.source_attrs[:-1])
             if attribute_instance.attribute_values[self.source_attrs[-1]]._resolved is False:
-                return instance.attribute_values[self.source_attrs[-1]].value
+                # Unresolved descriptor is represented by serialized key of related item.
+                return attribute_instance.attribute_values[self.source_attrs[-1]]
 
         return super().get_attribute(instance)
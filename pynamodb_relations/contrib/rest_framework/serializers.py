@@ -1,10 +1,12 @@
+import contextvars
 import copy
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from collections import OrderedDict
-from typing import Type
+from typing import Dict, List, Tuple, Type, Union
 
 from rest_framework import fields as rest_fields
-from rest_framework.fields import CharField, ChoiceField, ModelField
+from rest_framework.fields import CharField, ChoiceField, ModelField, get_attribute
 from rest_framework.serializers import BaseSerializer, LIST_SERIALIZER_KWARGS, ListSerializer, ModelSerializer
 from rest_framework.settings import api_settings
 from rest_framework.utils.field_mapping import ClassLookupDict, get_nested_relation_kwargs
@@ -14,9 +16,15 @@ from pynamodb_relations.contrib.rest_framework import model_meta
 from pynamodb_relations.contrib.rest_framework.field_mapping import get_field_kwargs, get_relation_kwargs
 from pynamodb_relations.contrib.rest_framework.model_meta import FieldInfo
 from pynamodb_relations.contrib.rest_framework.relations import UnicodeRelatedField
+from pynamodb_relations.forward_related import prefetch_related
+from pynamodb_relations.identity_map import identity_map
+from pynamodb_relations.many_related import ManyToManyRelationManager
 from pynamodb_relations.models import Model
 from pynamodb_relations.reverse_related import ForeignKeyRelationManager
 
+# (serializer class, depth) -> (FieldInfo the fields were built from, template fields)
+_field_specs_cache: Dict[Tuple[type, int], Tuple[FieldInfo, List[Tuple[str, rest_fields.Field]]]] = {}
+
 
 def raise_errors_on_nested_writes(method_name, serializer, validated_data):
     """
@@ -93,18 +101,119 @@ def raise_errors_on_nested_writes(method_name, serializer, validated_data):
     )
 
 
+def prefetch_serializer_relations(serializer, instances):
+    """
+    Resolve forward relations rendered by serializer for all instances at once.
+
+    Related items of nested serializers and of `UnicodeRelatedField` with
+    `disable_related_object_resolve=False` are loaded with BatchGetItem
+    (see `prefetch_related`), recursively for nested serializers.
+    Reverse relations rendered by nested list serializers are queried
+    concurrently (see `PynamoListSerializer.prefetch_relation`).
+    """
+    model = getattr(getattr(serializer, 'Meta', None), 'model', None)
+    instances = [instance for instance in instances if isinstance(instance, Model)]
+    if model is None or not instances:
+        return
+
+    info = model_meta.get_field_info(model)
+    relations = []
+    nested = []
+    for field in serializer._readable_fields:
+        if len(field.source_attrs) != 1:
+            continue
+        if field.source_attrs[0] in info.reverse_relations and isinstance(field, PynamoListSerializer):
+            field.prefetch_relation(instances)
+            continue
+        if field.source_attrs[0] not in info.forward_relations:
+            continue
+        if isinstance(field, UnicodeRelatedField) and field.disable_related_object_resolve:
+            continue
+        relations.append(field.source_attrs[0])
+        if isinstance(field, BaseSerializer):
+            nested.append(field)
+
+    if not relations:
+        return
+
+    prefetch_related(instances, *relations)
+    for field in nested:
+        related = [getattr(instance, field.source_attrs[0]) for instance in instances]
+        prefetch_serializer_relations(field, related)
+
+
+def _query_relation(manager: Union[ForeignKeyRelationManager, ManyToManyRelationManager], query_kwargs):
+    if not any(query_kwargs.values()):
+        return manager.all()
+    if isinstance(manager, ManyToManyRelationManager):
+        return manager.fetch(**query_kwargs)
+    return list(manager.query(**query_kwargs))
+
+
 class PynamoListSerializer(ListSerializer):
+    """
+    List serializer resolving relations of all items at once.
+
+    When used for a reverse relation, queries of all parents are run concurrently
+    on a thread pool of `relation_workers` threads. Child serializer's Meta may set:
+
+    * relation_limit - maximum number of related items rendered per parent.
+    * relation_attributes_to_get - attributes fetched for related items,
+      keys and type attribute are always included.
+    """
+    relation_workers = 8
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._prefetched_relations = {}
+
+    def get_attribute(self, instance):
+        prefetched = self._prefetched_relations.pop(id(instance), None)
+        if prefetched is not None and prefetched[0] is instance:
+            return prefetched[1].result()
+        return super().get_attribute(instance)
+
+    def prefetch_relation(self, instances):
+        """
+        Start queries of the rendered reverse relation for all instances on a thread pool.
+
+        Results are consumed by `get_attribute` in the order the parents are rendered.
+        """
+        meta = getattr(self.child, 'Meta', None)
+        query_kwargs = {'limit': getattr(meta, 'relation_limit', None)}
+        attributes_to_get = getattr(meta, 'relation_attributes_to_get', None)
+        if attributes_to_get is not None:
+            query_kwargs['attributes_to_get'] = meta.model._get_projection(attributes_to_get)
+
+        executor = ThreadPoolExecutor(min(self.relation_workers, len(instances)))
+        try:
+            for instance in instances:
+                manager = get_attribute(instance, self.source_attrs)
+                self._prefetched_relations[id(instance)] = (
+                    instance,
+                    executor.submit(
+                        contextvars.copy_context().run, _query_relation, manager, query_kwargs
+                    ),
+                )
+        finally:
+            executor.shutdown(wait=False)
+
     def to_representation(self, data):
         """
         List of object instances -> List of dicts of primitive datatypes.
         """
         # Dealing with nested relationships, data can be a Manager,
         # so, first get a queryset from the Manager if needed
-        iterable = data.query() if isinstance(data, ForeignKeyRelationManager) else data
+        iterable = (
+            data.all() if isinstance(data, (ForeignKeyRelationManager, ManyToManyRelationManager)) else data
+        )
 
-        return [
-            self.child.to_representation(item) for item in iterable
-        ]
+        with identity_map():
+            items = list(iterable)
+            prefetch_serializer_relations(self.child, items)
+            return [
+                self.child.to_representation(item) for item in items
+            ]
 
 
 class PynamoModelSerializer(ModelSerializer):
@@ -120,6 +229,8 @@ class PynamoModelSerializer(ModelSerializer):
         attributes.MapAttribute: rest_fields.DictField,
     }
     serializer_related_field = UnicodeRelatedField
+    # Query param with comma separated names of rendered fields, None disables sparse fieldsets.
+    fields_query_param = 'fields'
 
     @classmethod
     def many_init(cls, *args, **kwargs):
@@ -172,7 +283,6 @@ class PynamoModelSerializer(ModelSerializer):
             )
         )
 
-        declared_fields = copy.deepcopy(self._declared_fields)
         model = getattr(self.Meta, 'model')
         depth = getattr(self.Meta, 'depth', 0)
 
@@ -182,6 +292,79 @@ class PynamoModelSerializer(ModelSerializer):
 
         # Retrieve metadata about fields & relationships on the model class.
         info = model_meta.get_field_info(model)
+
+        # Fields only depend on serializer class, depth and model info, so they are
+        # built once as templates and every instance gets deep copies of them
+        # like of declared fields (see `Serializer.get_fields`).
+        cache_key = (self.__class__, depth)
+        cached = _field_specs_cache.get(cache_key)
+        if cached is None or cached[0] is not info:
+            cached = (info, [
+                (field_name, field_class(**field_kwargs) if field_class is not None else field_kwargs)
+                for field_name, field_class, field_kwargs in self.get_field_specs(info, model, depth)
+            ])
+            _field_specs_cache[cache_key] = cached
+
+        requested_fields = self.get_requested_fields()
+        fields = OrderedDict()
+        for field_name, field in cached[1]:
+            if requested_fields is None or field_name in requested_fields:
+                fields[field_name] = copy.deepcopy(field)
+
+        return fields
+
+    def get_requested_fields(self):
+        """
+        Return field names requested by `fields_query_param` or None for all fields.
+
+        Sparse fieldsets are applied only on the top level serializer and only for GET and HEAD
+        requests, so writes are always validated and rendered with all fields.
+        """
+        if not self.fields_query_param:
+            return None
+        root = self.root
+        if root is not self and not (isinstance(root, ListSerializer) and root.child is self):
+            return None
+        request = self.context.get('request')
+        if request is None or request.method not in ('GET', 'HEAD'):
+            return None
+        value = request.query_params.get(self.fields_query_param)
+        if not value:
+            return None
+        return {name for name in value.split(',') if name}
+
+    def get_sparse_attributes(self):
+        """
+        Return names of model attributes needed to render the requested sparse fieldset.
+
+        None is returned when all fields were requested or some requested field is not
+        backed by a model attribute (e.g. SerializerMethodField), so whole items have to be read.
+        """
+        if self.get_requested_fields() is None:
+            return None
+
+        model = self.Meta.model
+        model_attributes = model.get_attributes()
+        reverse_relations = model.get_reverse_relations()
+        names = []
+        for field in self._readable_fields:
+            if not field.source_attrs:
+                return None
+            name = field.source_attrs[0]
+            if name in reverse_relations:
+                continue
+            if name not in model_attributes:
+                return None
+            names.append(name)
+        return names
+
+    def get_field_specs(self, info: FieldInfo, model: Type[Model], depth: int):
+        """
+        Return list of (field name, field class, field kwargs) used to build `self.fields`.
+
+        Declared and hidden fields are returned as (field name, None, field instance).
+        """
+        declared_fields = self._declared_fields
         field_names = self.get_field_names(declared_fields, info)
 
         # Determine any extra field arguments and hidden fields that
@@ -192,12 +375,12 @@ class PynamoModelSerializer(ModelSerializer):
         )
 
         # Determine the fields that should be included on the serializer.
-        fields = OrderedDict()
+        specs = []
 
         for field_name in field_names:
             # If the field is explicitly declared on the class then use that.
             if field_name in declared_fields:
-                fields[field_name] = declared_fields[field_name]
+                specs.append((field_name, None, declared_fields[field_name]))
                 continue
 
             extra_field_kwargs = extra_kwargs.get(field_name, {})
@@ -215,13 +398,12 @@ class PynamoModelSerializer(ModelSerializer):
                 field_kwargs, extra_field_kwargs
             )
 
-            # Create the serializer field.
-            fields[field_name] = field_class(**field_kwargs)
+            specs.append((field_name, field_class, field_kwargs))
 
         # Add in any hidden fields.
-        fields.update(hidden_fields)
+        specs.extend((field_name, None, field) for field_name, field in hidden_fields.items())
 
-        return fields
+        return specs
 
     def get_default_field_names(self, declared_fields, model_info: FieldInfo):
         """
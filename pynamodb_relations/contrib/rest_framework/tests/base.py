@@ -55,6 +55,20 @@ class PynamoDBRelationsSerializerTestCase(unittest.TestCase):
         self.assertTrue(isinstance(serializer.fields["dict"], DictField))
         self.assertTrue(isinstance(serializer.fields["locked"], BooleanField))
 
+    def test_serializer_fields_built_from_cached_specs(self):
+        class ThreadSerializer(PynamoModelSerializer):
+            title = CharField(source="subject")
+
+            class Meta:
+                model = self.database.Thread
+                fields = "__all__"
+
+        first, second = ThreadSerializer(), ThreadSerializer()
+        self.assertEqual(list(first.fields.keys()), list(second.fields.keys()))
+        self.assertIsNot(first.fields["title"], second.fields["title"])
+        self.assertIsNot(first.fields["views"], second.fields["views"])
+        self.assertIs(first.fields["title"].parent, first)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,8 @@
+import os
+
+import django
+
+os.environ.setdefault(
+    "DJANGO_SETTINGS_MODULE", "pynamodb_relations.contrib.rest_framework.tests.minimal_settings"
+)
+django.setup()
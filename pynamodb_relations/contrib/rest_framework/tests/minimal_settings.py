@@ -1 +1,7 @@
 SECRET_KEY = "some_secret_key"
+ALLOWED_HOSTS = ["testserver"]
+REST_FRAMEWORK = {
+    "DEFAULT_AUTHENTICATION_CLASSES": [],
+    "DEFAULT_PERMISSION_CLASSES": [],
+    "UNAUTHENTICATED_USER": None,
+}
@@ -0,0 +1,45 @@
+import unittest
+
+from pynamodb_relations import attributes
+from pynamodb_relations.contrib.rest_framework.model_meta import get_field_info
+from pynamodb_relations.database import BaseDatabase
+from pynamodb_relations.models import Model
+
+
+class GetFieldInfoTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        class MetaDatabase(BaseDatabase):
+            table_name = "Meta"
+
+        class Board(Model):
+            class Meta:
+                name = "MetaBoard"
+                database = MetaDatabase
+
+            pk = attributes.UnicodeAttribute(hash_key=True)
+            title = attributes.UnicodeAttribute(null=True)
+
+        cls.model = Board
+
+    def test_field_info_is_cached(self):
+        info = get_field_info(self.model)
+
+        self.assertIs(info, get_field_info(self.model))
+        self.assertIs(info, get_field_info(self.model(pk="b1")))
+        self.assertEqual("pk", info.hk.name)
+
+    def test_cache_invalidated_by_registration_to_other_database(self):
+        info = get_field_info(self.model)
+
+        class OtherDatabase(BaseDatabase):
+            table_name = "Other"
+
+        class Card(Model):
+            class Meta:
+                name = "MetaCard"
+                database = OtherDatabase
+
+            pk = attributes.UnicodeAttribute(hash_key=True)
+
+        self.assertIsNot(info, get_field_info(self.model))
@@ -0,0 +1,109 @@
+from unittest import mock
+
+import pytest
+from pynamodb.connection import TableConnection
+
+from pynamodb_relations.contrib.rest_framework.relations import UnicodeRelatedField
+from pynamodb_relations.contrib.rest_framework.serializers import PynamoModelSerializer
+from tests.models import Author, ForumDatabase, Post, Thread
+
+
+class PostSerializer(PynamoModelSerializer):
+    class Meta:
+        model = Post
+        fields = ("pk", "sk", "body", "author")
+        depth = 1
+
+
+class PostKeySerializer(PynamoModelSerializer):
+    class Meta:
+        model = Post
+        fields = ("pk", "sk", "author")
+
+
+class LimitedPostSerializer(PynamoModelSerializer):
+    class Meta:
+        model = Post
+        fields = ("sk", "body")
+        relation_limit = 2
+        relation_attributes_to_get = ("body",)
+
+
+class ThreadSerializer(PynamoModelSerializer):
+    posts = PostKeySerializer(many=True)
+
+    class Meta:
+        model = Thread
+        fields = ("pk", "posts")
+
+
+class LimitedThreadSerializer(PynamoModelSerializer):
+    posts = LimitedPostSerializer(many=True)
+
+    class Meta:
+        model = Thread
+        fields = ("pk", "posts")
+
+
+@pytest.fixture
+def forum(create_table):
+    create_table(ForumDatabase)
+    with ForumDatabase.batch_write() as batch:
+        for n in range(3):
+            batch.save(Author(pk=f"a{n}", name=f"Author {n}"))
+        for n in range(30):
+            batch.save(Post(pk="t1", sk=f"{n:02}", author=Author(pk=f"a{n % 3}")))
+
+
+def test_nested_forward_relations_resolved_with_one_batch_get(forum):
+    posts = list(Post.query("t1"))
+    connection = ForumDatabase._get_connection()
+
+    with mock.patch.object(connection, "batch_get_item", wraps=connection.batch_get_item) as batch_get_item, \
+            mock.patch.object(connection, "get_item", side_effect=AssertionError("N+1 get")):
+        data = PostSerializer(posts, many=True).data
+
+    assert batch_get_item.call_count == 1
+    assert [item["author"]["name"] for item in data[:4]] == ["Author 0", "Author 1", "Author 2", "Author 0"]
+
+
+def test_related_field_renders_key_without_reads(forum):
+    posts = list(Post.query("t1"))
+    connection = ForumDatabase._get_connection()
+
+    with mock.patch.object(connection, "batch_get_item", side_effect=AssertionError("resolved")), \
+            mock.patch.object(connection, "get_item", side_effect=AssertionError("resolved")):
+        serializer = PostKeySerializer(posts, many=True)
+        data = serializer.data
+
+    assert isinstance(serializer.child.fields["author"], UnicodeRelatedField)
+    assert [item["author"] for item in data[:2]] == ["AUTHOR#a0", "AUTHOR#a1"]
+
+
+@pytest.fixture
+def threads(create_table):
+    create_table(ForumDatabase)
+    with ForumDatabase.batch_write() as batch:
+        for n in range(5):
+            batch.save(Thread(pk=f"t{n}"))
+            for m in range(n):
+                batch.save(Post(pk=f"t{n}", sk=str(m), body=f"Body {n}.{m}", author=Author(pk="a1")))
+    return sorted(Thread.scan(), key=lambda thread: thread.pk)
+
+
+def test_reverse_relations_of_list_queried_concurrently(threads):
+    with mock.patch.object(TableConnection, "query", autospec=True, side_effect=TableConnection.query) as query:
+        data = ThreadSerializer(threads, many=True).data
+
+    assert query.call_count == 5
+    assert [item["pk"] for item in data] == ["t0", "t1", "t2", "t3", "t4"]
+    assert [[post["sk"] for post in item["posts"]] for item in data] == [
+        [], ["0"], ["0", "1"], ["0", "1", "2"], ["0", "1", "2", "3"]
+    ]
+
+
+def test_reverse_relation_limit_and_attributes_to_get(threads):
+    data = LimitedThreadSerializer(threads, many=True).data
+
+    assert [len(item["posts"]) for item in data] == [0, 1, 2, 2, 2]
+    assert data[4]["posts"] == [{"sk": "0", "body": "Body 4.0"}, {"sk": "1", "body": "Body 4.1"}]
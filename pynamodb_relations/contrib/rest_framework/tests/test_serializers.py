@@ -0,0 +1,73 @@
+import unittest
+from unittest import mock
+
+from rest_framework.fields import CharField
+
+from pynamodb_relations import attributes
+from pynamodb_relations.contrib.rest_framework import serializers
+from pynamodb_relations.contrib.rest_framework.serializers import PynamoModelSerializer
+from pynamodb_relations.database import BaseDatabase
+from pynamodb_relations.models import Model
+
+
+class FieldSpecsTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        class SpecsDatabase(BaseDatabase):
+            table_name = "Specs"
+
+        class Note(Model):
+            class Meta:
+                name = "SpecsNote"
+                database = SpecsDatabase
+
+            pk = attributes.UnicodeAttribute(hash_key=True)
+            sk = attributes.StaticUnicodeAttribute("NOTE", range_key=True)
+            text = attributes.UnicodeAttribute(null=True)
+            views = attributes.NumberAttribute(default=0)
+
+        class NoteSerializer(PynamoModelSerializer):
+            title = CharField(source="text")
+
+            class Meta:
+                model = Note
+                fields = "__all__"
+
+        cls.serializer_class = NoteSerializer
+
+    def test_field_specs_computed_once_per_class(self):
+        serializers._field_specs_cache.clear()
+        with mock.patch.object(
+            self.serializer_class, "get_field_specs", autospec=True,
+            side_effect=PynamoModelSerializer.get_field_specs,
+        ) as get_field_specs:
+            first = self.serializer_class().fields
+            second = self.serializer_class().fields
+
+        self.assertEqual(1, get_field_specs.call_count)
+        self.assertEqual(["pk", "sk", "title", "text", "views"], list(first.keys()))
+        self.assertEqual(list(first.keys()), list(second.keys()))
+        self.assertIsNot(first["title"], second["title"])
+        self.assertIsNot(first["views"], second["views"])
+
+    def test_field_specs_rebuilt_when_model_info_changes(self):
+        self.serializer_class().fields
+
+        class OtherDatabase(BaseDatabase):
+            table_name = "Other"
+
+        class Page(Model):
+            class Meta:
+                name = "SpecsPage"
+                database = OtherDatabase
+
+            pk = attributes.UnicodeAttribute(hash_key=True)
+
+        with mock.patch.object(
+            self.serializer_class, "get_field_specs", autospec=True,
+            side_effect=PynamoModelSerializer.get_field_specs,
+        ) as get_field_specs:
+            self.serializer_class().fields
+            self.serializer_class().fields
+
+        self.assertEqual(1, get_field_specs.call_count)
@@ -0,0 +1,365 @@
+import json
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from pynamodb.connection import TableConnection
+from pynamodb.indexes import AllProjection, LocalSecondaryIndex
+from rest_framework.test import APIRequestFactory
+
+from pynamodb_relations import attributes
+from pynamodb_relations.contrib.rest_framework import generics, mixins
+from pynamodb_relations.contrib.rest_framework.pagination import LastEvaluatedKeyPagination
+from pynamodb_relations.contrib.rest_framework.serializers import PynamoModelSerializer
+from pynamodb_relations.database import BaseDatabase
+from pynamodb_relations.identity_map import get_identity_map, identity_map
+from pynamodb_relations.models import Model
+from pynamodb_relations.reverse_related import PrimaryKeyReverseForeignKeyRelation
+from tests.models import Author, ForumDatabase, Post, Thread
+
+factory = APIRequestFactory()
+
+
+class BoardDatabase(BaseDatabase):
+    table_name = "board"
+    region = "us-east-1"
+    billing_mode = "PAY_PER_REQUEST"
+
+
+class CreatedIndex(LocalSecondaryIndex):
+    class Meta:
+        index_name = "created"
+        projection = AllProjection()
+
+    pk = attributes.PrefixedUnicodeAttribute("BOARD#", hash_key=True)
+    created = attributes.UnicodeAttribute(range_key=True)
+
+
+class Board(Model):
+    class Meta:
+        name = "BoardBoard"
+        database = BoardDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("BOARD#", hash_key=True)
+    sk = attributes.StaticUnicodeAttribute("BOARD", range_key=True)
+    topics = PrimaryKeyReverseForeignKeyRelation("BoardTopic")
+
+
+class Topic(Model):
+    class Meta:
+        name = "BoardTopic"
+        database = BoardDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("BOARD#", hash_key=True)
+    sk = attributes.PrefixedUnicodeAttribute("TOPIC#", range_key=True)
+    created = attributes.UnicodeAttribute()
+    votes = attributes.NumberAttribute(default=0)
+    by_created = CreatedIndex()
+
+
+class PostSerializer(PynamoModelSerializer):
+    class Meta:
+        model = Post
+        fields = ("pk", "sk", "body", "author")
+
+
+class PostPagination(LastEvaluatedKeyPagination):
+    page_size = 10
+
+
+class ThreadPostList(generics.ListPynamoDBAPIView):
+    serializer_class = PostSerializer
+    pagination_class = PostPagination
+
+    def get_queryset(self):
+        return Thread(pk=self.kwargs["hash_key"]).posts
+
+
+class AuthorPostList(ThreadPostList):
+    pagination_class = None
+    filter_fields = {"author": ["exact", "in"]}
+
+
+class NestedPostSerializer(PynamoModelSerializer):
+    class Meta:
+        model = Post
+        fields = ("sk", "author")
+        depth = 1
+
+
+class ThreadPostStream(generics.StreamingListPynamoDBAPIView):
+    serializer_class = NestedPostSerializer
+    stream_chunk_size = 10
+
+    def get_queryset(self):
+        return Thread(pk=self.kwargs["hash_key"]).posts
+
+
+class GaugeDatabase(BaseDatabase):
+    table_name = "gauge"
+    region = "us-east-1"
+    billing_mode = "PAY_PER_REQUEST"
+
+
+class Gauge(Model):
+    class Meta:
+        name = "GaugeGauge"
+        database = GaugeDatabase
+
+    pk = attributes.NumberAttribute(hash_key=True)
+    sk = attributes.StaticUnicodeAttribute("GAUGE", range_key=True)
+    value = attributes.NumberAttribute(default=0)
+    version = attributes.VersionAttribute()
+
+
+class GaugeSerializer(PynamoModelSerializer):
+    class Meta:
+        model = Gauge
+        fields = ("pk", "value")
+
+
+class GaugeDetail(generics.RetrievePynamoDBAPIView):
+    serializer_class = GaugeSerializer
+
+
+class GaugeUpdate(generics.RetrieveUpdatePynamoDBAPIView):
+    serializer_class = GaugeSerializer
+
+
+class TopicSerializer(PynamoModelSerializer):
+    class Meta:
+        model = Topic
+        fields = ("sk", "created", "votes")
+
+
+class BoardTopicList(generics.ListPynamoDBAPIView):
+    serializer_class = TopicSerializer
+    pagination_class = None
+    filter_fields = {
+        "pk": ["exact"],
+        "sk": ["startswith", "ne", "gte", "lte"],
+        "created": ["gte", "ne"],
+        "votes": ["gte", "in"],
+    }
+
+    def get_queryset(self):
+        return Board(pk=self.kwargs["hash_key"]).topics
+
+
+@pytest.fixture
+def forum(create_table):
+    create_table(ForumDatabase)
+    with ForumDatabase.batch_write() as batch:
+        batch.save(Thread(pk="t1", subject="Subject"))
+        for n in range(3):
+            batch.save(Author(pk=f"a{n}", name=f"Author {n}"))
+        for n in range(25):
+            batch.save(Post(pk="t1", sk=f"{n:02}", body=f"Body {n}", author=Author(pk=f"a{n % 3}")))
+
+
+def get(view, url, **kwargs):
+    request = factory.get(url, **kwargs.pop("headers", {}))
+    response = view.as_view()(request, **kwargs)
+    response.render()
+    return response
+
+
+def query_calls():
+    return mock.patch.object(TableConnection, "query", autospec=True, side_effect=TableConnection.query)
+
+
+def test_pages_are_read_with_one_query_each(forum):
+    url, keys = "/threads/t1/posts/", []
+    with query_calls() as query:
+        while url:
+            response = get(ThreadPostList, url, hash_key="t1")
+            assert response.status_code == 200
+            keys.extend(item["sk"] for item in response.data["results"])
+            url = response.data["next"]
+
+    assert query.call_count == 3
+    assert keys == [f"{n:02}" for n in range(25)]
+
+
+def test_forged_cursor_is_rejected(forum):
+    response = get(ThreadPostList, "/threads/t1/posts/?cursor=forged", hash_key="t1")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("url, hash_key", [
+    ("/threads/t2/posts/", "t2"),
+    ("/threads/t1/posts/?body=Body", "t1"),
+])
+def test_cursor_is_bound_to_its_query(forum, url, hash_key):
+    Post(pk="t2", sk="00").save()
+    response = get(ThreadPostList, "/threads/t1/posts/", hash_key="t1")
+    cursor = parse_qs(urlparse(response.data["next"]).query)["cursor"][0]
+    separator = "&" if "?" in url else "?"
+
+    response = get(ThreadPostList, f"{url}{separator}cursor={cursor}", hash_key=hash_key)
+    assert response.status_code == 404
+
+
+@pytest.fixture
+def board(create_table):
+    create_table(BoardDatabase)
+    with BoardDatabase.batch_write() as batch:
+        batch.save(Board(pk="b1"))
+        for n in range(12):
+            batch.save(Topic(pk="b1", sk=f"{n:02}", created=f"2020-{12 - n:02}", votes=n % 4))
+
+
+def topics(url):
+    response = get(BoardTopicList, url, hash_key="b1")
+    assert response.status_code == 200, response.data
+    return [item["sk"] for item in response.data]
+
+
+def test_filter_range_key_and_attributes(board):
+    with query_calls() as query:
+        assert topics("/boards/b1/topics/?sk__startswith=1") == ["10", "11"]
+        assert topics("/boards/b1/topics/?sk__gte=03&sk__lte=05") == ["03", "04", "05"]
+        assert topics("/boards/b1/topics/?sk__gte=08&votes__in=0,3") == ["08", "11"]
+
+    assert [call.kwargs.get("index_name") for call in query.call_args_list] == [None, None, None]
+
+
+def test_filter_selects_index_by_its_range_key(board):
+    with query_calls() as query:
+        assert topics("/boards/b1/topics/?created__gte=2020-10&votes__gte=1") == ["02", "01"]
+
+    assert query.call_args.kwargs["index_name"] == "created"
+    assert topics("/boards/b1/topics/?created__ne=2020-01&votes__gte=3") == ["03", "07"]
+
+
+@pytest.mark.parametrize("query_string", [
+    "sk__ne=01",
+    "sk__startswith=0&sk__ne=01",
+    "pk=b1",
+    "votes__gte=many",
+])
+def test_invalid_filters_are_rejected(board, query_string):
+    response = get(BoardTopicList, f"/boards/b1/topics/?{query_string}", hash_key="b1")
+
+    assert response.status_code == 400
+
+
+def test_filter_fields_must_be_model_attributes(board):
+    class UnknownFieldList(BoardTopicList):
+        filter_fields = ["title"]
+
+    with pytest.raises(ImproperlyConfigured):
+        get(UnknownFieldList, "/boards/b1/topics/?title=x", hash_key="b1")
+
+
+def test_filter_foreign_key_by_related_key(forum):
+    def posts(query_string):
+        response = get(AuthorPostList, f"/threads/t1/posts/?{query_string}", hash_key="t1")
+        assert response.status_code == 200, response.data
+        return [item["sk"] for item in response.data]
+
+    assert posts("author=a1") == [f"{n:02}" for n in range(1, 25, 3)]
+    assert posts("author__in=a0,a2") == [f"{n:02}" for n in range(25) if n % 3 != 1]
+    assert posts("author=missing") == []
+
+
+@pytest.fixture
+def gauge(create_table):
+    create_table(GaugeDatabase)
+    gauge = Gauge(pk=5, value=10)
+    gauge.save()
+    return gauge
+
+
+def test_get_object_converts_number_key(gauge):
+    response = get(GaugeDetail, "/gauges/5/", hash_key="5")
+
+    assert response.status_code == 200
+    assert response.data == {"pk": 5, "value": 10}
+    assert response["ETag"] == 'W/"1"'
+
+
+@pytest.mark.parametrize("hash_key", ["abc", "true", "6"])
+def test_get_object_not_found(gauge, hash_key):
+    assert get(GaugeDetail, f"/gauges/{hash_key}/", hash_key=hash_key).status_code == 404
+
+
+def test_get_object_not_modified(gauge):
+    response = get(GaugeDetail, "/gauges/5/", hash_key="5", headers={"HTTP_IF_NONE_MATCH": 'W/"1"'})
+    assert response.status_code == 304
+    assert response["ETag"] == 'W/"1"'
+
+    gauge.value = 11
+    gauge.save()
+    response = get(GaugeDetail, "/gauges/5/", hash_key="5", headers={"HTTP_IF_NONE_MATCH": 'W/"1"'})
+    assert response.status_code == 200
+    assert response["ETag"] == 'W/"2"'
+
+
+def stream(view, url, **kwargs):
+    response = view.as_view()(factory.get(url), **kwargs)
+    assert response.status_code == 200
+    return b"".join(response.streaming_content).decode()
+
+
+def test_stream_json_and_ndjson(forum):
+    items = json.loads(stream(ThreadPostStream, "/threads/t1/posts/", hash_key="t1"))
+    assert [item["sk"] for item in items] == [f"{n:02}" for n in range(25)]
+    assert items[1]["author"]["pk"] == "a1"
+
+    class NDJSONStream(ThreadPostStream):
+        stream_format = "ndjson"
+
+    lines = stream(NDJSONStream, "/threads/t1/posts/", hash_key="t1").splitlines()
+    assert [json.loads(line)["sk"] for line in lines] == [f"{n:02}" for n in range(25)]
+
+
+def test_stream_uses_new_identity_map_per_chunk(forum):
+    maps = []
+    prefetch = mixins.prefetch_serializer_relations
+
+    def record(serializer, instances):
+        maps.append(get_identity_map())
+        prefetch(serializer, instances)
+
+    with identity_map() as session, mock.patch.object(mixins, "prefetch_serializer_relations", record):
+        stream(ThreadPostStream, "/threads/t1/posts/", hash_key="t1")
+
+        assert len(maps) == 3
+        assert len({id(identity) for identity in maps}) == 3
+        assert session not in maps
+        assert session.get(Author, "AUTHOR#a0", "AUTHOR") is None
+
+
+def test_sparse_fieldset_reads_only_requested_attributes(forum):
+    with query_calls() as query:
+        response = get(ThreadPostList, "/threads/t1/posts/?fields=sk,body", hash_key="t1")
+
+    assert response.data["results"][0] == {"sk": "00", "body": "Body 0"}
+    assert sorted(query.call_args.kwargs["attributes_to_get"]) == ["body", "pk", "sk", "type"]
+
+    with query_calls() as query:
+        response = get(ThreadPostList, "/threads/t1/posts/", hash_key="t1")
+
+    assert set(response.data["results"][0]) == {"pk", "sk", "body", "author"}
+    assert query.call_args.kwargs["attributes_to_get"] is None
+
+
+def test_sparse_fieldset_of_object(gauge):
+    with mock.patch.object(Gauge, "get", wraps=Gauge.get) as get_gauge:
+        response = get(GaugeDetail, "/gauges/5/?fields=value", hash_key="5")
+
+    assert response.data == {"value": 10}
+    assert sorted(get_gauge.call_args.kwargs["attributes_to_get"]) == ["pk", "sk", "type", "value", "version"]
+
+
+def test_sparse_fieldset_ignored_by_writes(gauge):
+    request = factory.put("/gauges/5/?fields=value", {"pk": 5, "value": 12}, format="json")
+    response = GaugeUpdate.as_view()(request, hash_key="5")
+    response.render()
+
+    assert response.status_code == 200
+    assert response.data == {"pk": 5, "value": 12}
+    assert Gauge.get(5).value == 12
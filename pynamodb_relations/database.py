@@ -1,6 +1,47 @@
-from typing import Dict, Type
+import random
+import time
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
+from pynamodb.connection import TableConnection
+from pynamodb.connection.util import pythonic
+from pynamodb.constants import (
+    ACTIVE,
+    ATTR_NAME,
+    ATTR_TYPE,
+    BATCH_GET_PAGE_LIMIT,
+    DEFAULT_BILLING_MODE,
+    HOST,
+    INCLUDE,
+    INDEX_NAME,
+    KEY_SCHEMA,
+    KEY_TYPE,
+    KEYS,
+    NON_KEY_ATTRIBUTES,
+    PAY_PER_REQUEST_BILLING_MODE,
+    PROJECTION,
+    PROJECTION_TYPE,
+    PROVISIONED_THROUGHPUT,
+    READ_CAPACITY_UNITS,
+    REGION,
+    RESPONSES,
+    STRING_SHORT,
+    TABLE_STATUS,
+    UNPROCESSED_KEYS,
+    WRITE_CAPACITY_UNITS,
+)
+from pynamodb.exceptions import GetError, TableDoesNotExist, TableError
+from pynamodb.expressions.operand import Path
+from pynamodb.pagination import ResultIterator
+from pynamodb.settings import get_settings_value
+from pynamodb.types import HASH
+
+from .batch import BatchWrite
+from .constans import BILLING_MODE_NAME, DEFAULT_TYPE_ATTRIBUTE_NAME, TRANSACT_ITEMS_LIMIT
+from .identity_map import IdentityMap, identity_map
 from .models import Model
+from .scan import ParallelScan
+from .schema import IndexSchema, TableSchema, plan_table_schema
+from .transactions import TransactGet, TransactWrite
 
 
 class BaseDatabase:
@@ -9,13 +50,80 @@ class BaseDatabase:
     """
 
     ITEM_TYPE_MAPPING: Dict[str, Type[Model]] = {}
+    # Incremented on every model registration so registry dependent caches can be invalidated.
+    # Kept only on BaseDatabase because ITEM_TYPE_MAPPING is shared by all databases.
+    _registry_version: int = 0
     region: str
     table_name: str
     billing_mode: str
 
+    _connection: Optional[TableConnection] = None
+
     @classmethod
     def from_raw(cls, item):
-        return cls.ITEM_TYPE_MAPPING[item["type"]["S"]].from_raw_data(item)
+        return cls.ITEM_TYPE_MAPPING[cls._get_item_type(item)].from_raw_data(item)
+
+    @classmethod
+    def _from_raw_partial(cls, item):
+        """
+        Converts raw item read with attributes_to_get, returned instance can not be saved.
+        """
+        return cls.ITEM_TYPE_MAPPING[cls._get_item_type(item)]._from_raw_partial_data(item)
+
+    @classmethod
+    def from_raw_many(cls, items: Iterable[Dict[str, Any]]) -> List[Model]:
+        """
+        Converts many raw items of any registered model into model instances.
+        """
+        mapping = cls.ITEM_TYPE_MAPPING
+        type_attribute_names = cls._get_type_attribute_names()
+        if len(type_attribute_names) > 1:
+            return [mapping[cls._get_item_type(item)].from_raw_data(item) for item in items]
+
+        type_attribute_name, = type_attribute_names
+        return [
+            mapping[item[type_attribute_name][STRING_SHORT]].from_raw_data(item)
+            for item in items
+        ]
+
+    @classmethod
+    def _get_type_attribute_names(cls) -> Tuple[str, ...]:
+        """
+        Returns dynamo names of type attributes of models registered to this database.
+        """
+        cached = cls.__dict__.get("_type_attribute_names")
+        if cached is not None and cached[0] == cls._registry_version:
+            return cached[1]
+
+        names = tuple(sorted({
+            model.get_attributes()[model._type_attribute_name].attr_name
+            for model in set(cls.ITEM_TYPE_MAPPING.values())
+            if model._database is cls
+        })) or (DEFAULT_TYPE_ATTRIBUTE_NAME,)
+        cls._type_attribute_names = (cls._registry_version, names)
+        return names
+
+    @classmethod
+    def _get_item_type(cls, item: Dict[str, Any]) -> Optional[str]:
+        """
+        Returns entity name stored in type attribute of raw item or None if it has none.
+        """
+        for type_attribute_name in cls._get_type_attribute_names():
+            value = item.get(type_attribute_name)
+            if value is not None:
+                return value[STRING_SHORT]
+        return None
+
+    @classmethod
+    def _add_type_attributes(cls, attributes_to_get: Optional[List[str]]) -> Optional[List[str]]:
+        """
+        Returns attributes_to_get extended by type attributes so read items can be converted by `from_raw`.
+        """
+        if attributes_to_get is None:
+            return None
+        return list(attributes_to_get) + [
+            name for name in cls._get_type_attribute_names() if name not in attributes_to_get
+        ]
 
     @classmethod
     def get_model(cls, name: str) -> Type[Model]:
@@ -25,3 +133,409 @@ class BaseDatabase:
     def register_model(cls, name, model):
         cls.ITEM_TYPE_MAPPING[name] = model
         setattr(cls, name, model)
+        BaseDatabase._registry_version += 1
+
+    @classmethod
+    def session(cls) -> ContextManager[IdentityMap]:
+        """
+        Context with identity map so each item is loaded at most once.
+
+        Inside the context `Model.get`, ForeignKeyAttribute resolution and
+        `ForeignKeyRelationManager.get` return already loaded instance
+        keyed by (entity type, hash key, range key).
+
+        Example:
+            with Database.session():
+                post.author is other_post.author  # True when both have same author
+        """
+        return identity_map()
+
+    @classmethod
+    def query(
+        cls,
+        hash_key,
+        range_key_condition=None,
+        filter_condition=None,
+        consistent_read=False,
+        index_name=None,
+        scan_index_forward=None,
+        limit=None,
+        last_evaluated_key=None,
+        attributes_to_get=None,
+        page_size=None,
+        rate_limit=None,
+    ) -> ResultIterator:
+        """
+        Query whole item collection regardless of entity type.
+
+        Every returned item is converted into instance of its registered model using `from_raw`
+        so one Query returns e.g. Thread together with all its Posts. Type attributes are always
+        added to `attributes_to_get`.
+
+        Args:
+            hash_key: Serialized hash key value or model instance which item collection should be fetched.
+            range_key_condition: Condition for range key
+            **kwargs: See Model.query for more info on other arguments.
+
+        Returns:
+            ResultIterator of model instances of different types.
+        """
+        if isinstance(hash_key, Model):
+            hash_key = hash_key._serialize(null_check=False)[HASH]
+
+        if page_size is None:
+            page_size = limit
+
+        query_args = (hash_key,)
+        query_kwargs = dict(
+            range_key_condition=range_key_condition,
+            filter_condition=filter_condition,
+            index_name=index_name,
+            exclusive_start_key=last_evaluated_key,
+            consistent_read=consistent_read,
+            scan_index_forward=scan_index_forward,
+            limit=page_size,
+            attributes_to_get=cls._add_type_attributes(attributes_to_get),
+        )
+
+        return ResultIterator(
+            cls._get_connection().query,
+            query_args,
+            query_kwargs,
+            map_fn=cls.from_raw if attributes_to_get is None else cls._from_raw_partial,
+            limit=limit,
+            rate_limit=rate_limit,
+        )
+
+    @classmethod
+    def scan(
+        cls,
+        filter_condition=None,
+        total_segments: int = 1,
+        workers: Optional[int] = None,
+        types: Optional[Iterable[Union[str, Type[Model]]]] = None,
+        page_size=None,
+        consistent_read=None,
+        index_name=None,
+        rate_limit=None,
+        attributes_to_get=None,
+        last_evaluated_keys: Optional[Dict[int, Optional[Dict[str, Any]]]] = None,
+    ) -> ParallelScan:
+        """
+        Parallel segmented scan of whole table regardless of entity type.
+
+        Every segment is scanned from its own worker thread and items are
+        converted into instances of their registered models using `from_raw`
+        as soon as pages arrive.
+
+        Args:
+            filter_condition: Condition used to restrict the scan results
+            total_segments: Number of segments the table is split into
+            workers: Size of thread pool. Defaults to total_segments.
+            types: Entity names or models to keep. Items of other types are filtered out.
+            page_size: Page size of the scan to DynamoDB
+            consistent_read: If True, a consistent read is performed
+            index_name: If set, then this index is used
+            rate_limit: Consumed capacity per second of whole scan, divided evenly between segments.
+            attributes_to_get: If set, specifies the properties to include in the projection expression,
+                type attributes are always included.
+            last_evaluated_keys: Per segment checkpoints to resume from (`ParallelScan.last_evaluated_keys`).
+
+        Returns:
+            ParallelScan - iterable of model instances of different types.
+
+        Example:
+            scan = Database.scan(total_segments=16, types=["Thread"])
+            try:
+                for thread in scan:
+                    ...
+            finally:
+                save_checkpoint(scan.last_evaluated_keys)
+        """
+        if types is not None:
+            type_names = {
+                name if isinstance(name, str) else name._get_entity_name()
+                for name in types
+            }
+            type_condition = None
+            for type_attribute_name in cls._get_type_attribute_names():
+                condition = Path(type_attribute_name).is_in(*type_names)
+                type_condition = condition if type_condition is None else type_condition | condition
+            filter_condition = (
+                type_condition if filter_condition is None else filter_condition & type_condition
+            )
+
+            def item_filter(item):
+                return cls._get_item_type(item) in type_names
+        else:
+            item_filter = None
+
+        return ParallelScan(
+            cls._get_connection(),
+            total_segments,
+            workers=workers,
+            map_fn=cls.from_raw if attributes_to_get is None else cls._from_raw_partial,
+            item_filter=item_filter,
+            rate_limit=rate_limit,
+            last_evaluated_keys=last_evaluated_keys,
+            page_size=page_size,
+            filter_condition=filter_condition,
+            consistent_read=consistent_read,
+            index_name=index_name,
+            attributes_to_get=cls._add_type_attributes(attributes_to_get),
+        )
+
+    @classmethod
+    def batch_get(
+        cls, keys: Iterable[Dict[str, Any]], consistent_read=None, attributes_to_get=None
+    ) -> Iterator[Model]:
+        """
+        BatchGetItem for items of any registered model
+
+        Keys are sent in chunks of 100 (DynamoDB limit) and unprocessed keys are
+        retried with exponential backoff.
+
+        Args:
+            keys: Serialized primary keys as dicts of dynamo attribute name -> value.
+            consistent_read: If True, a consistent read is performed
+            attributes_to_get: If set, only returns these elements and type attributes.
+
+        Returns:
+            Iterator of model instances in no particular order.
+
+        Raises:
+            GetError - When unprocessed keys are left after max_retry_attempts.
+        """
+        keys = list(keys)
+        for start in range(0, len(keys), BATCH_GET_PAGE_LIMIT):
+            keys_to_get = keys[start:start + BATCH_GET_PAGE_LIMIT]
+            retries = 0
+            while keys_to_get:
+                data = cls._get_connection().batch_get_item(
+                    keys_to_get,
+                    consistent_read=consistent_read,
+                    attributes_to_get=cls._add_type_attributes(attributes_to_get),
+                )
+                items = data.get(RESPONSES, {}).get(cls.table_name, [])
+                if attributes_to_get is None:
+                    yield from cls.from_raw_many(items)
+                else:
+                    yield from map(cls._from_raw_partial, items)
+
+                keys_to_get = (
+                    data.get(UNPROCESSED_KEYS, {}).get(cls.table_name, {}).get(KEYS)
+                )
+                if keys_to_get:
+                    retries += 1
+                    if retries >= cls._get_option("max_retry_attempts"):
+                        raise GetError(
+                            "Failed to batch get items: max_retry_attempts exceeded"
+                        )
+                    time.sleep(
+                        random.randint(0, cls._get_option("base_backoff_ms") * (2 ** retries))
+                        / 1000
+                    )
+
+    @classmethod
+    def batch_write(cls, auto_commit: bool = True, workers: Optional[int] = None) -> BatchWrite:
+        """
+        Returns a BatchWrite context manager accepting instances of any registered model.
+
+        Args:
+            auto_commit: If True, the context manager will commit writes incrementally as items
+                are written to honor item count limits in the DynamoDB API. Regardless of the value
+                passed here, changes automatically commit on context exit.
+            workers: If set, full batches are sent from thread pool of this size.
+
+        Example:
+            with Database.batch_write(workers=8) as batch:
+                batch.save(thread)
+                batch.delete(post)
+        """
+        return BatchWrite(cls, auto_commit=auto_commit, workers=workers)
+
+    @classmethod
+    def transaction(
+        cls, max_items: int = TRANSACT_ITEMS_LIMIT, **kwargs
+    ) -> TransactWrite:
+        """
+        Returns a TransactWrite context manager accepting instances of any registered model.
+
+        All collected operations are committed in one TransactWriteItems request on context exit.
+        More than `max_items` operations are split into multiple requests.
+
+        Args:
+            max_items: Maximum number of operations in one request.
+            **kwargs: See pynamodb.transactions.TransactWrite for more info on arguments.
+
+        Example:
+            with Database.transaction() as transaction:
+                transaction.save(thread)
+                transaction.save(post)
+                transaction.update(forum, actions=[Forum.threads.add(1)])
+        """
+        return TransactWrite(cls, max_items=max_items, **kwargs)
+
+    @classmethod
+    def transact_get(
+        cls, max_items: int = TRANSACT_ITEMS_LIMIT, **kwargs
+    ) -> TransactGet:
+        """
+        Returns a TransactGet context manager resolving items through `from_raw`.
+
+        Example:
+            with Database.transact_get() as transaction:
+                thread_future = transaction.get(Thread, "thread")
+            thread = thread_future.get()
+        """
+        return TransactGet(cls, max_items=max_items, **kwargs)
+
+    @classmethod
+    def get_table_schema(cls, plan_projections: bool = True) -> TableSchema:
+        """
+        Returns schema of the table planned from all registered models, see `plan_table_schema`.
+        """
+        return plan_table_schema(cls, plan_projections=plan_projections)
+
+    @classmethod
+    def exists(cls) -> bool:
+        """
+        Returns True if the table exists.
+        """
+        try:
+            cls._get_connection().describe_table()
+            return True
+        except TableDoesNotExist:
+            return False
+
+    @classmethod
+    def create_table(
+        cls,
+        wait: bool = False,
+        read_capacity_units: Optional[int] = None,
+        write_capacity_units: Optional[int] = None,
+        billing_mode: Optional[str] = None,
+        plan_projections: bool = True,
+    ):
+        """
+        Creates the table with keys and indexes of all registered models if it does not exist.
+
+        Args:
+            wait: If True, blocks until the table is active.
+            read_capacity_units: Read capacity of the table and indexes without their own.
+            write_capacity_units: Write capacity of the table and indexes without their own.
+            billing_mode: PROVISIONED or PAY_PER_REQUEST, defaults to `billing_mode` of the database.
+            plan_projections: See `plan_table_schema`.
+
+        Raises:
+            ValueError - When registered models declare conflicting schemas or provisioned
+                billing mode is used without read and write capacity.
+            TableError - When the table can not be created.
+        """
+        if billing_mode is None:
+            billing_mode = getattr(cls, BILLING_MODE_NAME, DEFAULT_BILLING_MODE)
+        if read_capacity_units is None:
+            read_capacity_units = getattr(cls, "read_capacity_units", None)
+        if write_capacity_units is None:
+            write_capacity_units = getattr(cls, "write_capacity_units", None)
+        if billing_mode != PAY_PER_REQUEST_BILLING_MODE and (
+            read_capacity_units is None or write_capacity_units is None
+        ):
+            raise ValueError(
+                f"Billing mode {billing_mode} of {cls.__name__} requires read_capacity_units "
+                "and write_capacity_units."
+            )
+
+        if not cls.exists():
+            schema = cls.get_table_schema(plan_projections=plan_projections)
+            cls._get_connection().create_table(
+                attribute_definitions=[
+                    {pythonic(ATTR_NAME): attr_name, pythonic(ATTR_TYPE): attr_type}
+                    for attr_name, attr_type in schema.attribute_definitions
+                ],
+                key_schema=[
+                    {pythonic(ATTR_NAME): attr_name, pythonic(KEY_TYPE): key_type}
+                    for attr_name, key_type in schema.key_schema
+                ],
+                read_capacity_units=read_capacity_units,
+                write_capacity_units=write_capacity_units,
+                global_secondary_indexes=[
+                    cls._get_index_kwargs(index, billing_mode, read_capacity_units, write_capacity_units)
+                    for index in schema.global_secondary_indexes
+                ],
+                local_secondary_indexes=[
+                    cls._get_index_kwargs(index, billing_mode) for index in schema.local_secondary_indexes
+                ],
+                billing_mode=billing_mode,
+            )
+
+        if wait:
+            while True:
+                status = cls._get_connection().describe_table()
+                if not status:
+                    raise TableError("No TableStatus returned for table")
+                if status.get(TABLE_STATUS) == ACTIVE:
+                    break
+                time.sleep(2)
+
+    @classmethod
+    def delete_table(cls):
+        """
+        Deletes the table with items of all registered models.
+        """
+        return cls._get_connection().delete_table()
+
+    @staticmethod
+    def _get_index_kwargs(
+        index: IndexSchema,
+        billing_mode: str,
+        read_capacity_units: Optional[int] = None,
+        write_capacity_units: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        projection = {PROJECTION_TYPE: index.projection_type}
+        if index.projection_type == INCLUDE:
+            projection[NON_KEY_ATTRIBUTES] = list(index.non_key_attributes)
+        kwargs = {
+            pythonic(INDEX_NAME): index.name,
+            pythonic(KEY_SCHEMA): [
+                {ATTR_NAME: attr_name, KEY_TYPE: key_type} for attr_name, key_type in index.key_schema
+            ],
+            pythonic(PROJECTION): projection,
+        }
+        if index.is_global and billing_mode != PAY_PER_REQUEST_BILLING_MODE:
+            kwargs[pythonic(PROVISIONED_THROUGHPUT)] = {
+                READ_CAPACITY_UNITS: index.read_capacity_units or read_capacity_units,
+                WRITE_CAPACITY_UNITS: index.write_capacity_units or write_capacity_units,
+            }
+        return kwargs
+
+    @classmethod
+    def _get_connection(cls) -> TableConnection:
+        """
+        Returns a (cached) connection to the database table.
+
+        Connection options are read from the database class with fallback to pynamodb settings.
+        """
+        if cls._connection is None:
+            cls._connection = TableConnection(
+                cls.table_name,
+                region=cls._get_option(REGION),
+                host=cls._get_option(HOST),
+                connect_timeout_seconds=cls._get_option("connect_timeout_seconds"),
+                read_timeout_seconds=cls._get_option("read_timeout_seconds"),
+                max_retry_attempts=cls._get_option("max_retry_attempts"),
+                base_backoff_ms=cls._get_option("base_backoff_ms"),
+                max_pool_connections=cls._get_option("max_pool_connections"),
+                extra_headers=cls._get_option("extra_headers"),
+                aws_access_key_id=getattr(cls, "aws_access_key_id", None),
+                aws_secret_access_key=getattr(cls, "aws_secret_access_key", None),
+                aws_session_token=getattr(cls, "aws_session_token", None),
+            )
+        return cls._connection
+
+    @classmethod
+    def _get_option(cls, name: str):
+        """
+        Returns connection option set on the database or pynamodb default.
+        """
+        return getattr(cls, name, get_settings_value(name))
@@ -1,41 +1,158 @@
-from typing import Any, Callable, Optional, Type, Union, TYPE_CHECKING
+import warnings
+import weakref
+from collections import defaultdict
+from typing import Any, Callable, Iterable, Optional, Tuple, Type, Union, TYPE_CHECKING
 
 from pynamodb.attributes import Attribute
 from pynamodb.constants import STRING
 
+from pynamodb_relations.aio import run_in_executor
 from pynamodb_relations.base import RegisterDatabaseLink
+from pynamodb_relations.constans import (
+    RELATED_REFERENCE_NONE,
+    RELATED_REFERENCE_STRONG,
+    RELATED_REFERENCE_WEAK,
+)
+from pynamodb_relations.identity_map import get_identity_map
 
 if TYPE_CHECKING:
     from pynamodb_relations.models import Model
 
 
+# Value of ForwardManyToOneDescriptor._model_ref before the related model is resolved.
+_UNRESOLVED = object()
+
+
 class ForwardRelation:
     pass
 
 
 class ForwardManyToOneDescriptor:
-    method: Callable
+    """
+    Value of ForeignKeyAttribute on model instance.
+
+    Holds only raw key of related item and the attribute which resolves it. How the resolved
+    related model is kept depends on `ForeignKeyAttribute.related_reference`.
+    """
+
+    __slots__ = ("value", "_attribute", "_method", "_model_ref")
+
     value: Any
-    _resolved: bool = False
-    _model: Optional["Model"] = None
-    _attribute: Attribute
+    _attribute: "ForeignKeyAttribute"
+    _method: Optional[Callable]
+    # _UNRESOLVED, resolved model (None for missing item) or weak reference to it.
+    _model_ref: Any
 
     def __init__(
-        self, method: Callable, value: Any, attribute: Attribute, model: "Model" = None
+        self,
+        method: Optional[Callable],
+        value: Any,
+        attribute: "ForeignKeyAttribute",
+        model: "Model" = None,
     ):
-        self.method = method
+        """
+        Args:
+            method: Deprecated, pass None. Get method of related model, defaults to
+                `ForeignKeyAttribute.get_resolver()` shared by all descriptors of the attribute.
+            value: Raw key of related item.
+            attribute: ForeignKeyAttribute this descriptor is value of.
+            model: Already resolved related model.
+        """
+        if method is not None:
+            warnings.warn(
+                "ForwardManyToOneDescriptor method argument is deprecated, "
+                "related model is resolved by ForeignKeyAttribute.get_resolver().",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         self.value = value
         self._attribute = attribute
+        self._method = method
+        self._model_ref = _UNRESOLVED
         if model:
             self._model = model
-            self._resolved = True
+
+    @property
+    def method(self) -> Callable:
+        return self._method or self._attribute.get_resolver()
+
+    @property
+    def _model(self) -> Optional["Model"]:
+        model_ref = self._model_ref
+        if model_ref is _UNRESOLVED:
+            return None
+        if isinstance(model_ref, weakref.ref):
+            return model_ref()
+        return model_ref
+
+    @_model.setter
+    def _model(self, model: Optional["Model"]):
+        related_reference = self._attribute.related_reference
+        if related_reference == RELATED_REFERENCE_NONE:
+            self._model_ref = _UNRESOLVED
+        elif model is not None and related_reference == RELATED_REFERENCE_WEAK:
+            self._model_ref = weakref.ref(model)
+        else:
+            self._model_ref = model
+
+    @property
+    def _resolved(self) -> bool:
+        model_ref = self._model_ref
+        if isinstance(model_ref, weakref.ref):
+            return model_ref() is not None
+        return model_ref is not _UNRESOLVED
+
+    @_resolved.setter
+    def _resolved(self, resolved: bool):
+        if not resolved:
+            self._model_ref = _UNRESOLVED
+
+    def _set_prefetched(self, model: Optional["Model"]):
+        """
+        Stores related model (None for missing item) resolved by `prefetch_related`.
+
+        It is kept for the whole life of the instance regardless of `related_reference`,
+        otherwise weakly held or dropped models would be read again item by item.
+        """
+        self._model_ref = model
 
     def get(self) -> "Model":
+        model_ref = self._model_ref
+        if model_ref is not _UNRESOLVED:
+            if not isinstance(model_ref, weakref.ref):
+                return model_ref
+            model = model_ref()
+            if model is not None:
+                return model
+
+        attribute = self._attribute
+        identity_map = get_identity_map()
+        model = None
+        if identity_map is not None:
+            keys = attribute.get_related_keys(self.value)
+            if keys is not None:
+                model = identity_map.get(attribute.get_related_model(), *keys)
+            if model is None:
+                model = self.method(self.value)
+                # Resolver may return None for missing item, e.g. get-or-None method.
+                if model is not None:
+                    model = identity_map.add(model)
+        else:
+            model = self.method(self.value)
+
+        self._model = model
+        return model
+
+    async def aget(self) -> "Model":
+        """
+        Awaitable counterpart of `get`.
+        """
         if self._resolved:
             return self._model
-        self._model = self.method(self.value)
-        self._resolved = True
-        return self._model
+        return await run_in_executor(self.get)
+
+    def __await__(self):
+        return self.aget().__await__()
 
 
 class ForeignKeyAttribute(Attribute, RegisterDatabaseLink, ForwardRelation):
@@ -45,17 +162,38 @@ class ForeignKeyAttribute(Attribute, RegisterDatabaseLink, ForwardRelation):
     related_model: Union[str, Type["Model"]]
     foreign_attribute: str
 
+    related_reference: str
+    _resolver: Optional[Callable] = None
+
     def __init__(
         self,
         model: Union[str, Type["Model"]],
         *args,
         attribute: str = "uuid",
         get_method: Optional[str] = None,
+        related_reference: str = RELATED_REFERENCE_STRONG,
         **kwargs,
     ):
+        """
+        Args:
+            model: Related model or its entity name.
+            attribute: Attribute of related model stored in this attribute.
+            get_method: Class method of related model used to get it by attribute value.
+                Defaults to `get_by_<attribute>`.
+            related_reference: How resolved related model is kept by the instance:
+                "strong" (default) - for the whole life of the instance,
+                "weak" - only while something else references it,
+                "none" - not kept at all, every access resolves it again.
+                Related models resolved by `prefetch_related` are always kept for the whole life.
+        """
+        if related_reference not in (
+            RELATED_REFERENCE_STRONG, RELATED_REFERENCE_WEAK, RELATED_REFERENCE_NONE
+        ):
+            raise ValueError(f"Unknown related_reference '{related_reference}'.")
         self.related_model = model
         self.related_model_attribute = attribute
         self.related_model_get_method = get_method or f"get_by_{attribute}"
+        self.related_reference = related_reference
 
         super().__init__(*args, **kwargs)
 
@@ -76,15 +214,9 @@ class ForeignKeyAttribute(Attribute, RegisterDatabaseLink, ForwardRelation):
         elif isinstance(value, str):
             return value
         elif isinstance(value, self.get_related_model()):
-            attr_value = getattr(value, self.related_model_attribute)
-            attr = value.get_attributes()[self.related_model_attribute]
-            return attr.serialize(attr_value)
+            return self.get_related_attribute().serialize(getattr(value, self.related_model_attribute))
         elif isinstance(value, ForwardManyToOneDescriptor):
-            return (
-                self.get_related_model()
-                .get_attributes()[self.related_model_attribute]
-                .serialize(value.value)
-            )
+            return self.get_related_attribute().serialize(value.value)
         else:
             raise ValueError(
                 f"Can't serialize unrecognized type {type(value)} for {self.__class__.__name__}."
@@ -94,11 +226,56 @@ class ForeignKeyAttribute(Attribute, RegisterDatabaseLink, ForwardRelation):
         if value is None:
             return None
 
-        return ForwardManyToOneDescriptor(**self.construct_descriptor_kwargs(value))
+        # Descriptor holds python value of related attribute, e.g. without prefix.
+        return ForwardManyToOneDescriptor(
+            **self.construct_descriptor_kwargs(self.get_related_attribute().deserialize(value))
+        )
+
+    def get_related_attribute(self) -> Attribute:
+        """
+        Returns attribute of related model stored in this attribute.
+        """
+        return self.get_related_model().get_attributes()[self.related_model_attribute]
+
+    def get_resolver(self) -> Callable:
+        """
+        Returns related model's get method shared by all descriptors of this attribute.
+        """
+        if self._resolver is None:
+            self._resolver = getattr(self.get_related_model(), self.related_model_get_method)
+        return self._resolver
+
+    def get_related_keys(self, value) -> Optional[Tuple[Any, Any]]:
+        """
+        Returns serialized hash and range key of related item or None if they can not be derived from value.
+
+        Keys can be derived only when related model attribute is its hash key and
+        range key is either static or proxied from the hash key.
+        """
+        related_model = self.get_related_model()
+        if self.related_model_attribute != related_model._hash_keyname:
+            return None
+
+        hash_key, range_key = related_model._serialize_keys(value)
+        if related_model._range_keyname is not None and range_key is None:
+            return None
+
+        return hash_key, range_key
+
+    def get_descriptor(self, instance: "Model") -> Optional[ForwardManyToOneDescriptor]:
+        """
+        Returns unresolved descriptor of this relation on instance.
+
+        Descriptor is awaitable so relation can be resolved without blocking event loop:
+            author = await Post.author.get_descriptor(post)
+        """
+        return instance.attribute_values.get(
+            instance._dynamo_to_python_attrs.get(self.attr_name, self.attr_name)
+        )
 
     def construct_descriptor_kwargs(self, value, model=None):
         return dict(
-            method=getattr(self.get_related_model(), self.related_model_get_method),
+            method=None,
             value=value,
             attribute=self,
             model=model,
@@ -106,7 +283,9 @@ class ForeignKeyAttribute(Attribute, RegisterDatabaseLink, ForwardRelation):
 
     def __set__(self, instance, value):
         if instance:
-            if isinstance(value, str):
+            if value is None:
+                super().__set__(instance, value)
+            elif isinstance(value, str):
                 attr_name = instance._dynamo_to_python_attrs.get(
                     self.attr_name, self.attr_name
                 )
@@ -148,3 +327,75 @@ class ForeignKeyAttribute(Attribute, RegisterDatabaseLink, ForwardRelation):
         if isinstance(x, ForwardManyToOneDescriptor):
             return x.get()
         return x
+
+
+def prefetch_related(instances: Iterable["Model"], *relations: str) -> None:
+    """
+    Resolve ForeignKeyAttribute relations of many instances at once.
+
+    Unresolved related items are loaded with BatchGetItem so later attribute
+    access does not touch DynamoDB. Related items missing in the table resolve
+    to None. Relations which keys can't be derived (see
+    ForeignKeyAttribute.get_related_keys) are resolved one by one.
+
+    Loaded related models are kept by the instances regardless of
+    `ForeignKeyAttribute.related_reference`.
+
+    Args:
+        instances: Model instances to resolve relations on.
+        *relations: Names of ForeignKeyAttribute attributes to resolve.
+
+    Raises:
+        ValueError - When relation is not a ForeignKeyAttribute.
+
+    Example:
+        posts = list(Post.query("thread"))
+        prefetch_related(posts, "author")
+    """
+    identity_map = get_identity_map()
+    pending = defaultdict(list)
+    keys = {}
+    for instance in instances:
+        for relation in relations:
+            attribute = instance.get_attributes().get(relation)
+            if not isinstance(attribute, ForeignKeyAttribute):
+                raise ValueError(
+                    f"{instance.__class__.__name__}.{relation} is not a ForeignKeyAttribute."
+                )
+            descriptor = instance.attribute_values.get(relation)
+            if not isinstance(descriptor, ForwardManyToOneDescriptor) or descriptor._resolved:
+                continue
+
+            related_model = attribute.get_related_model()
+            related_keys = attribute.get_related_keys(descriptor.value)
+            if related_keys is None or (
+                identity_map is not None and identity_map.get(related_model, *related_keys)
+            ):
+                descriptor.get()
+                continue
+            # Related items are matched by serialized keys as returned by BatchGetItem.
+            lookup = (related_model, *related_keys)
+            if lookup not in keys:
+                hash_key, range_key = related_keys
+                serialized_keys = {related_model._hash_key_attribute().attr_name: hash_key}
+                if range_key is not None:
+                    serialized_keys[related_model._range_key_attribute().attr_name] = range_key
+                keys[lookup] = (related_model._database, serialized_keys)
+            pending[lookup].append(descriptor)
+
+    by_database = defaultdict(list)
+    for database, serialized_keys in keys.values():
+        by_database[database].append(serialized_keys)
+
+    for database, serialized_keys in by_database.items():
+        for model in database.batch_get(serialized_keys):
+            if identity_map is not None:
+                model = identity_map.add(model)
+            lookup = (model.__class__, *model._get_serialized_keys())
+            for descriptor in pending.pop(lookup, []):
+                descriptor._set_prefetched(model)
+
+    # Missing related items are memoized like by get method returning None.
+    for descriptors in pending.values():
+        for descriptor in descriptors:
+            descriptor._set_prefetched(None)
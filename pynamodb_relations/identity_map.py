@@ -0,0 +1,75 @@
+"""
+Request scoped identity map of already loaded model instances.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pynamodb_relations.models import Model
+
+_current_identity_map: ContextVar[Optional["IdentityMap"]] = ContextVar(
+    "pynamodb_relations_identity_map", default=None
+)
+
+
+class IdentityMap:
+    """
+    Holds loaded instances keyed by (model class, serialized hash key, serialized range key).
+    """
+
+    _instances: Dict[Tuple[Type["Model"], Any, Any], "Model"]
+
+    def __init__(self):
+        self._instances = {}
+
+    def get(self, model: Type["Model"], hash_key, range_key=None) -> Optional["Model"]:
+        return self._instances.get((model, hash_key, range_key))
+
+    def add(self, instance: "Model", replace: bool = False) -> "Model":
+        """
+        Stores instance under its own keys.
+
+        Args:
+            instance: Loaded model instance.
+            replace: If False already stored instance with same keys is kept.
+
+        Returns:
+            Instance which is stored in the identity map.
+        """
+        key = (instance.__class__, *instance._get_serialized_keys())
+        if replace:
+            self._instances[key] = instance
+            return instance
+        return self._instances.setdefault(key, instance)
+
+    def clear(self):
+        self._instances.clear()
+
+
+def get_identity_map() -> Optional[IdentityMap]:
+    """
+    Returns identity map of current context or None outside of `identity_map()`.
+    """
+    return _current_identity_map.get()
+
+
+@contextmanager
+def identity_map(new: bool = False) -> Iterator[IdentityMap]:
+    """
+    Activates identity map for the current context.
+
+    Args:
+        new: If False nested usage reuses the outer identity map. If True a new identity map
+            is activated for the block, so instances it holds can be released when the block ends.
+    """
+    current = _current_identity_map.get()
+    if current is not None and not new:
+        yield current
+        return
+
+    token = _current_identity_map.set(IdentityMap())
+    try:
+        yield _current_identity_map.get()
+    finally:
+        _current_identity_map.reset(token)
@@ -0,0 +1,360 @@
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple, Type, Union
+
+from pynamodb.attributes import Attribute
+from pynamodb.indexes import Index
+from pynamodb.models import Model
+
+from .aio import run_in_executor
+from .base import RegisterDatabaseLink
+from .identity_map import get_identity_map
+from .reverse_related import (
+    ForeignKeyRelationManager,
+    RelationPlan,
+    ReverseRelation,
+    _is_registered,
+    get_relation_plan,
+)
+from .utils import _get_index, _range_key_attribute
+
+
+class ManyToManyPlan(NamedTuple):
+    """
+    Edge metadata of ManyToManyRelation resolved once both models are registered.
+    """
+    through: Type[Model]
+    # Plan of through model or its inverted index queried for edges of one item.
+    edges: RelationPlan
+    # Python names of through model attributes holding hash key of this and related item.
+    source_key_name: str
+    target_key_name: str
+
+
+class ManyToManyRelationManager:
+    """
+    Manager of edges of one item of ManyToManyRelation.
+
+    Edges are read with one Query (per page) of the item's partition or inverted index,
+    related items are read with BatchGetItem. Changes are written with BatchWriteItem.
+    """
+    related_model: Type[Model]
+    key: Any
+    edges: ForeignKeyRelationManager
+    # Related items memoized by `prefetch`, valid while write generations of through and related model match.
+    _result_cache: Optional[List[Model]] = None
+    _cache_generation: Optional[Tuple[int, int]] = None
+
+    def __init__(self, related_model: Type[Model], key, plan: ManyToManyPlan):
+        self.related_model = related_model
+        self.key = key
+        self.plan = plan
+        self.edges = ForeignKeyRelationManager(plan.edges.related, key, plan.edges)
+
+    def keys(self) -> List[Any]:
+        """
+        Returns hash keys of related items in order of edges.
+
+        Edges are read on every call unless they were memoized by `prefetch`.
+        """
+        target_key_name = self.plan.target_key_name
+        edges = self.edges._get_result_cache()
+        if edges is None:
+            edges = self.edges.query()
+        return [getattr(edge, target_key_name) for edge in edges]
+
+    def count(self) -> int:
+        """
+        Returns number of edges counted by DynamoDB, or of edges memoized by `prefetch`.
+        """
+        return self.edges.count()
+
+    def fetch(self, limit: Optional[int] = None, attributes_to_get=None, consistent_read=None) -> List[Model]:
+        """
+        Returns related items without memoization.
+
+        Args:
+            limit: Maximum number of related items.
+            attributes_to_get: If set, only returns these elements of related items,
+                see `Model._get_projection`.
+            consistent_read: If True, consistent reads are performed.
+
+        Returns:
+            Related items in order of edges. Items missing for dangling edges are skipped.
+        """
+        if limit is None:
+            keys = self.keys()
+        else:
+            target_key_name = self.plan.target_key_name
+            keys = [getattr(edge, target_key_name) for edge in self.edges.query(limit=limit)]
+        return self._get_related(keys, attributes_to_get, consistent_read)
+
+    def all(self) -> List[Model]:
+        """
+        Returns all related items memoized by `prefetch`, otherwise reads them, see `fetch`.
+
+        Memoized items are dropped when edges are changed through any manager or when
+        an instance of related model is saved or deleted in this process.
+        """
+        generation = (self.plan.through._write_generation, self.related_model._write_generation)
+        if self._result_cache is None or self._cache_generation != generation:
+            return self.fetch()
+        return self._result_cache
+
+    def prefetch(self) -> "ManyToManyRelationManager":
+        """
+        Memoizes edges and all related items so `all`, `keys` and `count` do not read them again.
+
+        Returns:
+            This manager.
+        """
+        generation = (self.plan.through._write_generation, self.related_model._write_generation)
+        self.edges.prefetch()
+        self._result_cache = self.fetch()
+        self._cache_generation = generation
+        return self
+
+    def add(self, *objs: Union[Model, Any]):
+        """
+        Adds edges to related items given as instances or hash keys.
+
+        Edges are put without reading existing ones, adding already related item is a no-op.
+        """
+        self._write([self._get_key(obj) for obj in objs], [])
+
+    def remove(self, *objs: Union[Model, Any]):
+        """
+        Removes edges to related items given as instances or hash keys.
+        """
+        self._write([], [self._get_key(obj) for obj in objs])
+
+    def set(self, objs: Iterable[Union[Model, Any]]):
+        """
+        Replaces related items by given instances or hash keys.
+
+        Current edges are read with one Query (per page), only the difference is written.
+        """
+        # Edges may have been changed by other processes since they were memoized.
+        self.edges.clear_cache()
+        current = self.keys()
+        current_keys = set(current)
+        keys = dict.fromkeys(self._get_key(obj) for obj in objs)
+        self._write(
+            [key for key in keys if key not in current_keys],
+            [key for key in current if key not in keys],
+        )
+
+    def clear(self):
+        """
+        Removes all edges of this item.
+        """
+        self.set([])
+
+    async def aall(self) -> List[Model]:
+        """
+        Awaitable counterpart of `all`.
+        """
+        return await run_in_executor(self.all)
+
+    async def aset(self, objs: Iterable[Union[Model, Any]]):
+        """
+        Awaitable counterpart of `set`.
+        """
+        return await run_in_executor(self.set, objs)
+
+    def _get_key(self, obj: Union[Model, Any]):
+        if isinstance(obj, self.related_model):
+            return getattr(obj, obj._hash_keyname)
+        return obj
+
+    def _get_edge(self, key) -> Model:
+        return self.plan.through(**{self.plan.source_key_name: self.key, self.plan.target_key_name: key})
+
+    def _write(self, add: List[Any], remove: List[Any]):
+        if not add and not remove:
+            return
+
+        through = self.plan.through
+        with through._database.batch_write() as batch:
+            for key in add:
+                batch.save(self._get_edge(key))
+            for key in remove:
+                batch.delete(self._get_edge(key))
+
+    def _get_related(self, keys: List[Any], attributes_to_get=None, consistent_read=None) -> List[Model]:
+        related_model = self.related_model
+        identity_map = get_identity_map()
+        range_key_attribute = related_model._range_key_attribute()
+        serialized_keys = []
+        for key in keys:
+            hash_key, range_key = related_model._serialize_keys(key)
+            if range_key_attribute is not None and range_key is None:
+                raise ValueError(
+                    f"ManyToManyRelation can not read {related_model.__name__} as its range key "
+                    "can not be derived from hash key."
+                )
+            serialized_keys.append((hash_key, range_key))
+
+        found: Dict[Tuple[Any, Any], Model] = {}
+        to_get = []
+        for hash_key, range_key in dict.fromkeys(serialized_keys):
+            instance = (
+                identity_map.get(related_model, hash_key, range_key) if identity_map is not None else None
+            )
+            if instance is not None:
+                found[hash_key, range_key] = instance
+                continue
+            item_keys = {related_model._hash_key_attribute().attr_name: hash_key}
+            if range_key_attribute is not None:
+                item_keys[range_key_attribute.attr_name] = range_key
+            to_get.append(item_keys)
+
+        if to_get:
+            for instance in related_model._database.batch_get(
+                to_get, consistent_read=consistent_read, attributes_to_get=attributes_to_get
+            ):
+                # Partial instances are kept out of the identity map.
+                if identity_map is not None and attributes_to_get is None:
+                    instance = identity_map.add(instance)
+                found[instance._get_serialized_keys()] = instance
+
+        return [found[key] for key in serialized_keys if key in found]
+
+
+class ManyToManyRelation(ReverseRelation, RegisterDatabaseLink):
+    """
+    Many-to-many relation stored as edge items using the adjacency list pattern.
+
+    Edge is an item of `through` model which hash key holds this object's hash key and
+    range key holds related item's hash key, so edges are stored in this object's partition.
+    The other side of the relation reads the same edges through an inverted index of
+    `through` model which hash key is the edge's range key.
+
+    Related items are read by hash key only, so their range key has to be static or
+    proxied from the hash key.
+
+    Example:
+        class MembershipInvertedIndex(GlobalSecondaryIndex):
+            class Meta:
+                index_name = "inverted"
+                projection = KeysOnlyProjection()
+
+            sk = PrefixedUnicodeAttribute("USER#", hash_key=True)
+            pk = PrefixedUnicodeAttribute("GROUP#", range_key=True)
+
+        class Membership(Model):
+            pk = PrefixedUnicodeAttribute("GROUP#", hash_key=True)
+            sk = PrefixedUnicodeAttribute("USER#", range_key=True)
+            inverted = MembershipInvertedIndex()
+
+        class Group(Model):
+            pk = PrefixedUnicodeAttribute("GROUP#", hash_key=True)
+            sk = StaticUnicodeAttribute("GROUP", range_key=True)
+            members = ManyToManyRelation("User", through="Membership")
+
+        class User(Model):
+            pk = PrefixedUnicodeAttribute("USER#", hash_key=True)
+            sk = StaticUnicodeAttribute("USER", range_key=True)
+            groups = ManyToManyRelation("Group", through="Membership", index="inverted")
+
+        group.members.set([user1, user2])
+        user1.groups.all()
+    """
+
+    related_model: Union[str, Type[Model]]
+    through: Union[str, Type[Model]]
+    index: Optional[str] = None
+    owner: Optional[Type[Model]] = None
+    name: Optional[str] = None
+    _plan: Optional[ManyToManyPlan] = None
+
+    def __init__(
+        self, model: Union[str, Type[Model]], through: Union[str, Type[Model]], index: Optional[str] = None
+    ):
+        """
+        Args:
+            model: Related model or its entity name.
+            through: Model of edge items or its entity name.
+            index: Name of through model's index which hash key holds this object's hash key,
+                used by the inverse side of the relation.
+        """
+        self.related_model = model
+        self.through = through
+        self.index = index
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def contribute_to_class(self, owner: Type[Model]):
+        self.owner = owner
+
+    def prepare(self):
+        if (
+            self._plan is None
+            and _is_registered(self._database, self.related_model)
+            and _is_registered(self._database, self.through)
+        ):
+            self.get_plan()
+
+    def get_index_projection(self) -> Optional[Tuple[str, Optional[FrozenSet[str]]]]:
+        # Edges are read only for their keys.
+        return (self.index, frozenset()) if self.index else None
+
+    def _resolve(self, model: Union[str, Type[Model]]) -> Type[Model]:
+        if isinstance(model, str):
+            if self._database is None:
+                raise AssertionError(
+                    "ManyToManyRelation have model name supplied but was not hooked "
+                    "up to the registry by BaseDatabase.register."
+                )
+            return self._database.get_model(model)
+        return model
+
+    def get_related_model(self) -> Type[Model]:
+        self.related_model = self._resolve(self.related_model)
+        return self.related_model
+
+    def get_through_model(self) -> Type[Model]:
+        self.through = self._resolve(self.through)
+        return self.through
+
+    def get_plan(self) -> ManyToManyPlan:
+        plan = self._plan
+        if plan is None:
+            through = self.get_through_model()
+            edges: Union[Type[Model], Index] = through
+            if self.index:
+                edges = _get_index(through, self.index)
+                source: Attribute = edges._hash_key_attribute()
+                target: Optional[Attribute] = _range_key_attribute(edges)
+            else:
+                source = through._hash_key_attribute()
+                target = through._range_key_attribute()
+            if target is None:
+                raise ValueError(
+                    f"ManyToManyRelation {self.name} requires range key on {through.__name__} "
+                    "(or its index) holding hash key of related item."
+                )
+            plan = self._plan = ManyToManyPlan(
+                through,
+                get_relation_plan(edges),
+                through._dynamo_to_python_attr(source.attr_name),
+                through._dynamo_to_python_attr(target.attr_name),
+            )
+        return plan
+
+    def __get__(self, instance: Optional[Model], owner):
+        if instance is None:
+            return self
+
+        hash_key = getattr(instance, instance._hash_keyname)
+        managers = instance._relation_managers
+        if managers is None:
+            managers = instance._relation_managers = {}
+        manager = managers.get(self.name)
+        if manager is not None and manager.key == hash_key:
+            return manager
+
+        manager = managers[self.name] = ManyToManyRelationManager(
+            self.get_related_model(), hash_key, self._plan or self.get_plan()
+        )
+        return manager
@@ -1,13 +1,13 @@
 from inspect import getmembers
-from typing import Type, TYPE_CHECKING
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, TYPE_CHECKING
 
 from pynamodb.attributes import Attribute, MapAttribute
 from pynamodb.connection.util import pythonic
 from pynamodb.constants import (
     ATTR_TYPE_MAP,
     ATTRIBUTES,
+    ITEM,
     META_CLASS_NAME,
-    NULL,
     REGION,
 )
 from pynamodb.models import (
@@ -15,26 +15,104 @@ from pynamodb.models import (
     MetaModel as PynamoMetaModel,
     Model as PynamoModel,
 )
+from pynamodb.exceptions import TransactWriteError
+from pynamodb.pagination import ResultIterator
 from pynamodb.types import HASH, RANGE
 from six import add_metaclass
 
+from pynamodb_relations.aio import run_in_executor
 from pynamodb_relations.base import RegisterDatabaseLink
 from pynamodb_relations.constans import (
     BILLING_MODE_NAME,
+    CONDITIONAL_CHECK_FAILED,
     DATABASE_NAME,
     DEFAULT_TYPE_ATTRIBUTE_NAME,
     DEFAULT_TYPE_ATTRIBUTE_PYTHON_NAME,
     ENTITY_NAME,
     TABLE_NAME,
+    TRANSACTION_CANCELED,
 )
-from pynamodb_relations.forward_related import ForwardRelation
-from pynamodb_relations.reverse_related import ReverseRelation
-from .attributes import ProxiedAttributeMixin, TypeAttribute
+from pynamodb_relations.forward_related import ForeignKeyAttribute, ForwardRelation
+from pynamodb_relations.reverse_related import PrimaryKeyReverseForeignKeyRelation, ReverseRelation
+from pynamodb_relations.transactions import get_cancellation_reasons
+from .attributes import ProxiedAttributeMixin, StaticUnicodeAttribute, TypeAttribute
+from .identity_map import get_identity_map
+from .scan import ParallelScan
+from .utils import _get_index
 
 if TYPE_CHECKING:
     from pynamodb_relations.database import BaseDatabase
 
 
+class AttributePlan(NamedTuple):
+    """
+    Precomputed information needed to serialize one attribute.
+    """
+
+    name: str
+    attr_name: str
+    attribute: Attribute
+    serialize: Callable[[Any], Any]
+    attr_type: str  # Short DynamoDB type e.g. "S"
+    key_role: Optional[str]  # HASH, RANGE or None
+    proxied: bool
+    is_map: bool
+
+
+def _build_serialization_plan(cls) -> Tuple[AttributePlan, ...]:
+    plan = []
+    for name, attribute in cls.get_attributes().items():
+        if attribute.is_hash_key:
+            key_role = HASH
+        elif attribute.is_range_key:
+            key_role = RANGE
+        else:
+            key_role = None
+        plan.append(
+            AttributePlan(
+                name=name,
+                attr_name=attribute.attr_name,
+                attribute=attribute,
+                serialize=attribute.serialize,
+                attr_type=ATTR_TYPE_MAP[attribute.attr_type],
+                key_role=key_role,
+                proxied=isinstance(attribute, ProxiedAttributeMixin),
+                is_map=isinstance(attribute, MapAttribute),
+            )
+        )
+    return tuple(plan)
+
+
+def _build_deserialization_plan(cls) -> Dict[str, Tuple[str, Callable[[Any], Any], str, bool]]:
+    """
+    Returns mapping of dynamo name -> (python name, deserializer, short type, use setattr).
+
+    Attributes which `__set__` does more than storing the value are set using setattr.
+    """
+    plan = {}
+    for name, attribute in cls.get_attributes().items():
+        use_setattr = type(attribute).__set__ not in (
+            Attribute.__set__,
+            ForeignKeyAttribute.__set__,
+        )
+        plan[attribute.attr_name] = (
+            name,
+            attribute.deserialize,
+            ATTR_TYPE_MAP[attribute.attr_type],
+            use_setattr,
+        )
+    return plan
+
+
+def _prepare_relations(database: Type["BaseDatabase"]):
+    """
+    Lets every reverse relation in database resolve models registered so far.
+    """
+    for model in set(database.ITEM_TYPE_MAPPING.values()):
+        for relation in model.get_reverse_relations().values():
+            relation.prepare()
+
+
 class MetaModel(PynamoMetaModel):
     def __init__(cls: "PynamoModel", name, bases, attrs):
         super().__init__(name, bases, attrs)
@@ -91,7 +169,7 @@ class MetaModel(PynamoMetaModel):
                             )
                         )
                     cls._type_attribute_name = attr_name
-                    attribute.static_value = getattr(
+                    attribute.static_value = attribute.default = getattr(
                         attrs[META_CLASS_NAME], ENTITY_NAME
                     )
 
@@ -114,9 +192,34 @@ class MetaModel(PynamoMetaModel):
                     DEFAULT_TYPE_ATTRIBUTE_NAME
                 ] = DEFAULT_TYPE_ATTRIBUTE_PYTHON_NAME
 
+        cls._serialization_plan = _build_serialization_plan(cls)
+        cls._proxied_attributes_plan = tuple(
+            entry for entry in cls._serialization_plan if entry.proxied
+        )
+        cls._deserialization_plan = _build_deserialization_plan(cls)
+        cls._defaults_plan = tuple(
+            (name, attribute.default)
+            for name, attribute in cls.get_attributes().items()
+            if attribute.default is not None
+        )
+
+        if attrs[META_CLASS_NAME] is not DefaultMeta:
+            for relation in cls._reverse_relations.values():
+                relation.contribute_to_class(cls)
+            _prepare_relations(cls._database)
+
 
 @add_metaclass(MetaModel)
 class Model(PynamoModel):
+    # True for instances loaded with attributes_to_get, they can not be saved.
+    _partial: bool = False
+    # Reverse relation managers cached by PrimaryKeyReverseForeignKeyRelation, keyed by relation name.
+    _relation_managers: Optional[Dict[str, Any]] = None
+    # Incremented by every save or delete of this model's instance, invalidates memoized relation results.
+    _write_generation: int = 0
+    # True for instances loaded from or saved to dynamodb, they are saved without counting relations.
+    _persisted: bool = False
+
     def _serialize(self, attr_map=False, null_check=True):
         """
         Serializes all model attributes for use with DynamoDB
@@ -126,29 +229,31 @@ class Model(PynamoModel):
         """
         attributes = pythonic(ATTRIBUTES)
         attrs = {attributes: {}}
-        for name, attr in self.get_attributes().items():
-            value = getattr(self, name)
-            if isinstance(attr, ProxiedAttributeMixin):
+        serialized_attributes = attrs[attributes]
+        attribute_values = self.attribute_values
+        for name, attr_name, attr, serialize, attr_type, key_role, proxied, is_map in (
+            self._serialization_plan
+        ):
+            # Read attribute_values directly so ForeignKeyAttribute is not resolved.
+            value = attribute_values.get(name)
+            if proxied:
                 value = attr.get_proxy_value(self, value)
-            if isinstance(value, MapAttribute):
+            if is_map and isinstance(value, MapAttribute):
                 if not value.validate():
                     raise ValueError(
-                        "Attribute '{}' is not correctly typed".format(attr.attr_name)
+                        "Attribute '{}' is not correctly typed".format(attr_name)
                     )
 
-            serialized = self._serialize_value(attr, value, null_check)
-            if NULL in serialized:
+            serialized = None if value is None else serialize(value)
+            if serialized is None:
+                if null_check and not attr.null:
+                    raise ValueError("Attribute '{}' cannot be None".format(attr_name))
                 continue
 
-            if attr_map:
-                attrs[attributes][attr.attr_name] = serialized
+            if attr_map or key_role is None:
+                serialized_attributes[attr_name] = {attr_type: serialized}
             else:
-                if attr.is_hash_key:
-                    attrs[HASH] = serialized[ATTR_TYPE_MAP[attr.attr_type]]
-                elif attr.is_range_key:
-                    attrs[RANGE] = serialized[ATTR_TYPE_MAP[attr.attr_type]]
-                else:
-                    attrs[attributes][attr.attr_name] = serialized
+                attrs[key_role] = serialized
 
         return attrs
 
@@ -160,12 +265,236 @@ class Model(PynamoModel):
         """
         super(Model, self)._set_attributes(**attributes)
 
-        for name, attr in [
-            (name, attr)
-            for name, attr in self.get_attributes().items()
-            if isinstance(attr, ProxiedAttributeMixin)
-        ]:
-            setattr(self, name, attr.get_proxy_value(self, getattr(self, name, None)))
+        for entry in self._proxied_attributes_plan:
+            setattr(
+                self,
+                entry.name,
+                entry.attribute.get_proxy_value(self, getattr(self, entry.name, None)),
+            )
+
+    @classmethod
+    def _from_raw_partial_data(cls, data):
+        """
+        Returns an instance loaded with attributes_to_get from the raw data
+        """
+        instance = cls.from_raw_data(data)
+        instance._partial = True
+        return instance
+
+    def _check_complete(self):
+        """
+        Raises ValueError if this instance was loaded with attributes_to_get.
+        """
+        if self._partial:
+            raise ValueError(
+                f"{self.__class__.__name__} instance was loaded with attributes_to_get and can not be saved. "
+                "Refresh it first."
+            )
+
+    def save(self, condition=None):
+        """
+        Save this object to dynamodb
+
+        If this object is counted by a relation with counter (see `PrimaryKeyReverseForeignKeyRelation`)
+        and was not loaded from or saved to dynamodb yet, it is put in one transaction with atomic
+        increment of the counter. When the item already exists it is saved without counting.
+
+        :raises ValueError: if this instance was loaded with attributes_to_get
+        :raises pynamodb.exceptions.TransactWriteError: if parent of counting relation does not exist
+        """
+        self._check_complete()
+        counted_relations = self._get_counted_relations() if not self._persisted else None
+        if counted_relations:
+            not_exists = self._hash_key_attribute().does_not_exist()
+            transaction = self._database.transaction()
+            transaction.save(self, condition=not_exists if condition is None else condition & not_exists)
+            for relation in counted_relations:
+                relation.add_to_counter(transaction, self, 1)
+            try:
+                result = transaction.commit()[0]
+            except TransactWriteError as e:
+                if not self._own_condition_failed(e, exists=False):
+                    raise
+                # Item already exists (or condition failed), it is saved without counting.
+            else:
+                # Transaction marked the instance as written.
+                return result
+        result = super(Model, self).save(condition=condition)
+        self._written(persisted=True)
+        return result
+
+    def delete(self, condition=None):
+        """
+        Deletes this object from dynamodb
+
+        If this object is counted by a relation with counter (see `PrimaryKeyReverseForeignKeyRelation`)
+        existing item is deleted in one transaction with atomic decrement of the counter.
+
+        :raises pynamodb.exceptions.DeleteError: If the record can not be deleted
+        :raises pynamodb.exceptions.TransactWriteError: if parent of counting relation does not exist
+        """
+        counted_relations = self._get_counted_relations()
+        if counted_relations:
+            exists = self._hash_key_attribute().exists()
+            transaction = self._database.transaction()
+            transaction.delete(self, condition=exists if condition is None else condition & exists)
+            for relation in counted_relations:
+                relation.add_to_counter(transaction, self, -1)
+            try:
+                result = transaction.commit()[0]
+            except TransactWriteError as e:
+                if not self._own_condition_failed(e, exists=True):
+                    raise
+                # Item does not exist (or condition failed), it is deleted without counting.
+            else:
+                # Transaction marked the instance as written.
+                return result
+        result = super(Model, self).delete(condition=condition)
+        self._written(persisted=False)
+        return result
+
+    def _own_condition_failed(self, error: TransactWriteError, exists: bool) -> bool:
+        """
+        Returns True if counting transaction failed only because of the condition on the item itself.
+
+        The item is the first operation of the transaction, followed by counter updates.
+        Pynamodb keeps cancellation reasons only of some responses, without them the item
+        is read to tell whether its own condition failed.
+
+        :param exists: Whether the item's condition in the transaction requires it to exist
+        """
+        reasons = get_cancellation_reasons(error)
+        if reasons:
+            return reasons[0] == CONDITIONAL_CHECK_FAILED and not any(reasons[1:])
+        if error.cause_response_code != TRANSACTION_CANCELED:
+            return False
+        hash_key, range_key = self._get_serialized_keys()
+        data = self._get_connection().get_item(
+            hash_key,
+            range_key=range_key,
+            consistent_read=True,
+            attributes_to_get=[self._hash_key_attribute().attr_name],
+        )
+        return bool(data.get(ITEM)) != exists
+
+    def update(self, actions, condition=None):
+        """
+        Updates an item using the UpdateItem operation.
+
+        :param actions: a list of Action updates to apply
+        :param condition: an optional Condition on which to update
+        :raises ModelInstance.DoesNotExist: if the object to be updated does not exist
+        :raises pynamodb.exceptions.UpdateError: if the `condition` is not met
+        """
+        result = super(Model, self).update(actions, condition=condition)
+        self._written(persisted=True)
+        return result
+
+    def _written(self, persisted: Optional[bool] = None):
+        """
+        Invalidates memoized reverse relations of this instance and of parents relating to this model.
+
+        :param persisted: If set, whether the item exists in dynamodb after the write
+        """
+        self._bump_write_generation()
+        self._relation_managers = None
+        if persisted is not None:
+            self._persisted = persisted
+
+    @classmethod
+    def _bump_write_generation(cls):
+        """
+        Invalidates relation results memoized for items of this model.
+
+        Called by `save` and `delete` and by writes bypassing them, e.g. batch writes of edges.
+        """
+        cls._write_generation = cls._write_generation + 1
+
+    @classmethod
+    def _get_counted_relations(cls) -> List[PrimaryKeyReverseForeignKeyRelation]:
+        """
+        Returns relations with counter of other models which relate to this model.
+        """
+        database = cls._database
+        if database is None:
+            return []
+        cached = cls.__dict__.get("_counted_relations")
+        if cached is not None and cached[0] == database._registry_version:
+            return cached[1]
+
+        counted_relations = [
+            relation
+            for model in set(database.ITEM_TYPE_MAPPING.values())
+            if getattr(model, "_database", None) is database
+            for relation in model.get_reverse_relations().values()
+            if getattr(relation, "counter", None) is not None and relation.get_related_model() is cls
+        ]
+        cls._counted_relations = (database._registry_version, counted_relations)
+        return counted_relations
+
+    def refresh(self, consistent_read=False):
+        """
+        Retrieves this object's data from dynamodb and syncs this local object
+
+        :param consistent_read: If True, then a consistent read is performed.
+        :raises ModelInstance.DoesNotExist: if the object to be updated does not exist
+        """
+        super(Model, self).refresh(consistent_read=consistent_read)
+        self._partial = False
+        self._persisted = True
+        self._relation_managers = None
+
+    @classmethod
+    def from_raw_data(cls, data):
+        """
+        Returns an instance of this class from the raw data
+
+        Uses deserialization plan compiled by MetaModel instead of resolving attributes for every item.
+        The instance is created without calling `__init__` unless the model overrides it, in which case
+        it is called with `_user_instantiated=False` like in pynamodb.
+
+        :param data: A serialized DynamoDB object
+        """
+        if data is None:
+            raise ValueError("Received no data to construct object")
+
+        if cls.__init__ is not PynamoModel.__init__:
+            attributes = {}
+            for dynamo_name, raw_value in data.items():
+                entry = cls._deserialization_plan.get(dynamo_name)
+                if entry is not None:
+                    attributes[entry[0]] = entry[1](raw_value.get(entry[2]))
+            instance = cls(_user_instantiated=False, **attributes)
+            instance._persisted = True
+            return instance
+
+        instance = cls.__new__(cls)
+        instance._persisted = True
+        attribute_values = instance.attribute_values = {}
+        for name, default in cls._defaults_plan:
+            value = default() if callable(default) else default
+            if value is not None:
+                setattr(instance, name, value)
+
+        deserialization_plan = cls._deserialization_plan
+        for dynamo_name, raw_value in data.items():
+            entry = deserialization_plan.get(dynamo_name)
+            if entry is None:
+                continue
+            name, deserialize, attr_type, use_setattr = entry
+            value = deserialize(raw_value.get(attr_type))
+            if use_setattr:
+                setattr(instance, name, value)
+            else:
+                attribute_values[name] = value
+
+        for entry in cls._proxied_attributes_plan:
+            setattr(
+                instance,
+                entry.name,
+                entry.attribute.get_proxy_value(instance, attribute_values.get(entry.name)),
+            )
+        return instance
 
     @classmethod
     def _serialize_keys(cls, hash_key, range_key=None):
@@ -175,6 +504,11 @@ class Model(PynamoModel):
 
         range_key_attr: Attribute = cls._range_key_attribute()
         if range_key_attr is not None and serialized_range_key is None:
+            if isinstance(range_key_attr, StaticUnicodeAttribute):
+                return (
+                    serialized_hash_key,
+                    range_key_attr.serialize(range_key_attr.static_value),
+                )
             if isinstance(range_key_attr, ProxiedAttributeMixin):
                 if range_key_attr.only_default:
                     return serialized_hash_key, range_key
@@ -188,6 +522,138 @@ class Model(PynamoModel):
 
         return serialized_hash_key, serialized_range_key
 
+    def _get_serialized_keys(self):
+        """
+        Returns serialized hash key and range key of this instance.
+
+        Values are taken directly from attribute_values so relations are not resolved.
+        """
+        hash_key = self._hash_key_attribute().serialize(
+            self.attribute_values.get(self._hash_keyname)
+        )
+        if self._range_keyname is None:
+            return hash_key, None
+        return (
+            hash_key,
+            self._range_key_attribute().serialize(
+                self.attribute_values.get(self._range_keyname)
+            ),
+        )
+
+    @classmethod
+    def get(
+        cls, hash_key, range_key=None, consistent_read=False, attributes_to_get=None,
+    ):
+        """
+        Returns a single object using the provided keys
+
+        Inside `BaseDatabase.session()` already loaded instance is returned without
+        request to DynamoDB. Consistent read always fetches the item again.
+
+        :param hash_key: The hash key of the desired item
+        :param range_key: The range key of the desired item, only used when appropriate.
+        :param consistent_read:
+        :param attributes_to_get:
+        :raises ModelInstance.DoesNotExist: if the object to be updated does not exist
+        """
+        if attributes_to_get is not None:
+            instance = super(Model, cls).get(
+                hash_key,
+                range_key=range_key,
+                consistent_read=consistent_read,
+                attributes_to_get=attributes_to_get,
+            )
+            instance._partial = True
+            return instance
+
+        identity_map = get_identity_map()
+        if identity_map is None:
+            return super(Model, cls).get(hash_key, range_key=range_key, consistent_read=consistent_read)
+
+        if not consistent_read:
+            instance = identity_map.get(cls, *cls._serialize_keys(hash_key, range_key))
+            if instance is not None:
+                return instance
+
+        return identity_map.add(
+            super(Model, cls).get(hash_key, range_key=range_key, consistent_read=consistent_read),
+            replace=consistent_read,
+        )
+
+    @classmethod
+    def query(
+        cls,
+        hash_key,
+        range_key_condition=None,
+        filter_condition=None,
+        consistent_read=False,
+        index_name=None,
+        scan_index_forward=None,
+        limit=None,
+        last_evaluated_key=None,
+        attributes_to_get=None,
+        page_size=None,
+        rate_limit=None,
+    ):
+        """
+        Provides a high level query API
+
+        Instances loaded with attributes_to_get can not be saved.
+
+        :param hash_key: The hash key to query
+        :param range_key_condition: Condition for range key
+        :param filter_condition: Condition used to restrict the query results
+        :param consistent_read: If True, a consistent read is performed
+        :param index_name: If set, then this index is used
+        :param limit: Used to limit the number of results returned
+        :param scan_index_forward: If set, then used to specify the same parameter to the DynamoDB API.
+            Controls descending or ascending results
+        :param last_evaluated_key: If set, provides the starting point for query.
+        :param attributes_to_get: If set, only returns these elements
+        :param page_size: Page size of the query to DynamoDB
+        :param rate_limit: If set then consumed capacity will be limited to this amount per second
+        """
+        if index_name:
+            hash_key = _get_index(cls, index_name)._hash_key_attribute().serialize(hash_key)
+        else:
+            hash_key = cls._serialize_keys(hash_key)[0]
+
+        if page_size is None:
+            page_size = limit
+
+        return ResultIterator(
+            cls._get_connection().query,
+            (hash_key,),
+            dict(
+                range_key_condition=range_key_condition,
+                filter_condition=filter_condition,
+                index_name=index_name,
+                exclusive_start_key=last_evaluated_key,
+                consistent_read=consistent_read,
+                scan_index_forward=scan_index_forward,
+                limit=page_size,
+                attributes_to_get=attributes_to_get,
+            ),
+            map_fn=cls.from_raw_data if attributes_to_get is None else cls._from_raw_partial_data,
+            limit=limit,
+            rate_limit=rate_limit,
+        )
+
+    @classmethod
+    async def aget(
+        cls, hash_key, range_key=None, consistent_read=False, attributes_to_get=None,
+    ):
+        """
+        Awaitable counterpart of `get`.
+        """
+        return await run_in_executor(
+            cls.get,
+            hash_key,
+            range_key=range_key,
+            consistent_read=consistent_read,
+            attributes_to_get=attributes_to_get,
+        )
+
     @classmethod
     def scan(
         cls,
@@ -201,9 +667,14 @@ class Model(PynamoModel):
         index_name=None,
         rate_limit=None,
         attributes_to_get=None,
+        workers=None,
+        prefetch_pages=None,
     ):
         """
-        Iterates through all items in the table
+        Iterates through all items of this model in the table
+
+        Items are filtered server side by the type attribute so items of other entities
+        are never returned.
 
         :param filter_condition: Condition used to restrict the scan results
         :param segment: If set, then scans the segment
@@ -215,8 +686,61 @@ class Model(PynamoModel):
         :param index_name: If set, then this index is used
         :param rate_limit: If set then consumed capacity will be limited to this amount per second
         :param attributes_to_get: If set, specifies the properties to include in the projection expression
+        :param workers: If set, segments (all of total_segments or only `segment`) are scanned
+            from thread pool of this size. Returns ParallelScan.
+        :param prefetch_pages: If set, up to this number of pages are fetched in background
+            while the current one is processed. Returns ParallelScan.
         """
-        raise NotImplementedError("Scan is not yet implemented.")
+        type_attribute = cls.get_attributes()[cls._type_attribute_name]
+        type_condition = type_attribute == type_attribute.static_value
+        if filter_condition is None:
+            filter_condition = type_condition
+        else:
+            filter_condition = filter_condition & type_condition
+
+        if page_size is None:
+            page_size = limit
+
+        scan_kwargs = dict(
+            filter_condition=filter_condition,
+            consistent_read=consistent_read,
+            index_name=index_name,
+            attributes_to_get=attributes_to_get,
+        )
+
+        if workers or prefetch_pages:
+            if workers and total_segments is None:
+                raise ValueError("total_segments must be set to scan with workers")
+            return ParallelScan(
+                cls._get_connection(),
+                total_segments or 1,
+                segments=None if segment is None else [segment],
+                workers=workers or 1,
+                map_fn=cls.from_raw_data if attributes_to_get is None else cls._from_raw_partial_data,
+                rate_limit=rate_limit,
+                last_evaluated_keys=(
+                    None if last_evaluated_key is None else {segment or 0: last_evaluated_key}
+                ),
+                max_prefetched_pages=prefetch_pages,
+                page_size=page_size,
+                limit=limit,
+                **scan_kwargs,
+            )
+
+        return ResultIterator(
+            cls._get_connection().scan,
+            (),
+            dict(
+                scan_kwargs,
+                exclusive_start_key=last_evaluated_key,
+                segment=segment,
+                total_segments=total_segments,
+                limit=page_size,
+            ),
+            map_fn=cls.from_raw_data if attributes_to_get is None else cls._from_raw_partial_data,
+            limit=limit,
+            rate_limit=rate_limit,
+        )
 
     @classmethod
     def create_table(
@@ -255,6 +779,34 @@ class Model(PynamoModel):
         """
         raise NotImplementedError("Not implemented yet.")
 
+    @classmethod
+    def _get_entity_name(cls) -> str:
+        """
+        Returns entity name stored in the type attribute of every item of this model.
+        """
+        return cls.get_attributes()[cls._type_attribute_name].static_value
+
+    @classmethod
+    def _get_projection(cls, attributes: Iterable[str]) -> List[str]:
+        """
+        Returns dynamo names of attributes for `attributes_to_get`.
+
+        Keys and type attribute are always included so projected items can be identified
+        and converted into instances of the right model.
+        """
+        names = [cls._hash_keyname, cls._range_keyname, cls._type_attribute_name, *attributes]
+        model_attributes = cls.get_attributes()
+        projection = []
+        for name in names:
+            if name is None:
+                continue
+            if name not in model_attributes:
+                raise ValueError(f"{cls.__name__} has no attribute '{name}'.")
+            attr_name = model_attributes[name].attr_name
+            if attr_name not in projection:
+                projection.append(attr_name)
+        return projection
+
     @classmethod
     def get_forward_relations(cls):
         return cls._forward_relations
@@ -1,25 +1,217 @@
-from typing import Any, Optional, Type, Union
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
 
+from pynamodb.attributes import Attribute
+from pynamodb.constants import ITEMS
+from pynamodb.expressions.condition import Condition
 from pynamodb.indexes import Index
 from pynamodb.models import Model
 from pynamodb.pagination import ResultIterator
 
 from . import attributes
+from .aio import AsyncPageIterator, run_in_executor
 from .base import RegisterDatabaseLink
-from .utils import _range_key_attribute
+from .utils import _get_index, _range_key_attribute
 
 
 class ReverseRelation:
-    pass
+    def contribute_to_class(self, owner: Type[Model]):
+        """
+        Resolves metadata depending only on the owner, called by MetaModel when the owner is created.
+        """
+
+    def prepare(self):
+        """
+        Resolves metadata depending on other models, called by MetaModel whenever a model is registered.
+        """
+
+    def get_index_projection(self) -> Optional[Tuple[str, Optional[FrozenSet[str]]]]:
+        """
+        Returns name of index this relation reads and dynamo names of attributes it reads
+        (None for whole items), None if it does not read any index. Used by schema planner.
+        """
+        return None
+
+
+class RelationPage(NamedTuple):
+    items: List[Model]
+    # Cursor of the next page, None when there are no more items.
+    last_evaluated_key: Optional[Dict[str, Any]]
+
+
+class RelationPlan(NamedTuple):
+    """
+    Key metadata of a model or index queried by relation managers, resolved once per class.
+    """
+    related: Union[Type[Model], Type[Index]]
+    model: Type[Model]
+    range_key_attribute: Optional[Attribute]
+    # Condition matching every item of the hash key, None if it can not be guessed.
+    range_key_condition: Optional[Condition]
+
+
+def _is_registered(database, model: Union[str, Type[Model]]) -> bool:
+    """
+    Returns True if model given by class or entity name can be resolved.
+    """
+    if isinstance(model, str):
+        return database is not None and model in database.ITEM_TYPE_MAPPING
+    return True
+
+
+def get_relation_plan(related: Union[Type[Model], Type[Index]]) -> RelationPlan:
+    """
+    Returns RelationPlan of model or index, it is built on first call and stored on the model or index.
+
+    Range key condition guessing:
+        If range key on related model is:
+        * PrefixedUnicodeAttribute - we use the prefix to filter by it.
+        * StaticUnicodeAttribute - we use it's static value to filter by it.
+    """
+    plan = related.__dict__.get("_relation_plan")
+    if plan is not None:
+        return plan
+
+    if isinstance(related, Index):
+        model = related.Meta.model
+        range_key_attribute = _range_key_attribute(related)
+    else:
+        model = related
+        range_key_attribute = related._range_key_attribute()
+
+    range_key_condition = None
+    if isinstance(range_key_attribute, attributes.PrefixedUnicodeAttribute):
+        range_key_condition = range_key_attribute.startswith("")
+    elif isinstance(range_key_attribute, attributes.StaticUnicodeAttribute):
+        range_key_condition = range_key_attribute == range_key_attribute.static_value
+
+    plan = RelationPlan(related, model, range_key_attribute, range_key_condition)
+    related._relation_plan = plan
+    return plan
 
 
 class ForeignKeyRelationManager:
     hash_key: Any
     related: Union[Type[Model], Type[Index]]
+    plan: RelationPlan
+    range_key_condition: Optional[Condition] = None
+    filter_condition: Optional[Condition] = None
+    attributes_to_get: Optional[List[str]] = None
+    # Parent instance and name of its attribute counting related items.
+    parent: Optional[Model] = None
+    counter: Optional[str] = None
+    # Memoized result of `all`, valid while write generation of related model is unchanged.
+    _result_cache: Optional[List[Model]] = None
+    _cache_generation: Optional[int] = None
 
-    def __init__(self, related: Union[Type[Model], Type[Index]], hash_key):
+    def __init__(
+        self, related: Union[Type[Model], Type[Index]], hash_key, plan: Optional[RelationPlan] = None
+    ):
         self.related = related
         self.hash_key = hash_key
+        self.plan = get_relation_plan(related) if plan is None else plan
+
+    def all(self) -> List[Model]:
+        """
+        Returns all related items, queried once and memoized on this manager.
+
+        Memoized items are dropped when any instance of related model is saved or deleted
+        in this process, or when the parent is refreshed, saved, updated or deleted.
+
+        Example:
+            posts = thread.posts.all()
+            assert thread.posts.all() is posts
+        """
+        self._check_cache()
+        if self._result_cache is None:
+            generation = self._get_model()._write_generation
+            self._result_cache = list(self.query())
+            self._cache_generation = generation
+        return self._result_cache
+
+    def prefetch(self) -> "ForeignKeyRelationManager":
+        """
+        Memoizes all related items, see `all`. Unfiltered `count` then uses them instead of reading.
+
+        Returns:
+            This manager.
+        """
+        self.all()
+        return self
+
+    def clear_cache(self):
+        """
+        Drops memoized result of `all`.
+        """
+        self._result_cache = None
+        self._cache_generation = None
+
+    def _get_result_cache(self) -> Optional[List[Model]]:
+        self._check_cache()
+        return self._result_cache
+
+    def _check_cache(self):
+        if (
+            self._cache_generation is not None
+            and self._cache_generation != self._get_model()._write_generation
+        ):
+            self.clear_cache()
+
+    def filter(
+        self,
+        range_key_condition: Optional[Condition] = None,
+        filter_condition: Optional[Condition] = None,
+        index_name: Optional[str] = None,
+    ) -> "ForeignKeyRelationManager":
+        """
+        Returns manager which applies conditions to every `query`, `page` and `count`.
+
+        Args:
+            range_key_condition: Condition for range key replacing the guessed one.
+            filter_condition: Filter condition, combined with already set filter condition.
+            index_name: Query this index sharing hash key with related model instead.
+                Range key condition has to be specified again for the index.
+
+        Example:
+            thread.posts.filter(Post.sk.startswith("2020"), Post.author == "a1").page(20)
+        """
+        if index_name is not None:
+            manager = ForeignKeyRelationManager(_get_index(self._get_model(), index_name), self.hash_key)
+        else:
+            manager = ForeignKeyRelationManager(self.related, self.hash_key, self.plan)
+        manager.range_key_condition = (
+            range_key_condition
+            if range_key_condition is not None or index_name is not None
+            else self.range_key_condition
+        )
+        if self.filter_condition is None or filter_condition is None:
+            manager.filter_condition = (
+                self.filter_condition if filter_condition is None else filter_condition
+            )
+        else:
+            manager.filter_condition = self.filter_condition & filter_condition
+        manager.attributes_to_get = self.attributes_to_get
+        return manager
+
+    def only(self, *attributes: str) -> "ForeignKeyRelationManager":
+        """
+        Returns manager which `query` and `page` read only given attributes.
+
+        Keys and type attribute are always read. Returned instances can not be saved.
+
+        Args:
+            *attributes: Python names of attributes of related model.
+        """
+        manager = self.filter()
+        manager.attributes_to_get = self._get_model()._get_projection(attributes)
+        return manager
+
+    def _apply_filter_condition(self, kwargs: Dict[str, Any]):
+        if self.filter_condition is None:
+            return
+        filter_condition = kwargs.get("filter_condition")
+        kwargs["filter_condition"] = (
+            self.filter_condition if filter_condition is None else self.filter_condition & filter_condition
+        )
 
     def get(self, *args, **kwargs) -> Model:
         """
@@ -57,26 +249,96 @@ class ForeignKeyRelationManager:
             * PrefixedUnicodeAttribute - we use the prefix to filter by it.
             * StaticUnicodeAttribute - we use it's static value to filter by it.
         """
+        self._apply_filter_condition(kwargs)
+        if self.attributes_to_get is not None:
+            kwargs.setdefault("attributes_to_get", self.attributes_to_get)
         if range_key_condition is None:
-            if isinstance(self.related, Index):
-                range_key_attribute = _range_key_attribute(self.related)
-            else:
-                range_key_attribute = self.related.get_attributes()[
-                    self.related._range_keyname
-                ]
-            if isinstance(range_key_attribute, attributes.PrefixedUnicodeAttribute):
-                range_key_condition = range_key_attribute.startswith("")
-            elif isinstance(range_key_attribute, attributes.StaticUnicodeAttribute):
-                range_key_condition = (
-                    range_key_attribute == range_key_attribute.static_value
-                )
-            else:
-                raise ValueError(
-                    "ForeignKeyRelationManager can not do query as related model's range key can not "
-                    "be automatically guessed and range_key_condition was not specified."
-                )
+            range_key_condition = self._get_range_key_condition("query")
         return self.related.query(self.hash_key, range_key_condition, *args, **kwargs)
 
+    def page(
+        self, limit: int, cursor: Optional[Dict[str, Any]] = None, range_key_condition=None, **kwargs
+    ) -> RelationPage:
+        """
+        Returns one page of related items fetched by exactly one bounded Query.
+
+        Args:
+            limit: Maximum number of items on the page.
+            cursor: `last_evaluated_key` of the previous page, None for the first page.
+            range_key_condition: Condition for range key if not specified we try to guess what it should be
+            **kwargs: See Model.query for more info on other arguments.
+
+        Returns:
+            RelationPage - items and cursor of the next page.
+
+        Example:
+            page = thread.posts.page(20)
+            while page.last_evaluated_key:
+                page = thread.posts.page(20, page.last_evaluated_key)
+        """
+        result_iterator = self.query(
+            range_key_condition, limit=limit, page_size=limit, last_evaluated_key=cursor, **kwargs
+        )
+        page_iter = result_iterator.page_iter
+        map_fn = result_iterator._map_fn
+        data = next(page_iter, None) or {}
+        return RelationPage(
+            [map_fn(item) for item in data.get(ITEMS, [])],
+            page_iter.last_evaluated_key,
+        )
+
+    async def apage(self, *args, **kwargs) -> RelationPage:
+        """
+        Awaitable counterpart of `page`.
+        """
+        return await run_in_executor(self.page, *args, **kwargs)
+
+    def _get_model(self) -> Type[Model]:
+        return self.plan.model
+
+    def _get_range_key_condition(self, operation: str) -> Condition:
+        if self.range_key_condition is not None:
+            return self.range_key_condition
+        if self.plan.range_key_condition is None:
+            raise ValueError(
+                f"ForeignKeyRelationManager can not do {operation} as related model's range key can not "
+                "be automatically guessed and range_key_condition was not specified."
+            )
+        return self.plan.range_key_condition
+
+    async def aget(self, *args, **kwargs) -> Model:
+        """
+        Awaitable counterpart of `get`.
+        """
+        return await run_in_executor(self.get, *args, **kwargs)
+
+    async def aquery(self, range_key_condition=None, *args, **kwargs) -> AsyncPageIterator:
+        """
+        Awaitable counterpart of `query` iterating over whole pages.
+
+        Args:
+            range_key_condition: Condition for range key if not specified we try to guess what it should be
+            *args: See Model.query for more info on arguments.
+            **kwargs: See Model.query for more info on arguments.
+
+        Returns:
+            AsyncPageIterator - yields lists of related instances, one DynamoDB request per page.
+
+        Example:
+            async for page in await thread.posts.aquery(limit=50):
+                ...
+        """
+        result_iterator = self.query(range_key_condition, *args, **kwargs)
+        return AsyncPageIterator(
+            result_iterator.page_iter, map_fn=result_iterator._map_fn, limit=kwargs.get("limit")
+        )
+
+    async def acount(self, range_key_condition=None, *args, **kwargs) -> int:
+        """
+        Awaitable counterpart of `count`.
+        """
+        return await run_in_executor(self.count, range_key_condition, *args, **kwargs)
+
     def count(self, range_key_condition=None, *args, **kwargs) -> int:
         """
         Provides a filtered count
@@ -96,24 +358,61 @@ class ForeignKeyRelationManager:
             If range key on related model is:
             * PrefixedUnicodeAttribute - we use the prefix to filter by it.
             * StaticUnicodeAttribute - we use it's static value to filter by it.
+
+        Unfiltered count uses items memoized by `all` or `prefetch`, otherwise it is read on every call.
+        Relation with counter reads the counter instead of counting items.
         """
+        if (
+            range_key_condition is None
+            and not args
+            and not kwargs
+            and self.range_key_condition is None
+            and self.filter_condition is None
+        ):
+            return self._unfiltered_count()
+        return self._count_items(range_key_condition, *args, **kwargs)
+
+    def _count_items(self, range_key_condition=None, *args, **kwargs) -> int:
+        self._apply_filter_condition(kwargs)
         if range_key_condition is None:
-            sort_key_attribute = self.related.get_attributes()[
-                self.related._range_keyname
-            ]
-            if isinstance(sort_key_attribute, attributes.PrefixedUnicodeAttribute):
-                range_key_condition = sort_key_attribute.startswith("")
-            elif isinstance(sort_key_attribute, attributes.StaticUnicodeAttribute):
-                range_key_condition = (
-                    sort_key_attribute == sort_key_attribute.static_value
-                )
-            else:
-                raise ValueError(
-                    "ForeignKeyRelationManager can not do count as related model's range key can not "
-                    "be automatically guessed and range_key_condition was not specified."
-                )
+            range_key_condition = self._get_range_key_condition("count")
         return self.related.count(self.hash_key, range_key_condition, *args, **kwargs)
 
+    def _unfiltered_count(self) -> int:
+        result_cache = self._get_result_cache()
+        if result_cache is not None:
+            return len(result_cache)
+        return self._read_counter() if self.counter is not None else self._count_items()
+
+    def _read_counter(self) -> int:
+        model = self.parent.__class__
+        parent = model.get(
+            getattr(self.parent, model._hash_keyname),
+            getattr(self.parent, model._range_keyname) if model._range_keyname else None,
+            attributes_to_get=model._get_projection([self.counter]),
+        )
+        return getattr(parent, self.counter) or 0
+
+    def reconcile_counter(self) -> int:
+        """
+        Repairs drift of the counter by counting related items and storing the result.
+
+        Items saved or deleted while counting may make the counter inaccurate again.
+
+        Returns:
+            Number of related elements.
+
+        Raises:
+            ValueError - Relation has no counter.
+        """
+        if self.counter is None:
+            raise ValueError("Relation has no counter.")
+        count = self._count_items()
+        model = self.parent.__class__
+        self.clear_cache()
+        self.parent.update(actions=[model.get_attributes()[self.counter].set(count)])
+        return count
+
 
 class PrimaryKeyReverseForeignKeyRelation(ReverseRelation, RegisterDatabaseLink):
     """
@@ -122,10 +421,103 @@ class PrimaryKeyReverseForeignKeyRelation(ReverseRelation, RegisterDatabaseLink)
 
     related_model: Union[str, Type[Model]]
     index: Optional[str] = None
+    counter: Optional[str] = None
+    attributes: Optional[Sequence[str]] = None
+    owner: Optional[Type[Model]] = None
+    name: Optional[str] = None
+    # Python name of owner's attribute holding hash key of related items, set by MetaModel.
+    hash_key_name: Optional[str] = None
+    _plan: Optional[RelationPlan] = None
+    _attributes_to_get: Optional[List[str]] = None
 
-    def __init__(self, model: Union[str, Type[Model]], index: Optional[str] = None):
+    def __init__(
+        self,
+        model: Union[str, Type[Model]],
+        index: Optional[str] = None,
+        counter: Optional[str] = None,
+        attributes: Optional[Sequence[str]] = None,
+    ):
+        """
+        Args:
+            model: Related model or its entity name.
+            index: Name of related model's index which hash key holds this object's hash key.
+            counter: Name of NumberAttribute of this model holding number of related items.
+                It is updated by related model's `save` and `delete` in the same transaction
+                and used by `count()`. Parent's range key must be static.
+            attributes: Python names of related model's attributes read by the relation,
+                by default whole items are read. Schema planner projects only these attributes
+                to the index if it sets `narrow_projection`, see `plan_table_schema`.
+                Read items can not be saved (see `ForeignKeyRelationManager.only`).
+        """
+        if counter is not None and index is not None:
+            raise ValueError("Counter is supported only for relations without index.")
         self.related_model = model
         self.index = index
+        self.counter = counter
+        self.attributes = attributes
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def contribute_to_class(self, owner: Type[Model]):
+        """
+        Resolves owner's hash key attribute, called by MetaModel when the owner is created.
+        """
+        self.owner = owner
+        range_key = owner._range_key_attribute()
+        if self.counter is not None and range_key is not None and not isinstance(
+            range_key, attributes.StaticUnicodeAttribute
+        ):
+            raise ValueError(
+                f"Relation {owner.__name__}.{self.name} has counter but range key of {owner.__name__} is not static."
+            )
+        if self.index:
+            dynamo_attr_name = _get_index(owner, self.index)._hash_key_attribute().attr_name
+            self.hash_key_name = owner._dynamo_to_python_attr(dynamo_attr_name)
+        else:
+            self.hash_key_name = owner._hash_keyname
+
+    def prepare(self):
+        if self._plan is None and _is_registered(self._database, self.related_model):
+            self.get_plan()
+
+    def get_plan(self) -> RelationPlan:
+        """
+        Returns RelationPlan of related model or its index.
+
+        MetaModel builds it as soon as related model is registered.
+        """
+        plan = self._plan
+        if plan is None:
+            related = self.get_related_model()
+            if self.index:
+                related = _get_index(related, self.index)
+            if self.attributes is not None:
+                self._attributes_to_get = self.get_related_model()._get_projection(self.attributes)
+            plan = self._plan = get_relation_plan(related)
+        return plan
+
+    def get_index_projection(self) -> Optional[Tuple[str, Optional[FrozenSet[str]]]]:
+        if not self.index:
+            return None
+        self.get_plan()
+        return self.index, None if self._attributes_to_get is None else frozenset(self._attributes_to_get)
+
+    def add_to_counter(self, transaction, instance: Model, value: int):
+        """
+        Adds atomic ADD of value to counter of instance's parent to transaction.
+
+        Update is conditioned on parent existence so no item is created for missing parent.
+        """
+        owner = self.owner
+        hash_key_attribute = owner._hash_key_attribute()
+        transaction.update_by_key(
+            owner,
+            hash_key_attribute.deserialize(instance._get_serialized_keys()[0]),
+            actions=[owner.get_attributes()[self.counter].add(value)],
+            condition=hash_key_attribute.exists(),
+        )
 
     def get_related_model(self):
         if isinstance(self.related_model, str):
@@ -142,18 +534,21 @@ class PrimaryKeyReverseForeignKeyRelation(ReverseRelation, RegisterDatabaseLink)
         if instance is None:
             return self
 
-        if self.index:
-            instance._get_indexes()
-            dynamo_attr_name = (
-                instance._index_classes[self.index]._hash_key_attribute().attr_name
-            )
-            python_attr_name = instance._dynamo_to_python_attr(dynamo_attr_name)
-            return ForeignKeyRelationManager(
-                related=self.get_related_model()._index_classes[self.index],
-                hash_key=getattr(instance, python_attr_name),
-            )
+        hash_key = getattr(instance, self.hash_key_name)
 
-        return ForeignKeyRelationManager(
-            related=self.get_related_model(),
-            hash_key=getattr(instance, instance._hash_keyname),
-        )
+        # Manager is cached on the instance so memoized results survive repeated access.
+        managers = instance._relation_managers
+        if managers is None:
+            managers = instance._relation_managers = {}
+        manager = managers.get(self.name)
+        if manager is not None and manager.hash_key == hash_key:
+            return manager
+
+        plan = self._plan or self.get_plan()
+        manager = ForeignKeyRelationManager(related=plan.related, hash_key=hash_key, plan=plan)
+        manager.attributes_to_get = self._attributes_to_get
+        if self.counter is not None:
+            manager.parent = instance
+            manager.counter = self.counter
+        managers[self.name] = manager
+        return manager
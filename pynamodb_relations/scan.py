@@ -0,0 +1,143 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from pynamodb.connection import TableConnection
+from pynamodb.constants import ITEMS
+from pynamodb.pagination import PageIterator
+
+
+class ParallelScan:
+    """
+    Segmented Scan executed from thread pool.
+
+    Every segment is scanned by its own worker and pages are streamed to the consumer
+    as soon as they arrive. Items are mapped on the consumer thread.
+
+    Attributes:
+        last_evaluated_keys: Checkpoint of every segment - LastEvaluatedKey of the last page which
+            items were all consumed. None means segment is finished, missing segment was not started yet.
+            Pass it as `last_evaluated_keys` to resume the scan.
+    """
+
+    last_evaluated_keys: Dict[int, Optional[Dict[str, Any]]]
+
+    def __init__(
+        self,
+        connection: TableConnection,
+        total_segments: int,
+        segments: Optional[Iterable[int]] = None,
+        workers: Optional[int] = None,
+        map_fn: Optional[Callable] = None,
+        item_filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        rate_limit: Optional[float] = None,
+        last_evaluated_keys: Optional[Dict[int, Optional[Dict[str, Any]]]] = None,
+        max_prefetched_pages: Optional[int] = None,
+        page_size: Optional[int] = None,
+        limit: Optional[int] = None,
+        **scan_kwargs,
+    ):
+        """
+        Args:
+            connection: Connection to the scanned table.
+            total_segments: Number of segments the table is split into.
+            segments: Segments to scan. Defaults to all segments.
+            workers: Size of thread pool. Defaults to total_segments.
+            map_fn: Function applied on every raw item.
+            item_filter: Raw items for which this function returns False are skipped before mapping.
+            rate_limit: Consumed capacity per second of whole scan, divided evenly between scanned segments.
+            last_evaluated_keys: Checkpoints to resume from, see `last_evaluated_keys` attribute.
+            max_prefetched_pages: Maximum number of pages waiting for consumer. Defaults to 2 * workers.
+            page_size: Page size of the scan to DynamoDB.
+            limit: Maximum number of returned items.
+            **scan_kwargs: Arguments of TableConnection.scan.
+        """
+        if total_segments < 1:
+            raise ValueError("total_segments must be greater than zero")
+        self.connection = connection
+        self.total_segments = total_segments
+        self.segments = list(range(total_segments)) if segments is None else list(segments)
+        self.workers = workers or len(self.segments)
+        self.map_fn = map_fn
+        self.item_filter = item_filter
+        self.rate_limit = rate_limit / len(self.segments) if rate_limit and self.segments else None
+        self.last_evaluated_keys = dict(last_evaluated_keys or {})
+        self.max_prefetched_pages = max_prefetched_pages or 2 * self.workers
+        self.page_size = page_size
+        self.limit = limit
+        self.scan_kwargs = scan_kwargs
+
+    def __iter__(self) -> Iterator[Any]:
+        segments = [
+            segment
+            for segment in self.segments
+            if segment not in self.last_evaluated_keys
+            or self.last_evaluated_keys[segment] is not None
+        ]
+        if not segments or self.limit == 0:
+            return
+
+        pages: queue.Queue = queue.Queue(maxsize=self.max_prefetched_pages)
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(self.workers)
+        try:
+            for segment in segments:
+                executor.submit(self._scan_segment, segment, pages, stop)
+
+            remaining = len(segments)
+            returned = 0
+            while remaining:
+                segment, items, last_evaluated_key, error = pages.get()
+                if error is not None:
+                    raise error
+                for item in items:
+                    if self.item_filter is not None and not self.item_filter(item):
+                        continue
+                    yield self.map_fn(item) if self.map_fn else item
+                    returned += 1
+                    if returned == self.limit:
+                        return
+                self.last_evaluated_keys[segment] = last_evaluated_key
+                if last_evaluated_key is None:
+                    remaining -= 1
+        finally:
+            stop.set()
+            executor.shutdown(wait=False)
+
+    def _scan_segment(self, segment: int, pages: queue.Queue, stop: threading.Event):
+        try:
+            page_iter = PageIterator(
+                self.connection.scan,
+                (),
+                dict(
+                    self.scan_kwargs,
+                    segment=segment,
+                    total_segments=self.total_segments,
+                    limit=self.page_size,
+                    exclusive_start_key=self.last_evaluated_keys.get(segment),
+                ),
+                rate_limit=self.rate_limit,
+            )
+            for page in page_iter:
+                if not self._put(
+                    pages,
+                    stop,
+                    (segment, page.get(ITEMS, []), page_iter.last_evaluated_key, None),
+                ):
+                    return
+        except Exception as e:
+            self._put(pages, stop, (segment, [], None, e))
+
+    @staticmethod
+    def _put(pages: queue.Queue, stop: threading.Event, page) -> bool:
+        """
+        Puts page to queue unless consumer stopped iterating.
+        """
+        while not stop.is_set():
+            try:
+                pages.put(page, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
@@ -0,0 +1,184 @@
+"""
+Table schema planner merging keys and indexes of all models registered to a database.
+"""
+from inspect import getmembers
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Type, TYPE_CHECKING
+
+from pynamodb.constants import (
+    ALL,
+    ATTR_TYPE_MAP,
+    INCLUDE,
+    KEYS_ONLY,
+)
+from pynamodb.indexes import GlobalSecondaryIndex, Index
+from pynamodb.types import HASH, RANGE
+
+from .utils import _range_key_attribute
+
+if TYPE_CHECKING:
+    from .database import BaseDatabase
+    from .models import Model
+
+
+class IndexSchema(NamedTuple):
+    name: str
+    is_global: bool
+    # Pairs of dynamo attribute name and key type (HASH or RANGE).
+    key_schema: Tuple[Tuple[str, str], ...]
+    projection_type: str
+    # Dynamo names of projected non-key attributes, empty unless projection type is INCLUDE.
+    non_key_attributes: Tuple[str, ...]
+    read_capacity_units: Optional[int]
+    write_capacity_units: Optional[int]
+
+
+class TableSchema(NamedTuple):
+    # Pairs of dynamo attribute name and short attribute type of all key attributes.
+    attribute_definitions: Tuple[Tuple[str, str], ...]
+    key_schema: Tuple[Tuple[str, str], ...]
+    global_secondary_indexes: Tuple[IndexSchema, ...]
+    local_secondary_indexes: Tuple[IndexSchema, ...]
+
+
+def _add_attribute_definition(definitions: Dict[str, str], attribute, owner: str):
+    attr_type = ATTR_TYPE_MAP[attribute.attr_type]
+    if definitions.setdefault(attribute.attr_name, attr_type) != attr_type:
+        raise ValueError(
+            f"Key attribute {attribute.attr_name} of {owner} has type {attr_type} "
+            f"but other model or index declares it as {definitions[attribute.attr_name]}."
+        )
+
+
+def _get_key_schema(hash_key, range_key) -> Tuple[Tuple[str, str], ...]:
+    if range_key is None:
+        return ((hash_key.attr_name, HASH),)
+    return (hash_key.attr_name, HASH), (range_key.attr_name, RANGE)
+
+
+def _get_declared_projection(index: Index) -> Optional[FrozenSet[str]]:
+    projection = index.Meta.projection
+    if projection.projection_type == ALL:
+        return None
+    return frozenset(projection.non_key_attributes or ())
+
+
+def _get_max_option(declarations: List[Index], name: str) -> Optional[int]:
+    values = [getattr(index.Meta, name, None) for index in declarations]
+    return max((value for value in values if value is not None), default=None)
+
+
+def plan_table_schema(database: Type["BaseDatabase"], plan_projections: bool = True) -> TableSchema:
+    """
+    Returns schema of the database table built from all registered models.
+
+    * Key schema of the table has to be the same for all models.
+    * Indexes of the same name declared by more models (overloaded indexes) are merged,
+      their key schemas have to be the same.
+    * Projection of an index covers its declared projections and what its readers need:
+      ALL if any of them needs whole items, KEYS_ONLY if they need keys only, INCLUDE with
+      union of needed attributes otherwise.
+
+    Readers of an index are relations reading through it (see `ReverseRelation.get_index_projection`).
+    Planned projection is never narrower than declared one, unless the index opts in by
+    `narrow_projection = True` in its Meta; then only its readers are covered, e.g. AllProjection
+    index read by relations with `attributes` is planned as INCLUDE. With `plan_projections` False
+    indexes get union of their declared projections only.
+
+    Args:
+        database: Database which registered models are planned.
+        plan_projections: If False declared projections are used also for indexes read by relations.
+
+    Raises:
+        ValueError - When models or indexes declare conflicting key schemas or attribute types.
+    """
+    models: List[Type["Model"]] = sorted(
+        (model for model in set(database.ITEM_TYPE_MAPPING.values()) if model._database is database),
+        key=lambda model: model.__name__,
+    )
+    if not models:
+        raise ValueError(f"No model is registered to {database.__name__}.")
+
+    definitions: Dict[str, str] = {}
+    key_schema = None
+    for model in models:
+        model_key_schema = _get_key_schema(model._hash_key_attribute(), model._range_key_attribute())
+        if key_schema is not None and model_key_schema != key_schema:
+            raise ValueError(
+                f"Key schema {model_key_schema} of {model.__name__} differs from key schema "
+                f"{key_schema} of other models."
+            )
+        key_schema = model_key_schema
+        _add_attribute_definition(definitions, model._hash_key_attribute(), model.__name__)
+        if model._range_key_attribute() is not None:
+            _add_attribute_definition(definitions, model._range_key_attribute(), model.__name__)
+
+    indexes: Dict[str, List[Index]] = {}
+    for model in models:
+        for _, index in getmembers(model, lambda o: isinstance(o, Index)):
+            indexes.setdefault(index.Meta.index_name, []).append(index)
+
+    reads: Dict[str, List[Optional[FrozenSet[str]]]] = {}
+    for model in models:
+        for relation in model.get_reverse_relations().values():
+            index_projection = relation.get_index_projection()
+            if index_projection is not None:
+                index_name, attributes = index_projection
+                reads.setdefault(index_name, []).append(attributes)
+
+    table_key_names = {attr_name for attr_name, _ in key_schema}
+    global_indexes = []
+    local_indexes = []
+    for name in sorted(indexes):
+        declarations = indexes[name]
+        first = declarations[0]
+        index_key_schema = _get_key_schema(first._hash_key_attribute(), _range_key_attribute(first))
+        is_global = isinstance(first, GlobalSecondaryIndex)
+        if not is_global and index_key_schema[0] != key_schema[0]:
+            raise ValueError(f"Local secondary index {name} has to share hash key with the table.")
+        for index in declarations:
+            range_key = _range_key_attribute(index)
+            if (
+                isinstance(index, GlobalSecondaryIndex) != is_global
+                or _get_key_schema(index._hash_key_attribute(), range_key) != index_key_schema
+            ):
+                raise ValueError(f"Index {name} is declared with different key schemas or types.")
+            owner = f"index {name}"
+            _add_attribute_definition(definitions, index._hash_key_attribute(), owner)
+            if range_key is not None:
+                _add_attribute_definition(definitions, range_key, owner)
+
+        requirements = [
+            _get_declared_projection(index)
+            for index in declarations
+            if not (plan_projections and name in reads and getattr(index.Meta, "narrow_projection", False))
+        ]
+        if plan_projections:
+            requirements.extend(reads.get(name, ()))
+
+        key_names = table_key_names | {attr_name for attr_name, _ in index_key_schema}
+        if any(requirement is None for requirement in requirements):
+            projection_type, non_key_attributes = ALL, ()
+        else:
+            non_key_attributes = tuple(sorted(frozenset().union(*requirements) - key_names))
+            projection_type = INCLUDE if non_key_attributes else KEYS_ONLY
+
+        read_capacity_units = _get_max_option(declarations, "read_capacity_units")
+        write_capacity_units = _get_max_option(declarations, "write_capacity_units")
+
+        index_schema = IndexSchema(
+            name,
+            is_global,
+            index_key_schema,
+            projection_type,
+            non_key_attributes,
+            read_capacity_units,
+            write_capacity_units,
+        )
+        (global_indexes if is_global else local_indexes).append(index_schema)
+
+    return TableSchema(
+        tuple(sorted(definitions.items())),
+        key_schema,
+        tuple(global_indexes),
+        tuple(local_indexes),
+    )
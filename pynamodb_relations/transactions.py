@@ -0,0 +1,200 @@
+import re
+from typing import List, Optional, Set, Tuple, Type, TYPE_CHECKING
+
+from pynamodb import transactions
+from pynamodb.exceptions import TransactWriteError
+from pynamodb.constants import RESPONSES
+from pynamodb.models import _ModelFuture
+
+from pynamodb_relations.constans import TRANSACT_ITEMS_LIMIT
+
+if TYPE_CHECKING:
+    from pynamodb_relations.database import BaseDatabase
+    from pynamodb_relations.models import Model
+
+
+def _check_model(database: Type["BaseDatabase"], model_cls: Type["Model"]):
+    if getattr(model_cls, "_database", None) is not database:
+        raise ValueError(f"{model_cls.__name__} is not registered to {database.__name__}.")
+
+
+def get_cancellation_reasons(error: TransactWriteError) -> List[Optional[str]]:
+    """
+    Returns codes of cancellation reasons of TransactWriteItems, None for operations which did not fail.
+
+    Reasons are in order of operations in the request: condition checks, deletes, puts and updates.
+    Empty list is returned when the reasons are not known.
+    """
+    response = getattr(error.cause, "response", None) or {}
+    reasons = response.get("CancellationReasons")
+    if reasons is not None:
+        codes = [reason.get("Code") for reason in reasons]
+    else:
+        # Only error message is kept by pynamodb: "... [ConditionalCheckFailed, None]".
+        match = re.search(r"\[([^\]]*)\]\s*$", error.cause_response_message or "")
+        if match is None:
+            return []
+        codes = [code.strip() for code in match.group(1).split(",")]
+    return [None if code in (None, "None") else code for code in codes]
+
+
+class DatabaseModelFuture(_ModelFuture):
+    """
+    Placeholder for model returned by TransactGet which is built by `BaseDatabase.from_raw`.
+    """
+
+    def __init__(self, model_cls: Type["Model"], database: Type["BaseDatabase"]):
+        super().__init__(model_cls)
+        self._database = database
+
+    def update_with_raw_data(self, data):
+        if data is not None and data != {}:
+            self._model = self._database.from_raw(data)
+        self._resolved = True
+
+
+class TransactGet(transactions.TransactGet):
+    """
+    TransactGetItems for instances of any model registered to the database.
+
+    More than `max_items` gets are split into multiple requests.
+    """
+
+    def __init__(
+        self, database: Type["BaseDatabase"], max_items: int = TRANSACT_ITEMS_LIMIT, **kwargs
+    ):
+        super().__init__(connection=database._get_connection().connection, **kwargs)
+        self.database = database
+        self.max_items = max_items
+
+    def get(self, model_cls: Type["Model"], hash_key, range_key=None) -> DatabaseModelFuture:
+        _check_model(self.database, model_cls)
+        operation_kwargs = model_cls.get_operation_kwargs_from_class(hash_key, range_key=range_key)
+        model_future = DatabaseModelFuture(model_cls, self.database)
+        self._futures.append(model_future)
+        self._get_items.append(operation_kwargs)
+        return model_future
+
+    def _commit(self):
+        responses = []
+        self._results = []
+        for start in range(0, len(self._get_items), self.max_items):
+            response = self._connection.transact_get_items(
+                get_items=self._get_items[start:start + self.max_items],
+                return_consumed_capacity=self._return_consumed_capacity,
+            )
+            self._results.extend(response[RESPONSES])
+            responses.append(response)
+        self._update_futures()
+        return responses
+
+
+class TransactWrite(transactions.TransactWrite):
+    """
+    TransactWriteItems for instances of any model registered to the database.
+
+    Operations are committed in one request. If there are more than `max_items` operations
+    they are split into multiple requests and atomicity is guaranteed only within each of them.
+    Memoized relations of written models are invalidated like by `Model.save` and `Model.delete`.
+    """
+
+    def __init__(
+        self, database: Type["BaseDatabase"], max_items: int = TRANSACT_ITEMS_LIMIT, **kwargs
+    ):
+        super().__init__(connection=database._get_connection().connection, **kwargs)
+        self.database = database
+        self.max_items = max_items
+        # Written instances and whether they exist after the write, models updated by keys.
+        self._written_models: List[Tuple["Model", bool]] = []
+        self._updated_model_classes: Set[Type["Model"]] = set()
+
+    def condition_check(self, model_cls, hash_key, range_key=None, condition=None):
+        _check_model(self.database, model_cls)
+        super().condition_check(model_cls, hash_key, range_key=range_key, condition=condition)
+
+    def delete(self, model, condition=None):
+        _check_model(self.database, model.__class__)
+        super().delete(model, condition=condition)
+        self._written_models.append((model, False))
+
+    def save(self, model, condition=None, return_values=None):
+        _check_model(self.database, model.__class__)
+        model._check_complete()
+        super().save(model, condition=condition, return_values=return_values)
+        self._written_models.append((model, True))
+
+    def update(self, model, actions, condition=None, return_values=None):
+        _check_model(self.database, model.__class__)
+        super().update(model, actions, condition=condition, return_values=return_values)
+        self._written_models.append((model, True))
+
+    def update_by_key(self, model_cls, hash_key, range_key=None, actions=None, condition=None):
+        """
+        Adds update of item identified by keys without loading the model instance.
+
+        Unlike `update` version attribute of the item is not checked nor incremented.
+        """
+        _check_model(self.database, model_cls)
+        if not actions:
+            raise TypeError("`actions` cannot be empty")
+        hash_key, range_key = model_cls._serialize_keys(hash_key, range_key)
+        operation_kwargs = model_cls._get_connection().get_operation_kwargs(
+            hash_key, range_key=range_key, actions=actions, condition=condition
+        )
+        self._update_items.append(operation_kwargs)
+        self._updated_model_classes.add(model_cls)
+
+    def commit(self) -> List[dict]:
+        """
+        Commits collected operations, use instead of the context manager to get responses.
+
+        Returns:
+            Responses of TransactWriteItems requests.
+        """
+        return self._commit()
+
+    def _commit(self):
+        operations = (
+            [("condition_check_items", item) for item in self._condition_check_items]
+            + [("delete_items", item) for item in self._delete_items]
+            + [("put_items", item) for item in self._put_items]
+            + [("update_items", item) for item in self._update_items]
+        )
+        if len(operations) > self.max_items and self._client_request_token is not None:
+            raise ValueError(
+                "client_request_token can not be used with transaction split into multiple requests."
+            )
+
+        responses = []
+        committed = False
+        try:
+            self._commit_operations(operations, responses)
+            committed = True
+        finally:
+            # Memoized relations are invalidated also when only some requests were committed.
+            for model, persisted in self._written_models:
+                model._written(persisted=persisted if committed else None)
+            for model_cls in self._updated_model_classes:
+                model_cls._bump_write_generation()
+        for model in self._models_for_version_attribute_update:
+            model.update_local_version_attribute()
+        return responses
+
+    def _commit_operations(self, operations: List[Tuple[str, dict]], responses: List[dict]):
+        for start in range(0, len(operations), self.max_items):
+            chunk = {
+                "condition_check_items": [],
+                "delete_items": [],
+                "put_items": [],
+                "update_items": [],
+            }
+            for kind, item in operations[start:start + self.max_items]:
+                chunk[kind].append(item)
+            responses.append(
+                self._connection.transact_write_items(
+                    client_request_token=self._client_request_token,
+                    return_consumed_capacity=self._return_consumed_capacity,
+                    return_item_collection_metrics=self._return_item_collection_metrics,
+                    **chunk,
+                )
+            )
@@ -1,4 +1,5 @@
-from typing import Type
+from inspect import getmembers
+from typing import List, Type
 
 from pynamodb.attributes import Attribute
 from pynamodb.indexes import Index
@@ -21,3 +22,20 @@ def _range_key_attribute(cls: Index) -> Attribute:
     for attr_cls in cls._get_attributes().values():
         if attr_cls.is_range_key:
             return attr_cls
+
+
+def _get_model_indexes(cls: Type[Model]) -> List[Index]:
+    """
+    Returns indexes of the model without building the table schema like Model._get_indexes.
+    """
+    return [index for _, index in getmembers(cls, lambda o: isinstance(o, Index))]
+
+
+def _get_index(cls: Type[Model], index_name: str) -> Index:
+    """
+    Returns index of the model by its name without building the table schema like Model._get_indexes.
+    """
+    for index in _get_model_indexes(cls):
+        if index.Meta.index_name == index_name:
+            return index
+    raise ValueError(f"Model {cls.__name__} does not have index {index_name}.")
@@ -0,0 +1,88 @@
+"""Forum models shared by tests running against mocked DynamoDB."""
+from pynamodb.indexes import GlobalSecondaryIndex, KeysOnlyProjection
+
+from pynamodb_relations import attributes
+from pynamodb_relations.database import BaseDatabase
+from pynamodb_relations.forward_related import ForeignKeyAttribute
+from pynamodb_relations.many_related import ManyToManyRelation
+from pynamodb_relations.models import Model
+from pynamodb_relations.utils import get_or_None
+from pynamodb_relations.reverse_related import PrimaryKeyReverseForeignKeyRelation
+
+
+class ForumDatabase(BaseDatabase):
+    table_name = "forum"
+    region = "us-east-1"
+    billing_mode = "PAY_PER_REQUEST"
+
+
+class Author(Model):
+    class Meta:
+        name = "ForumAuthor"
+        database = ForumDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("AUTHOR#", hash_key=True)
+    sk = attributes.StaticUnicodeAttribute("AUTHOR", range_key=True)
+    name = attributes.UnicodeAttribute(null=True)
+    boards = ManyToManyRelation("ForumBoard", through="ForumModeration", index="inverted")
+
+    @classmethod
+    def get_by_pk(cls, pk):
+        return cls.get(pk)
+
+    @classmethod
+    def get_or_none_by_pk(cls, pk):
+        return get_or_None(cls, pk)
+
+
+class Thread(Model):
+    class Meta:
+        name = "ForumThread"
+        database = ForumDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("THREAD#", hash_key=True)
+    sk = attributes.StaticUnicodeAttribute("THREAD", range_key=True)
+    subject = attributes.UnicodeAttribute(null=True)
+    posts = PrimaryKeyReverseForeignKeyRelation("ForumPost")
+
+
+class Post(Model):
+    class Meta:
+        name = "ForumPost"
+        database = ForumDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("THREAD#", hash_key=True)
+    sk = attributes.PrefixedUnicodeAttribute("POST#", range_key=True)
+    body = attributes.UnicodeAttribute(null=True)
+    author = ForeignKeyAttribute("ForumAuthor", attribute="pk", null=True)
+    editor = ForeignKeyAttribute("ForumAuthor", attribute="pk", get_method="get_or_none_by_pk", null=True)
+
+
+class ModerationInvertedIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "inverted"
+        projection = KeysOnlyProjection()
+
+    sk = attributes.PrefixedUnicodeAttribute("AUTHOR#", hash_key=True)
+    pk = attributes.PrefixedUnicodeAttribute("BOARD#", range_key=True)
+
+
+class Board(Model):
+    class Meta:
+        name = "ForumBoard"
+        database = ForumDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("BOARD#", hash_key=True)
+    sk = attributes.StaticUnicodeAttribute("BOARD", range_key=True)
+    title = attributes.UnicodeAttribute(null=True)
+    moderators = ManyToManyRelation("ForumAuthor", through="ForumModeration")
+
+
+class Moderation(Model):
+    class Meta:
+        name = "ForumModeration"
+        database = ForumDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("BOARD#", hash_key=True)
+    sk = attributes.PrefixedUnicodeAttribute("AUTHOR#", range_key=True)
+    inverted = ModerationInvertedIndex()
@@ -0,0 +1,56 @@
+"""Tests of asyncio counterparts of models, relations and managers."""
+import asyncio
+
+import pytest
+
+from tests.models import Author, ForumDatabase, Post, Thread
+
+
+@pytest.fixture
+def forum(create_table):
+    create_table(ForumDatabase)
+    for n in range(3):
+        Author(pk=f"a{n}", name=f"Author {n}").save()
+    Thread(pk="t1").save()
+    for n in range(30):
+        Post(pk="t1", sk=f"{n:02}", author=Author(pk=f"a{n % 3}")).save()
+
+
+def test_model_and_manager(forum):
+    async def main():
+        thread = await Thread.aget("t1")
+        pages = [page async for page in await thread.posts.aquery(limit=25, page_size=10)]
+        return pages, await thread.posts.acount(), await thread.posts.aget("05")
+
+    pages, count, post = asyncio.run(main())
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert count == 30
+    assert post.sk == "05"
+
+
+def test_page(forum):
+    async def main():
+        thread = await Thread.aget("t1")
+        first = await thread.posts.apage(20)
+        second = await thread.posts.apage(20, first.last_evaluated_key)
+        return first, second
+
+    first, second = asyncio.run(main())
+
+    assert [len(first.items), len(second.items)] == [20, 10]
+    assert second.items[0].sk == "20"
+    assert second.last_evaluated_key is None
+
+
+def test_descriptors_resolved_concurrently_in_session(forum):
+    posts = list(Post.query("t1", Post.sk.startswith(""), limit=6))
+
+    async def main():
+        with ForumDatabase.session():
+            return await asyncio.gather(*[Post.author.get_descriptor(post) for post in posts])
+
+    authors = asyncio.run(main())
+
+    assert [author.name for author in authors] == [f"Author {n % 3}" for n in range(6)]
+    assert authors[0] is authors[3]
@@ -0,0 +1,263 @@
+"""Tests of `BaseDatabase` operations on items of all registered models."""
+from unittest import mock
+
+import pytest
+from pynamodb.connection.base import Connection
+from pynamodb.exceptions import TransactWriteError
+
+from pynamodb_relations import attributes
+from pynamodb_relations.database import BaseDatabase
+from pynamodb_relations.models import Model
+from pynamodb_relations.transactions import get_cancellation_reasons
+from tests.models import Author, ForumDatabase, Post, Thread
+
+
+class CatalogDatabase(BaseDatabase):
+    table_name = "catalog"
+    region = "us-east-1"
+    billing_mode = "PAY_PER_REQUEST"
+
+
+class Product(Model):
+    class Meta:
+        name = "CatalogProduct"
+        database = CatalogDatabase
+
+    pk = attributes.UnicodeAttribute(hash_key=True)
+    sk = attributes.StaticUnicodeAttribute("PRODUCT", range_key=True)
+    kind = attributes.TypeAttribute(attr_name="entity")
+    title = attributes.UnicodeAttribute(null=True)
+
+
+@pytest.fixture
+def forum(create_table):
+    create_table(ForumDatabase)
+    thread = Thread(pk="t1", subject="Subject")
+    thread.save()
+    for n in range(3):
+        Post(pk="t1", sk=str(n), body=f"Body {n}").save()
+    Thread(pk="t2").save()
+    return thread
+
+
+def test_query_returns_whole_item_collection(forum):
+    items = list(ForumDatabase.query(forum))
+
+    assert [type(item) for item in items] == [Post, Post, Post, Thread]
+    assert [item.sk for item in items[:3]] == ["0", "1", "2"]
+    assert items[3].subject == "Subject"
+    assert [type(item) for item in ForumDatabase.query("THREAD#t2")] == [Thread]
+
+
+def test_query_limit_and_range_key_condition(forum):
+    assert len(list(ForumDatabase.query(forum, limit=2))) == 2
+
+    items = list(ForumDatabase.query(forum, Thread.sk == "THREAD"))
+    assert [type(item) for item in items] == [Thread]
+
+
+def test_query_attributes_to_get_returns_partial_instances(forum):
+    items = list(ForumDatabase.query(forum, attributes_to_get=["pk", "sk", "type"]))
+
+    assert [type(item) for item in items] == [Post, Post, Post, Thread]
+    assert all(item._partial for item in items)
+    assert items[0].body is None
+    with pytest.raises(ValueError):
+        items[0].save()
+
+
+def test_batch_get_returns_items_of_any_model(create_table):
+    create_table(ForumDatabase)
+    with ForumDatabase.batch_write() as batch:
+        for n in range(150):
+            batch.save(Post(pk="t1", sk=f"{n:03}"))
+        batch.save(Thread(pk="t1"))
+    keys = [{"pk": "THREAD#t1", "sk": f"POST#{n:03}"} for n in range(150)]
+    keys.append({"pk": "THREAD#t1", "sk": "THREAD"})
+    keys.append({"pk": "THREAD#missing", "sk": "THREAD"})
+    connection = ForumDatabase._get_connection()
+
+    with mock.patch.object(connection, "batch_get_item", wraps=connection.batch_get_item) as batch_get_item:
+        items = list(ForumDatabase.batch_get(keys))
+
+    assert batch_get_item.call_count == 2
+    assert sorted(type(item).__name__ for item in items) == ["Post"] * 150 + ["Thread"]
+
+
+def test_batch_get_retries_unprocessed_keys(create_table):
+    create_table(ForumDatabase)
+    Thread(pk="t1").save()
+    Thread(pk="t2").save()
+    connection = ForumDatabase._get_connection()
+    batch_get_item = connection.batch_get_item
+    calls = []
+
+    def throttled(keys, **kwargs):
+        calls.append(keys)
+        if len(calls) == 1:
+            data = batch_get_item(keys[:1], **kwargs)
+            data["UnprocessedKeys"] = {ForumDatabase.table_name: {"Keys": keys[1:]}}
+            return data
+        return batch_get_item(keys, **kwargs)
+
+    keys = [{"pk": "THREAD#t1", "sk": "THREAD"}, {"pk": "THREAD#t2", "sk": "THREAD"}]
+    with mock.patch.object(connection, "batch_get_item", side_effect=throttled):
+        threads = list(ForumDatabase.batch_get(keys))
+
+    assert sorted(thread.pk for thread in threads) == ["t1", "t2"]
+    assert calls[1] == keys[1:]
+
+
+def test_batch_write_mixed_models_with_unprocessed_items(create_table):
+    create_table(ForumDatabase)
+    Thread(pk="old").save()
+    connection = ForumDatabase._get_connection()
+    batch_write_item = connection.batch_write_item
+    calls = []
+
+    def throttled(put_items, delete_items):
+        calls.append(len(put_items) + len(delete_items))
+        if len(calls) == 2:
+            batch_write_item(put_items=put_items[:5], delete_items=delete_items)
+            unprocessed = [{"PutRequest": {"Item": item}} for item in put_items[5:]]
+            return {"UnprocessedItems": {ForumDatabase.table_name: unprocessed}}
+        return batch_write_item(put_items=put_items, delete_items=delete_items)
+
+    for workers in (None, 4):
+        calls.clear()
+        with mock.patch.object(connection, "batch_write_item", side_effect=throttled):
+            with ForumDatabase.batch_write(workers=workers) as batch:
+                batch.save(Thread(pk=f"t{workers}"))
+                for n in range(60):
+                    batch.save(Post(pk=f"t{workers}", sk=f"{n:02}"))
+                batch.delete(Thread(pk="old"))
+
+        assert sorted(calls, reverse=True) == [25, 25, 20, 12]
+        assert len(list(ForumDatabase.query(f"THREAD#t{workers}"))) == 61
+    assert list(ForumDatabase.query("THREAD#old")) == []
+
+
+def test_batch_write_rejects_invalid_items(create_table):
+    create_table(ForumDatabase)
+    Thread(pk="t1", subject="Subject").save()
+    partial = Thread.get("t1", attributes_to_get=["pk", "sk", "type"])
+
+    with pytest.raises(ValueError):
+        with ForumDatabase.batch_write() as batch:
+            batch.save(partial)
+    assert Thread.get("t1").subject == "Subject"
+
+    with pytest.raises(ValueError):
+        with ForumDatabase.batch_write(auto_commit=False) as batch:
+            for n in range(26):
+                batch.save(Post(pk="t1", sk=str(n)))
+
+
+def test_transaction_is_atomic(create_table):
+    create_table(ForumDatabase)
+    Author(pk="a1").save()
+
+    with pytest.raises(TransactWriteError):
+        with ForumDatabase.transaction() as transaction:
+            transaction.save(Thread(pk="t1"))
+            transaction.save(Post(pk="t1", sk="1"))
+            transaction.condition_check(Author, "a1", condition=Author.name.exists())
+    assert list(ForumDatabase.query("THREAD#t1")) == []
+
+    with ForumDatabase.transaction() as transaction:
+        transaction.save(Thread(pk="t1"))
+        transaction.save(Post(pk="t1", sk="1"))
+        transaction.update(Author(pk="a1"), actions=[Author.name.set("Name")])
+    assert [type(item) for item in ForumDatabase.query("THREAD#t1")] == [Post, Thread]
+    assert Author.get("a1").name == "Name"
+
+
+def test_transaction_split_into_requests(create_table):
+    create_table(ForumDatabase)
+
+    with mock.patch.object(
+        Connection, "transact_write_items", autospec=True, side_effect=Connection.transact_write_items
+    ) as transact_write_items:
+        with ForumDatabase.transaction(max_items=2) as transaction:
+            for n in range(5):
+                transaction.save(Post(pk="t1", sk=str(n)))
+
+    assert transact_write_items.call_count == 3
+    assert len(list(ForumDatabase.query("THREAD#t1"))) == 5
+
+
+def test_transact_get_returns_instances_of_registered_models(create_table):
+    create_table(ForumDatabase)
+    Thread(pk="t1", subject="Subject").save()
+    Author(pk="a1").save()
+
+    with ForumDatabase.transact_get() as transaction:
+        thread = transaction.get(Thread, "t1")
+        author = transaction.get(Author, "a1")
+        post = transaction.get(Post, "t1", "missing")
+
+    assert thread.get().subject == "Subject"
+    assert isinstance(author.get(), Author)
+    with pytest.raises(Post.DoesNotExist):
+        post.get()
+
+
+@pytest.fixture
+def scanned(create_table):
+    create_table(ForumDatabase)
+    with ForumDatabase.batch_write() as batch:
+        for n in range(40):
+            batch.save(Thread(pk=f"t{n}"))
+            batch.save(Post(pk=f"t{n}", sk="1"))
+            batch.save(Author(pk=f"a{n}"))
+
+
+def test_scan_all_segments(scanned):
+    items = list(ForumDatabase.scan(total_segments=4, workers=2, page_size=7))
+
+    assert sorted(type(item).__name__ for item in items) == ["Author"] * 40 + ["Post"] * 40 + ["Thread"] * 40
+
+
+def test_scan_types(scanned):
+    items = list(ForumDatabase.scan(total_segments=4, types=[Thread, "ForumPost"]))
+    assert sorted(type(item).__name__ for item in items) == ["Post"] * 40 + ["Thread"] * 40
+
+
+def test_scan_resumes_from_checkpoint(scanned):
+    scan = ForumDatabase.scan(page_size=10)
+    first = []
+    for item in scan:
+        first.append(item)
+        if len(first) == 15:
+            break
+
+    # Only the first page was consumed completely.
+    rest = list(ForumDatabase.scan(page_size=10, last_evaluated_keys=scan.last_evaluated_keys))
+    assert len(rest) == 110
+    assert {item._get_serialized_keys() for item in first[:10] + rest} == {
+        item._get_serialized_keys() for item in ForumDatabase.scan()
+    }
+
+
+def test_custom_type_attribute(create_table):
+    create_table(CatalogDatabase)
+    Product(pk="p1", title="Title").save()
+
+    product, = CatalogDatabase.query("p1", attributes_to_get=["pk", "title"])
+    assert isinstance(product, Product)
+    assert product.title == "Title"
+
+    product, = CatalogDatabase.scan(types=[Product])
+    assert product.pk == "p1"
+    assert [product.pk for product in CatalogDatabase.batch_get([{"pk": "p1", "sk": "PRODUCT"}])] == ["p1"]
+
+
+def test_transaction_cancellation_reasons():
+    error = TransactWriteError("Failed", cause=mock.Mock(response={
+        "Error": {"Code": "TransactionCanceledException", "Message": "Cancelled [None, ConditionalCheckFailed]"},
+    }))
+    assert get_cancellation_reasons(error) == [None, "ConditionalCheckFailed"]
+
+    error.cause.response["CancellationReasons"] = [{"Code": "ConditionalCheckFailed"}, {"Code": "None"}]
+    assert get_cancellation_reasons(error) == ["ConditionalCheckFailed", None]
+    assert get_cancellation_reasons(TransactWriteError("Failed")) == []
@@ -0,0 +1,258 @@
+"""Tests of `Model` operations against mocked DynamoDB."""
+from unittest import mock
+
+import pytest
+from pynamodb.connection import Connection
+from pynamodb.exceptions import TransactWriteError
+
+from pynamodb_relations import attributes
+from pynamodb_relations.forward_related import ForwardManyToOneDescriptor
+from pynamodb_relations.models import Model
+from pynamodb_relations.reverse_related import PrimaryKeyReverseForeignKeyRelation
+from pynamodb_relations.scan import ParallelScan
+from tests.models import Author, ForumDatabase, Post, Thread
+
+
+class Tag(Model):
+    class Meta:
+        name = "ForumTag"
+        database = ForumDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("TAG#", hash_key=True)
+    sk = attributes.StaticUnicodeAttribute("TAG", range_key=True)
+    label = attributes.UnicodeAttribute(null=True)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.slug = (self.label or "").lower()
+
+
+class Topic(Model):
+    class Meta:
+        name = "ForumTopic"
+        database = ForumDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("TOPIC#", hash_key=True)
+    sk = attributes.StaticUnicodeAttribute("TOPIC", range_key=True)
+    reply_count = attributes.NumberAttribute(default=0)
+    replies = PrimaryKeyReverseForeignKeyRelation("ForumReply", counter="reply_count")
+
+
+class Reply(Model):
+    class Meta:
+        name = "ForumReply"
+        database = ForumDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("TOPIC#", hash_key=True)
+    sk = attributes.PrefixedUnicodeAttribute("REPLY#", range_key=True)
+    body = attributes.UnicodeAttribute(null=True)
+
+
+@pytest.fixture
+def forum(create_table):
+    create_table(ForumDatabase)
+    with ForumDatabase.batch_write() as batch:
+        for n in range(20):
+            batch.save(Thread(pk=f"t{n}", subject=f"Subject {n}"))
+            batch.save(Post(pk=f"t{n}", sk="1", body=f"Body {n}"))
+            batch.save(Author(pk=f"a{n}"))
+
+
+def test_scan_returns_only_items_of_model(forum):
+    threads = list(Thread.scan())
+    assert sorted(thread.pk for thread in threads) == sorted(f"t{n}" for n in range(20))
+    assert all(type(thread) is Thread for thread in threads)
+
+    threads = list(Thread.scan(Thread.subject == "Subject 3"))
+    assert [thread.pk for thread in threads] == ["t3"]
+    assert len(list(Post.scan(limit=5, page_size=3))) == 5
+
+
+def test_scan_segments(forum):
+    pks = []
+    for segment in range(3):
+        pks.extend(post.pk for post in Post.scan(segment=segment, total_segments=3))
+    assert sorted(pks) == sorted(f"t{n}" for n in range(20))
+
+
+def test_scan_with_workers_and_prefetch(forum):
+    scan = Post.scan(total_segments=4, workers=2, page_size=3)
+    assert isinstance(scan, ParallelScan)
+    assert sorted(post.body for post in scan) == sorted(f"Body {n}" for n in range(20))
+
+    posts = list(Post.scan(prefetch_pages=2, page_size=3, limit=7))
+    assert len(posts) == 7
+    assert all(type(post) is Post for post in posts)
+
+    with pytest.raises(ValueError):
+        Post.scan(workers=2)
+
+
+def test_scan_rate_limit_divided_between_scanned_segments():
+    assert ParallelScan(None, 8, rate_limit=16).rate_limit == 2
+    assert ParallelScan(None, 8, segments=[1, 2], rate_limit=16).rate_limit == 8
+    assert ParallelScan(None, 8, segments=[], rate_limit=16).rate_limit is None
+
+
+def test_serialize_uses_dynamo_names_and_key_roles():
+    post = Post(pk="t1", sk="1", body="Body", author=Author(pk="a1"))
+
+    assert post._serialize() == {
+        "HASH": "THREAD#t1",
+        "RANGE": "POST#1",
+        "attributes": {
+            "body": {"S": "Body"},
+            "author": {"S": "AUTHOR#a1"},
+            "type": {"S": "ForumPost"},
+        },
+    }
+    assert post._serialize(attr_map=True)["attributes"]["pk"] == {"S": "THREAD#t1"}
+    with pytest.raises(ValueError):
+        Post(pk="t1")._serialize()
+
+
+def test_save_does_not_resolve_foreign_keys(create_table):
+    create_table(ForumDatabase)
+    Post(pk="t1", sk="1", author=Author(pk="a1")).save()
+    post = Post.get("t1", "1")
+
+    with mock.patch.object(ForwardManyToOneDescriptor, "get", side_effect=AssertionError("resolved")):
+        post.body = "Edited"
+        post.save()
+
+    assert Post.get("t1", "1").attribute_values["author"].value == "a1"
+
+
+def test_from_raw_data():
+    post = Post.from_raw_data({
+        "pk": {"S": "THREAD#t1"},
+        "sk": {"S": "POST#1"},
+        "author": {"S": "AUTHOR#a1"},
+        "type": {"S": "ForumPost"},
+        "unknown": {"S": "ignored"},
+    })
+
+    assert (post.pk, post.sk, post.body) == ("t1", "1", None)
+    assert post.attribute_values["author"].value == "a1"
+    assert post._get_serialized_keys() == ("THREAD#t1", "POST#1")
+    assert not post._partial
+    with pytest.raises(ValueError):
+        Post.from_raw_data(None)
+
+
+def test_from_raw_data_calls_overridden_init():
+    tag = Tag.from_raw_data({"pk": {"S": "TAG#t1"}, "label": {"S": "Python"}, "type": {"S": "ForumTag"}})
+
+    assert (tag.pk, tag.sk, tag.label, tag.slug) == ("t1", "TAG", "Python", "python")
+
+
+def test_from_raw_many_maps_items_to_their_models():
+    items = ForumDatabase.from_raw_many([
+        {"pk": {"S": "THREAD#t1"}, "sk": {"S": "THREAD"}, "type": {"S": "ForumThread"}},
+        {"pk": {"S": "TAG#t1"}, "sk": {"S": "TAG"}, "type": {"S": "ForumTag"}},
+        {"pk": {"S": "THREAD#t1"}, "sk": {"S": "POST#1"}, "type": {"S": "ForumPost"}},
+    ])
+
+    assert [type(item) for item in items] == [Thread, Tag, Post]
+    assert [item.pk for item in items] == ["t1", "t1", "t1"]
+
+
+def test_query_partial_and_full_reads(forum):
+    post, = Post.query("t3", Post.sk == "1", attributes_to_get=Post._get_projection(["body"]))
+    assert post._partial
+    assert (post.pk, post.sk, post.body) == ("t3", "1", "Body 3")
+    with pytest.raises(ValueError):
+        post.save()
+
+    post.refresh()
+    assert not post._partial
+    post.save()
+
+    post, = Post.query("t3", Post.sk == "1")
+    assert not post._partial
+    assert type(post) is Post
+
+
+def transact_write_calls():
+    return mock.patch.object(
+        Connection, "transact_write_items", autospec=True, side_effect=Connection.transact_write_items
+    )
+
+
+@pytest.fixture
+def topic(create_table):
+    create_table(ForumDatabase)
+    topic = Topic(pk="t1")
+    topic.save()
+    return topic
+
+
+def test_counter_incremented_only_for_new_items(topic):
+    reply = Reply(pk="t1", sk="1", body="Body")
+    with transact_write_calls() as transact_write_items:
+        response = reply.save()
+        reply.body = "Edited"
+        reply.save()
+        loaded = Reply.get("t1", "1")
+        loaded.save()
+
+    assert transact_write_items.call_count == 1
+    assert isinstance(response, dict)
+    assert Topic.get("t1").reply_count == 1
+
+    # Instance which was not loaded falls back to plain save when the item exists.
+    Reply(pk="t1", sk="1", body="Again").save()
+    assert Topic.get("t1").reply_count == 1
+    assert Reply.get("t1", "1").body == "Again"
+
+
+def test_counter_decremented_on_delete(topic):
+    Reply(pk="t1", sk="1").save()
+    Reply(pk="t1", sk="2").save()
+
+    Reply(pk="t1", sk="1").delete()
+    Reply(pk="t1", sk="1").delete()
+    assert Topic.get("t1").reply_count == 1
+    assert Topic.get("t1").replies.count() == 1
+
+
+def test_counter_without_cancellation_reasons(topic):
+    # Pynamodb does not keep cancellation reasons of DynamoDB responses, the item is read instead.
+    with mock.patch("pynamodb_relations.models.get_cancellation_reasons", return_value=[]):
+        Reply(pk="t1", sk="1").save()
+        Reply(pk="t1", sk="1", body="Again").save()
+        assert Reply.get("t1", "1").body == "Again"
+        assert Topic.get("t1").reply_count == 1
+
+        Reply(pk="t1", sk="2").delete()
+        Reply(pk="t1", sk="1").delete()
+        Reply(pk="t1", sk="1").delete()
+        assert Topic.get("t1").reply_count == 0
+
+        with pytest.raises(TransactWriteError):
+            Reply(pk="missing", sk="1").save()
+
+
+def test_counted_save_of_missing_parent_fails(topic):
+    with pytest.raises(TransactWriteError):
+        Reply(pk="missing", sk="1").save()
+    assert list(Reply.query("missing")) == []
+
+
+def test_counter_drift_reconciled(topic):
+    with ForumDatabase.batch_write() as batch:
+        for n in range(3):
+            batch.save(Reply(pk="t1", sk=str(n)))
+    Reply(pk="t1", sk="3").save()
+
+    assert Topic.get("t1").replies.count() == 1
+    assert Topic.get("t1").replies.reconcile_counter() == 4
+    assert Topic.get("t1").replies.count() == 4
+
+
+def test_counter_requires_static_parent_range_key():
+    relation = PrimaryKeyReverseForeignKeyRelation("ForumReply", counter="reply_count")
+    relation.contribute_to_class(Topic)
+
+    with pytest.raises(ValueError):
+        relation.contribute_to_class(Post)
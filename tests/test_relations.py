@@ -0,0 +1,418 @@
+"""Tests of forward and reverse relations."""
+import gc
+from unittest import mock
+
+import pytest
+
+from pynamodb.connection import TableConnection
+from pynamodb.indexes import AllProjection, GlobalSecondaryIndex
+
+from pynamodb_relations import attributes
+from pynamodb_relations.database import BaseDatabase
+from pynamodb_relations.forward_related import ForeignKeyAttribute, ForwardManyToOneDescriptor, prefetch_related
+from pynamodb_relations.models import Model
+from pynamodb_relations.reverse_related import PrimaryKeyReverseForeignKeyRelation, get_relation_plan
+from tests.models import Author, Board, ForumDatabase, Post, Thread
+
+
+class LabelIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "label"
+        projection = AllProjection()
+
+    label = attributes.UnicodeAttribute(hash_key=True)
+    sk = attributes.PrefixedUnicodeAttribute("NOTE#", range_key=True)
+
+
+class Label(Model):
+    class Meta:
+        name = "ForumLabel"
+        database = ForumDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("LABEL#", hash_key=True)
+    sk = attributes.StaticUnicodeAttribute("LABEL", range_key=True)
+    # Label item itself is in the index too, its range key does not match guessed condition of notes.
+    name = attributes.UnicodeAttribute(attr_name="label", null=True)
+    by_label = LabelIndex()
+    notes = PrimaryKeyReverseForeignKeyRelation("ForumNote", index="label")
+
+
+class Note(Model):
+    class Meta:
+        name = "ForumNote"
+        database = ForumDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("THREAD#", hash_key=True)
+    sk = attributes.PrefixedUnicodeAttribute("NOTE#", range_key=True)
+    label = attributes.UnicodeAttribute(null=True)
+    text = attributes.UnicodeAttribute(null=True)
+    by_label = LabelIndex()
+
+
+class DirectoryDatabase(BaseDatabase):
+    table_name = "directory"
+    region = "us-east-1"
+    billing_mode = "PAY_PER_REQUEST"
+
+
+class Person(Model):
+    class Meta:
+        name = "DirectoryPerson"
+        database = DirectoryDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("PERSON#", hash_key=True)
+    sk = attributes.StaticUnicodeAttribute("PERSON", range_key=True)
+
+    @classmethod
+    def get_by_pk(cls, pk):
+        return cls.get(pk)
+
+
+class Comment(Model):
+    class Meta:
+        name = "ForumComment"
+        database = ForumDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("THREAD#", hash_key=True)
+    sk = attributes.PrefixedUnicodeAttribute("COMMENT#", range_key=True)
+    author = ForeignKeyAttribute("ForumAuthor", attribute="pk", related_reference="weak", null=True)
+    reviewer = ForeignKeyAttribute("ForumAuthor", attribute="pk", related_reference="none", null=True)
+    # Related model of other database.
+    person = ForeignKeyAttribute(Person, attribute="pk", null=True)
+
+
+@pytest.fixture
+def forum(create_table):
+    create_table(ForumDatabase)
+    for n in range(3):
+        Author(pk=f"a{n}", name=f"Author {n}").save()
+    thread = Thread(pk="t1")
+    thread.save()
+    for n in range(30):
+        Post(pk="t1", sk=f"{n:02}", author=Author(pk=f"a{n % 3}")).save()
+    return thread
+
+
+def test_foreign_key_round_trip(forum):
+    post = Post.get("t1", "00")
+
+    assert post.attribute_values["author"].value == "a0"
+    post.save()
+    assert Post.get("t1", "00").author.name == "Author 0"
+
+
+def test_prefetch_related_uses_one_batch_get(forum):
+    posts = list(forum.posts.query())
+    connection = ForumDatabase._get_connection()
+
+    with mock.patch.object(connection, "batch_get_item", wraps=connection.batch_get_item) as batch_get_item, \
+            mock.patch.object(Author, "get", side_effect=AssertionError("N+1 get")):
+        prefetch_related(posts, "author")
+        names = [post.author.name for post in posts]
+
+    assert batch_get_item.call_count == 1
+    assert len(batch_get_item.call_args[0][0]) == 3
+    assert names == [f"Author {n % 3}" for n in range(30)]
+    assert posts[0].author is posts[3].author
+
+
+def test_prefetch_related_keeps_weak_and_none_references(forum):
+    for n in range(5):
+        Comment(pk="t1", sk=str(n), author=Author(pk=f"a{n % 3}"), reviewer=Author(pk="a0")).save()
+    comments = list(Comment.query("t1", Comment.sk.startswith("")))
+
+    prefetch_related(comments, "author", "reviewer")
+    gc.collect()
+    with mock.patch.object(Author, "get", side_effect=AssertionError("get")):
+        assert [comment.author.pk for comment in comments] == ["a0", "a1", "a2", "a0", "a1"]
+        assert {comment.reviewer.pk for comment in comments} == {"a0"}
+
+
+def test_prefetch_related_reads_database_of_related_model_and_memoizes_misses(forum, create_table):
+    create_table(DirectoryDatabase)
+    Person(pk="p1").save()
+    Comment(pk="t1", sk="1", author=Author(pk="a0"), person="p1").save()
+    Comment(pk="t1", sk="2", author=Author(pk="missing"), person="missing").save()
+    comments = list(Comment.query("t1", Comment.sk.startswith("")))
+
+    prefetch_related(comments, "author", "person")
+    with mock.patch.object(Author, "get", side_effect=AssertionError("get")), \
+            mock.patch.object(Person, "get", side_effect=AssertionError("get")):
+        assert (comments[0].author.pk, comments[0].person.pk) == ("a0", "p1")
+        assert (comments[1].author, comments[1].person) == (None, None)
+
+
+def test_prefetch_related_rejects_other_attributes(forum):
+    with pytest.raises(ValueError):
+        prefetch_related([Post(pk="t1", sk="x")], "body")
+
+
+def test_session_loads_each_item_once(forum):
+    connection = Author._get_connection()
+    posts = list(forum.posts.query())
+
+    with mock.patch.object(connection, "get_item", wraps=connection.get_item) as get_item:
+        with ForumDatabase.session():
+            authors = [post.author for post in posts]
+            author = Author.get("a0")
+            assert get_item.call_count == 3
+            assert author is authors[0] is authors[3]
+
+            # Consistent read always fetches the item again.
+            assert Author.get("a0", consistent_read=True) is not author
+            assert get_item.call_count == 4
+
+        assert Author.get("a0") is not author
+        assert get_item.call_count == 5
+
+
+def test_session_keeps_partial_instances_out(forum):
+    with ForumDatabase.session():
+        partial = Author.get("a0", attributes_to_get=["pk", "sk", "type"])
+        author = Author.get("a0")
+
+    assert partial._partial
+    assert author is not partial and author.name == "Author 0"
+
+
+def test_session_with_resolver_returning_none(forum):
+    post = Post(pk="t1", sk="missing-editor", editor=Author(pk="missing"))
+    post.save()
+    post = Post.get("t1", "missing-editor")
+
+    with ForumDatabase.session():
+        assert post.editor is None
+
+
+@pytest.mark.parametrize("related_reference, calls", [("strong", 1), ("weak", 1), ("none", 2)])
+def test_related_reference(related_reference, calls):
+    attribute = ForeignKeyAttribute(Author, attribute="pk", related_reference=related_reference)
+    author = Author(pk="a1")
+    attribute._resolver = resolver = mock.Mock(return_value=author)
+    descriptor = attribute.deserialize("AUTHOR#a1")
+
+    assert descriptor.get() is author
+    assert descriptor.get() is author
+    assert resolver.call_count == calls
+    assert resolver.call_args == mock.call("a1")
+
+
+def test_weak_reference_resolves_again_when_collected():
+    attribute = ForeignKeyAttribute(Author, attribute="pk", related_reference="weak")
+    attribute._resolver = resolver = mock.Mock(side_effect=lambda pk: Author(pk=pk))
+    descriptor = attribute.deserialize("AUTHOR#a1")
+
+    descriptor.get()
+    gc.collect()
+    assert not descriptor._resolved
+    assert descriptor.get().pk == "a1"
+    assert resolver.call_count == 2
+
+
+def test_missing_related_item_is_memoized():
+    attribute = ForeignKeyAttribute(Author, attribute="pk", get_method="get_or_none_by_pk")
+    attribute._resolver = resolver = mock.Mock(return_value=None)
+    descriptor = attribute.deserialize("AUTHOR#a1")
+
+    assert descriptor.get() is None
+    assert descriptor.get() is None
+    assert descriptor._resolved
+    assert resolver.call_count == 1
+
+
+def test_descriptor_method_argument_is_deprecated():
+    attribute = ForeignKeyAttribute(Author, attribute="pk")
+    author = Author(pk="a1")
+
+    with pytest.warns(DeprecationWarning):
+        descriptor = ForwardManyToOneDescriptor(lambda pk: author, "a1", attribute)
+    assert descriptor.get() is author
+
+
+def query_calls():
+    return mock.patch.object(TableConnection, "query", autospec=True, side_effect=TableConnection.query)
+
+
+def put_raw_item(hash_key, range_key, entity):
+    # Written by another process, write generations of this process are unchanged.
+    ForumDatabase._get_connection().put_item(hash_key, range_key, attributes={"type": {"S": entity}})
+
+
+def test_count_is_read_unless_prefetched(forum):
+    posts = forum.posts
+    assert posts.count() == 30
+    put_raw_item("THREAD#t1", "POST#30", "ForumPost")
+    assert posts.count() == 31
+
+    with query_calls() as query:
+        assert posts.prefetch() is posts
+        put_raw_item("THREAD#t1", "POST#31", "ForumPost")
+        assert posts.count() == 31
+        assert len(posts.all()) == 31
+    assert query.call_count == 1
+
+    Post(pk="t1", sk="32").save()
+    assert posts.count() == 33
+
+
+def test_batch_and_transaction_writes_invalidate_memoized_relations(forum):
+    posts = forum.posts
+    assert len(posts.all()) == 30
+
+    post = Post(pk="t1", sk="30")
+    with ForumDatabase.batch_write() as batch:
+        batch.save(post)
+        batch.delete(Post(pk="t1", sk="00"))
+    assert post._persisted
+    assert len(posts.all()) == 30
+    assert posts.all()[0].sk == "01"
+
+    post = Post(pk="t1", sk="31")
+    with ForumDatabase.transaction() as transaction:
+        transaction.save(post)
+        transaction.save(Post(pk="t1", sk="32"))
+    assert post._persisted
+    assert len(posts.all()) == 32 == posts.count()
+
+    with ForumDatabase.transaction() as transaction:
+        transaction.update_by_key(Post, "t1", "31", actions=[Post.body.set("Body")])
+    assert posts.all()[-2].body == "Body"
+
+
+def test_many_to_many_all_is_read_unless_prefetched(forum):
+    Board(pk="b1").save()
+    board = Board.get("b1")
+    board.moderators.add("a0")
+    put_raw_item("BOARD#b1", "AUTHOR#a1", "ForumModeration")
+    assert [author.pk for author in board.moderators.all()] == ["a0", "a1"]
+    assert board.moderators.count() == 2
+
+    with query_calls() as query:
+        board.moderators.prefetch()
+        put_raw_item("BOARD#b1", "AUTHOR#a2", "ForumModeration")
+        assert [author.pk for author in board.moderators.all()] == ["a0", "a1"]
+        assert board.moderators.keys() == ["a0", "a1"]
+        assert board.moderators.count() == 2
+    assert query.call_count == 1
+
+    board.moderators.remove("a0")
+    assert [author.pk for author in board.moderators.all()] == ["a1", "a2"]
+
+
+def test_relation_plan_is_built_once_when_related_model_is_registered():
+    plan = Thread.posts._plan
+    assert plan is Thread.posts.get_plan() is get_relation_plan(Post)
+    assert (plan.related, plan.model, plan.range_key_attribute) == (Post, Post, Post.sk)
+    assert plan.range_key_condition.serialize({}, {}) == "begins_with (#0, :0)"
+    assert str(plan.range_key_condition) == "begins_with (sk, {'S': 'POST#'})"
+    assert str(get_relation_plan(Author).range_key_condition) == "sk = {'S': 'AUTHOR'}"
+
+    plan = Label.notes._plan
+    assert plan is get_relation_plan(plan.related)
+    assert plan.related.Meta.index_name == "label"
+    assert plan.model is Note
+    assert str(plan.range_key_condition) == "begins_with (sk, {'S': 'NOTE#'})"
+    assert Label.notes.hash_key_name == "name"
+
+
+@pytest.fixture
+def labels(create_table):
+    create_table(ForumDatabase)
+    with ForumDatabase.batch_write() as batch:
+        for label in ("python", "go"):
+            batch.save(Label(pk=label, name=label))
+        for n in range(6):
+            batch.save(Note(pk=f"t{n % 2}", sk=f"{n}", label="python" if n < 4 else "go", text=f"Text {n}"))
+    return Label.get("python")
+
+
+def test_index_relation_queries_index(labels):
+    notes = labels.notes
+    assert notes.hash_key == "python"
+    assert sorted(note.text for note in notes.query()) == [f"Text {n}" for n in range(4)]
+    assert all(type(note) is Note for note in notes.all())
+    assert notes.count() == 4
+    assert notes.filter(filter_condition=Note.pk == "t1").count() == 2
+    assert notes.only("text").all()[0]._partial
+
+
+def test_index_relation_reads_only_the_plan(labels):
+    labels.notes
+
+    with mock.patch("pynamodb_relations.reverse_related._range_key_attribute", side_effect=AssertionError), \
+            mock.patch.object(Note, "_range_key_attribute", side_effect=AssertionError), \
+            mock.patch("pynamodb_relations.reverse_related._get_index", side_effect=AssertionError):
+        assert Label.get("go").notes.count() == 2
+        assert len(list(labels.notes.query())) == 4
+
+
+@pytest.fixture
+def boards(forum):
+    with ForumDatabase.batch_write() as batch:
+        for n in range(3):
+            batch.save(Board(pk=f"b{n}"))
+    return Board.get("b0")
+
+
+def written_edges(calls):
+    # Range keys of put and deleted edges in order of batch writes.
+    puts, deletes = [], []
+    for call in calls.call_args_list:
+        puts.extend(item["sk"]["S"] for item in call.kwargs["put_items"])
+        deletes.extend(key["sk"] for key in call.kwargs["delete_items"])
+    return puts, deletes
+
+
+def test_many_to_many_writes_only_differences(boards):
+    moderators = boards.moderators
+    connection = ForumDatabase._get_connection()
+
+    with mock.patch.object(connection, "batch_write_item", wraps=connection.batch_write_item) as batch_write:
+        moderators.set(["a0", "a1"])
+        assert written_edges(batch_write) == (["AUTHOR#a0", "AUTHOR#a1"], [])
+
+        batch_write.reset_mock()
+        moderators.set([Author.get("a1"), "a2", "a2"])
+        assert written_edges(batch_write) == (["AUTHOR#a2"], ["AUTHOR#a0"])
+
+        batch_write.reset_mock()
+        moderators.set(["a2", "a1"])
+        moderators.add()
+        moderators.remove()
+        assert batch_write.call_count == 0
+
+        moderators.add(Author.get("a0"))
+        moderators.remove("a2", "missing")
+        assert written_edges(batch_write) == (["AUTHOR#a0"], ["AUTHOR#a2", "AUTHOR#missing"])
+
+    assert moderators.keys() == ["a0", "a1"]
+    moderators.clear()
+    assert moderators.count() == 0
+
+
+def test_many_to_many_inverse_side_reads_index(boards):
+    boards.moderators.set(["a0", "a1"])
+    Board(pk="b1").moderators.add("a1")
+    author = Author.get("a1")
+
+    assert author.boards.keys() == ["b0", "b1"]
+    assert [board.pk for board in author.boards.all()] == ["b0", "b1"]
+    assert author.boards.count() == 2
+    assert Author.get("a2").boards.all() == []
+
+    # Edges changed through the inverse side are seen by the other side.
+    author.boards.remove("b0")
+    assert boards.moderators.keys() == ["a0"]
+    author.boards.set(["b2"])
+    assert [board.pk for board in Board.get("b2").moderators.all()] == ["a1"]
+
+
+def test_many_to_many_keeps_partial_items_out_of_session(boards):
+    boards.moderators.set(["a0"])
+
+    with ForumDatabase.session():
+        partial, = boards.moderators.fetch(attributes_to_get=["pk", "sk", "type"])
+        author, = boards.moderators.fetch()
+        assert partial._partial
+        assert not author._partial
+        assert Author.get("a0") is author
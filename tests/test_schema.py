@@ -0,0 +1,151 @@
+"""Tests of table schema planning and `BaseDatabase.create_table`."""
+import pytest
+from pynamodb.indexes import AllProjection, GlobalSecondaryIndex, LocalSecondaryIndex
+
+from pynamodb_relations import attributes
+from pynamodb_relations.database import BaseDatabase
+from pynamodb_relations.many_related import ManyToManyRelation
+from pynamodb_relations.models import Model
+from pynamodb_relations.reverse_related import PrimaryKeyReverseForeignKeyRelation
+
+
+class SchemaDatabase(BaseDatabase):
+    table_name = "schema-test"
+    region = "us-east-1"
+    billing_mode = "PAY_PER_REQUEST"
+
+
+class ProvisionedDatabase(BaseDatabase):
+    table_name = "provisioned-test"
+    region = "us-east-1"
+    billing_mode = "PROVISIONED"
+
+
+class InvertedIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "inverted"
+        projection = AllProjection()
+
+    sk = attributes.PrefixedUnicodeAttribute("USER#", hash_key=True)
+    pk = attributes.PrefixedUnicodeAttribute("GROUP#", range_key=True)
+
+
+class AuthorIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "gsi1"
+        projection = AllProjection()
+        narrow_projection = True
+
+    gsi1pk = attributes.UnicodeAttribute(hash_key=True)
+    gsi1sk = attributes.PrefixedUnicodeAttribute("CREATED#", range_key=True)
+
+
+class CreatedIndex(LocalSecondaryIndex):
+    class Meta:
+        index_name = "lsi1"
+        projection = AllProjection()
+
+    pk = attributes.UnicodeAttribute(hash_key=True)
+    created = attributes.UnicodeAttribute(range_key=True)
+
+
+class Group(Model):
+    class Meta:
+        name = "Group"
+        database = SchemaDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("GROUP#", hash_key=True)
+    sk = attributes.StaticUnicodeAttribute("GROUP", range_key=True)
+    members = ManyToManyRelation("User", through="Membership")
+
+
+class User(Model):
+    class Meta:
+        name = "User"
+        database = SchemaDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("USER#", hash_key=True)
+    sk = attributes.StaticUnicodeAttribute("USER", range_key=True)
+    gsi1pk = attributes.UnicodeAttribute(null=True)
+    gsi1 = AuthorIndex()
+    groups = ManyToManyRelation("Group", through="Membership", index="inverted")
+    posts = PrimaryKeyReverseForeignKeyRelation("Post", index="gsi1", attributes=["title"])
+
+
+class Membership(Model):
+    class Meta:
+        name = "Membership"
+        database = SchemaDatabase
+
+    pk = attributes.PrefixedUnicodeAttribute("GROUP#", hash_key=True)
+    sk = attributes.PrefixedUnicodeAttribute("USER#", range_key=True)
+    inverted = InvertedIndex()
+
+
+class Post(Model):
+    class Meta:
+        name = "Post"
+        database = SchemaDatabase
+
+    pk = attributes.UnicodeAttribute(hash_key=True)
+    sk = attributes.StaticUnicodeAttribute("POST", range_key=True)
+    title = attributes.UnicodeAttribute()
+    body = attributes.UnicodeAttribute(null=True)
+    created = attributes.UnicodeAttribute(null=True)
+    gsi1pk = attributes.UnicodeAttribute()
+    gsi1sk = attributes.PrefixedUnicodeAttribute("CREATED#")
+    gsi1 = AuthorIndex()
+    lsi1 = CreatedIndex()
+
+
+def test_plan_table_schema():
+    schema = SchemaDatabase.get_table_schema()
+
+    assert schema.key_schema == (("pk", "HASH"), ("sk", "RANGE"))
+    assert schema.attribute_definitions == (
+        ("created", "S"), ("gsi1pk", "S"), ("gsi1sk", "S"), ("pk", "S"), ("sk", "S"),
+    )
+    gsi1, inverted = schema.global_secondary_indexes
+    # Declared by User and Post with narrow_projection, read only for title (and type) by User.posts.
+    assert (gsi1.name, gsi1.projection_type) == ("gsi1", "INCLUDE")
+    assert gsi1.non_key_attributes == ("title", "type")
+    # Edges are read only for keys but declared projection is kept.
+    assert (inverted.name, inverted.projection_type) == ("inverted", "ALL")
+    lsi1, = schema.local_secondary_indexes
+    assert lsi1.projection_type == "ALL"
+
+    declared = SchemaDatabase.get_table_schema(plan_projections=False)
+    assert {index.projection_type for index in declared.global_secondary_indexes} == {"ALL"}
+
+
+def test_create_table(create_table):
+    create_table(SchemaDatabase)
+    assert SchemaDatabase.exists()
+    description = SchemaDatabase._get_connection().describe_table()
+    projections = {
+        index["IndexName"]: index["Projection"]["ProjectionType"]
+        for index in description["GlobalSecondaryIndexes"] + description["LocalSecondaryIndexes"]
+    }
+    assert projections == {"gsi1": "INCLUDE", "inverted": "ALL", "lsi1": "ALL"}
+
+    group = Group(pk="g1")
+    group.save()
+    user = User(pk="u1")
+    user.save()
+    group.members.add(user)
+    assert [group.pk for group in user.groups.all()] == ["g1"]
+
+    user.gsi1pk = "u1"
+    Post(pk="p1", title="Title", body="Body", gsi1pk="u1", gsi1sk="2020").save()
+    post, = user.posts.all()
+    assert (post.title, post.body) == ("Title", None)
+
+    SchemaDatabase.delete_table()
+    assert not SchemaDatabase.exists()
+
+
+def test_create_table_requires_capacity_of_provisioned_table():
+    with pytest.raises(ValueError):
+        ProvisionedDatabase.create_table()
+    with pytest.raises(ValueError):
+        SchemaDatabase.create_table(billing_mode="PROVISIONED", read_capacity_units=1)